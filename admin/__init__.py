@@ -1,7 +1,142 @@
-from flask import Blueprint
+import math
+
+from flask import Blueprint, Response, abort, jsonify, request, url_for
+
+from admin.auth import admin_required
+from config import get_settings
+from db import db
+from runtime import memtrace, profiler
+from services.templates_service import import_templates, parse_catalog, parse_flag
 
 bp = Blueprint("admin", __name__)
 
+# Bounds for one background sampling capture and its sampling interval
+MAX_PROFILE_SECONDS = 60.0
+MIN_PROFILE_INTERVAL = 0.001
+MAX_PROFILE_INTERVAL = 1.0
+
+# Largest catalog body /admin/templates/import will read
+MAX_IMPORT_BYTES = 5 * 1024 * 1024
+
+
 @bp.route("/")
 def index():
     return "Admin Portal placeholder"
+
+
+@bp.route("/profile")
+@admin_required
+def profile():
+    """Start sampling all threads for ``seconds`` (default 5) in the background.
+
+    Answers 202 at once with the capture name; the collapsed stacks are at
+    ``/admin/profiles/<name>`` when sampling is done (404 until then). 409
+    while another capture is still running.
+    """
+    try:
+        seconds = float(request.args.get("seconds", 5))
+        interval = float(request.args.get("interval", 0.005))
+    except ValueError:
+        abort(400)
+    if not (math.isfinite(seconds) and math.isfinite(interval)) or seconds <= 0 or interval <= 0:
+        abort(400)
+    seconds = min(seconds, MAX_PROFILE_SECONDS)
+    interval = min(max(interval, MIN_PROFILE_INTERVAL), MAX_PROFILE_INTERVAL)
+    name = profiler.start_capture(get_settings(), seconds, interval)
+    if name is None:
+        return jsonify({"error": "a capture is already running"}), 409
+    body = {"name": name, "seconds": seconds, "url": url_for("admin.profile_file", name=name)}
+    return jsonify(body), 202, {"X-FamilyHub-Profile": name}
+
+
+@bp.route("/memory")
+@admin_required
+def memory():
+    """tracemalloc report (top sites, growth between snapshots) and RSS history."""
+    report = memtrace.tracer_for(get_settings()).report(request.args.get("limit", type=int))
+    history = memtrace.rss_history()
+    report["rss_history"] = history.as_dict() if history is not None else None
+    return jsonify(report)
+
+
+@bp.post("/memory/start")
+@admin_required
+def memory_start():
+    memtrace.tracer_for(get_settings()).start()
+    return jsonify({"running": True})
+
+
+@bp.post("/memory/snapshot")
+@admin_required
+def memory_snapshot():
+    tracer = memtrace.tracer_for(get_settings())
+    if not tracer.running:
+        return jsonify({"error": "tracing not started"}), 409
+    return jsonify({"stored": tracer.snapshot()})
+
+
+@bp.route("/memory/snapshots")
+@admin_required
+def memory_snapshots():
+    return jsonify(memtrace.snapshot_store(get_settings()).list())
+
+
+@bp.route("/memory/snapshots/<name>")
+@admin_required
+def memory_snapshot_file(name):
+    """Download a stored heap snapshot (``tracemalloc.Snapshot.load()``)."""
+    try:
+        data = memtrace.snapshot_store(get_settings()).read(name)
+    except (OSError, ValueError):
+        abort(404)
+    return Response(data, mimetype="application/octet-stream")
+
+
+@bp.post("/memory/stop")
+@admin_required
+def memory_stop():
+    memtrace.tracer_for(get_settings()).stop()
+    return jsonify({"running": False})
+
+
+@bp.post("/templates/import")
+@admin_required
+def templates_import():
+    """Bulk-import a chore template catalog posted as CSV or JSON.
+
+    The format follows the ``Content-Type`` (``text/csv`` or
+    ``application/json``); ``?dry_run=1`` only reports the counts. Bodies
+    over ``MAX_IMPORT_BYTES`` get 413.
+    """
+    if (request.content_length or 0) > MAX_IMPORT_BYTES:
+        return jsonify({"error": f"catalog larger than {MAX_IMPORT_BYTES} bytes"}), 413
+    fmt = "json" if request.mimetype == "application/json" else "csv"
+    try:
+        dry_run = bool(parse_flag(request.args.get("dry_run"), "dry_run"))
+        rows = parse_catalog(request.get_data(as_text=True), fmt)
+        with db.engine.begin() as conn:
+            result = import_templates(conn, rows, dry_run=dry_run)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(result.as_dict())
+
+
+@bp.route("/profiles")
+@admin_required
+def profiles():
+    return jsonify(profiler.store_for(get_settings()).list())
+
+
+@bp.route("/profiles/<name>")
+@admin_required
+def profile_file(name):
+    """Download a stored capture; ``?summary=1`` renders ``.pstats`` as text."""
+    store = profiler.store_for(get_settings())
+    try:
+        data = store.read(name)
+    except (OSError, ValueError):
+        abort(404)
+    if name.endswith(".pstats") and request.args.get("summary"):
+        return Response(profiler.summary(data), mimetype="text/plain")
+    mimetype = "text/plain" if name.endswith(".collapsed") else "application/octet-stream"
+    return Response(data, mimetype=mimetype)
@@ -0,0 +1,37 @@
+"""Access control for operational admin endpoints (profiling, memory).
+
+The kiosk has no user accounts, and requests arriving through the
+Cloudflare tunnel come from localhost, so the client address proves
+nothing. Diagnostic endpoints therefore require the
+``X-FamilyHub-Admin-Token`` header to match ``FAMILYHUB_ADMIN_TOKEN``. When no
+token is configured they are disabled.
+"""
+
+from __future__ import annotations
+
+import hmac
+from functools import wraps
+
+from flask import abort, request
+
+from config import get_settings
+
+TOKEN_HEADER = "X-FamilyHub-Admin-Token"
+
+
+def has_admin_token() -> bool:
+    expected = get_settings().admin_token
+    supplied = request.headers.get(TOKEN_HEADER, "")
+    return bool(expected) and hmac.compare_digest(supplied.encode(), expected.encode())
+
+
+def admin_required(view):
+    """Reject the request with 404 unless it carries the admin token."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not has_admin_token():
+            abort(404)
+        return view(*args, **kwargs)
+
+    return wrapper
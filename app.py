@@ -4,6 +4,10 @@ Separated concerns:
 * Configuration (config.Settings)
 * Database initialization
 * Logging bootstrap (single place)
+
+Importing this module only builds the app object. Startup side effects
+(schema check/create_all, overdue sweep) are explicit steps in
+:func:`run_startup_tasks`, called by ``main.main()``.
 """
 
 from __future__ import annotations
@@ -15,8 +19,10 @@ from typing import Any
 from flask import Flask
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-from db import db
+from db import db, engine_options, install_sqlite_profile
 from config import get_settings
+from runtime import metrics, profiler, sql_audit, tracing
+from runtime.inflight import tracker as inflight_tracker
 
 
 def _bootstrap_logging() -> Logger:
@@ -31,10 +37,20 @@ log = _bootstrap_logging()
 app = Flask(__name__)
 app.secret_key = settings.session_secret
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)  # type: ignore
+app.wsgi_app = inflight_tracker.middleware(app.wsgi_app)  # type: ignore
 app.config["SQLALCHEMY_DATABASE_URI"] = settings.database_url
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"pool_recycle": 300, "pool_pre_ping": True}
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(settings.database_url, settings)
 
 db.init_app(app)
+with app.app_context():
+    install_sqlite_profile(db.engine, settings)
+    metrics.install_engine(db.engine)
+    tracing.install_engine(db.engine)
+    sql_audit.install_engine(db.engine, settings)
+metrics.install_flask(app)
+sql_audit.install_flask(app, settings)
+tracing.install_flask(app, settings)
+profiler.install_flask(app, settings)
 
 
 from flask import url_for  # placed after app creation
@@ -51,17 +67,50 @@ def safe_url_for(endpoint: str, **values) -> str:
 app.jinja_env.globals.setdefault("safe_url_for", safe_url_for)
 
 
-with app.app_context():  # pragma: no cover - startup side effects
-    import models  # noqa: F401  # ensure models registered
-    db.create_all()
-    log.info("Database tables created")
-    # Clean up outstanding chores due today
-    try:
-        from services.chores_service import ignore_uncompleted_chores_before_today
-        ignore_uncompleted_chores_before_today()
-        log.info("Outstanding chores due before today have been auto-ignored.")
-    except Exception as e:
-        log.error(f"Failed to auto-ignore outstanding chores: {e}")
+def init_database() -> None:
+    """Ensure the database schema exists.
+
+    Cheap when ``schema_migrations`` shows every migration applied; otherwise
+    falls back to ``db.create_all()``. A separate archive file
+    (``FAMILYHUB_ARCHIVE_DB``) gets its ``chores_archive`` table here.
+    Explicit startup step (see :func:`run_startup_tasks`) so importing
+    ``app`` has no side effects.
+    """
+    with app.app_context():
+        import models  # noqa: F401  # ensure models registered
+        from bootstrap.migrations import schema_is_current
+
+        if schema_is_current(db.engine):
+            log.info("Database schema up to date")
+        else:
+            db.create_all()
+            log.info("Database tables created")
+        if settings.archive_database_path:
+            from services.archive_service import ensure_archive
+
+            with db.engine.begin() as conn:
+                ensure_archive(conn)
+
+
+def auto_ignore_stale_chores() -> None:
+    """Mark pending chores due before today as ignored (startup sweep)."""
+    with app.app_context():
+        try:
+            from services.chores_service import ignore_uncompleted_chores_before_today
+            ignore_uncompleted_chores_before_today()
+            log.info("Outstanding chores due before today have been auto-ignored.")
+        except Exception as e:
+            log.error(f"Failed to auto-ignore outstanding chores: {e}")
+
+
+def run_startup_tasks() -> None:
+    """Opt-in startup side effects: schema check and overdue sweep.
+
+    Called by ``main.main()``; scripts and tests call only what they need.
+    """
+    init_database()
+    auto_ignore_stale_chores()
+
 
 if not settings:  # pragma: no cover safety check
     raise RuntimeError("Settings failed to load")
@@ -81,4 +130,5 @@ if not _os.environ.get("SKIP_ROUTES"):
     app.register_blueprint(rewards_bp, url_prefix="/rewards")
 
 if __name__ == "__main__":  # pragma: no cover
+    run_startup_tasks()
     app.run(host="0.0.0.0", port=5050, debug=True)
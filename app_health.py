@@ -2,12 +2,22 @@ import time
 import psutil
 import subprocess
 import json
+import os
+import tempfile
 import threading
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Callable, Optional
+from typing import Any, Optional, Sequence
 
-from health.health_check import liveness_check, readiness_check
+from config import get_settings
+from health.health_check import liveness_check, readiness_probes
+from health.integrity import scheduled_slice
+from health.monitor import HealthMonitor, published_probe
+from health.server import LatencyStats, PooledHTTPServer, timed
+from runtime import metrics
+from runtime.preload import master_pid
+from runtime.process_memory import worker_memory
+from runtime.warmup import current_stage
 
 
 def ensure_chromium_kiosk() -> bool:
@@ -33,7 +43,81 @@ def ensure_chromium_kiosk() -> bool:
     return False  # Was not running, now launched
 
 
-def _json_response(check_fn: Callable[[], Any]) -> tuple[str, int]:
+def _browser_probe() -> tuple[bool, str]:
+    running = ensure_chromium_kiosk()
+    return running, "ok" if running else "restarted"
+
+
+LIVENESS_PROBES = ("liveness",)
+# Probes with side effects or real cost (Chromium restart, DNS lookup, the
+# integrity slice): only the prefork master runs them, workers read its results
+MASTER_ONLY_PROBES = ("browser", "dns", "integrity")
+_monitor: Optional[HealthMonitor] = None
+_monitor_pid: Optional[int] = None
+_monitor_address: tuple[str, int] = ("127.0.0.1", 8030)
+_readiness_names: tuple[str, ...] = ()
+
+
+def published_path(master: int) -> str:
+    """File the prefork master ``master`` publishes its probe results to."""
+    return os.path.join(tempfile.gettempdir(), f"familyhub-health-{master}.json")
+
+
+def build_monitor(host: str, port: int, settings=None, *, master: Optional[int] = None) -> HealthMonitor:
+    """Create the probe monitor used by the health endpoints (not started).
+
+    ``master`` is the prefork master's pid when building a worker's monitor:
+    :data:`MASTER_ONLY_PROBES` then read the master's published results. The
+    master itself publishes when ``server_mode`` is ``prefork``.
+    """
+    global _monitor, _monitor_pid, _monitor_address, _readiness_names
+    settings = settings or get_settings()
+    publish = published_path(os.getpid()) if master is None and settings.server_mode == "prefork" else None
+    monitor = HealthMonitor(publish_path=publish)
+    probes = {"liveness": liveness_check, "browser": _browser_probe}
+    readiness = readiness_probes(host, port)
+    probes.update(readiness)
+    db_path = os.environ.get("DB_PATH")
+    if db_path and master is None:
+        # Background-only: readiness reads the persisted verdict via "db"
+        probes["integrity"] = lambda: scheduled_slice(db_path, settings)
+    for name, fn in probes.items():
+        if name == "integrity":
+            interval = settings.integrity_interval
+        elif name in ("liveness", "socket"):
+            interval = settings.health_probe_interval
+        else:
+            interval = settings.health_slow_probe_interval
+        if master is not None and name in MASTER_ONLY_PROBES:
+            fn = published_probe(published_path(master), name, interval * monitor.stale_factor)
+        monitor.add(name, fn, interval)
+    _monitor, _readiness_names = monitor, tuple(readiness)
+    _monitor_pid, _monitor_address = os.getpid(), (host, port)
+    return monitor
+
+
+def _get_monitor(host: str, port: int) -> HealthMonitor:
+    # Probe threads do not survive fork(): a prefork worker inherits the
+    # master's monitor with dead threads and builds its own instead
+    if _monitor is None:
+        build_monitor(host, port).start()
+    elif _monitor_pid != os.getpid():
+        restart_monitor_after_fork()
+    return _monitor
+
+
+def restart_monitor_after_fork() -> None:
+    """Start this worker's own probe threads (gunicorn ``post_fork``).
+
+    Only the cheap per-process probes run here; the rest come from the
+    master's published results. No-op unless a monitor was built before the
+    fork.
+    """
+    if _monitor is not None and _monitor_pid != os.getpid():
+        build_monitor(*_monitor_address, master=_monitor_pid).start()
+
+
+def _json_response(names: Sequence[str], host: str = "127.0.0.1", port: int = 8030) -> tuple[str, int]:
     # Wait 60 seconds after startup before health checks
     if not hasattr(liveness_check, "_startup_time"):
         liveness_check._startup_time = time.time()
@@ -44,45 +128,101 @@ def _json_response(check_fn: Callable[[], Any]) -> tuple[str, int]:
             "ts": datetime.now(timezone.utc).isoformat(),
         }
         return json.dumps(payload), 200
-    # Ensure Chromium kiosk is running
-    browser_ok = ensure_chromium_kiosk()
-    ok, details = check_fn()
-    status = "ok" if ok and browser_ok else "fail"
+    # Serialize the latest background probe results; nothing is probed here
+    monitor = _get_monitor(host, port)
+    browser = monitor.result("browser")
+    results = {name: monitor.result(name) for name in names}
+    ok = all(r.ok for r in results.values())
+    status = "ok" if ok and browser.ok else "fail"
     payload = {
         "status": status,
-        "checks": details,
-        "browser": "ok" if browser_ok else "restarted",
+        "checks": {name: r.as_dict() for name, r in results.items()},
+        "browser": "ok" if browser.ok else "restarted",
+        "ts": datetime.now(timezone.utc).isoformat(),
+    }
+    return json.dumps(payload), 200 if ok and browser.ok else 503
+
+
+def _liveness_response(host: str, port: int) -> tuple[str, int]:
+    return _json_response(LIVENESS_PROBES, host, port)
+
+
+def _readiness_response(host: str, port: int) -> tuple[str, int]:
+    # Not ready while the warm-up stage is still filling caches
+    stage = current_stage()
+    if stage is not None and not stage.ready:
+        payload = {
+            "status": "warming",
+            "warmup": stage.snapshot(),
+            "ts": datetime.now(timezone.utc).isoformat(),
+        }
+        return json.dumps(payload), 503
+    _get_monitor(host, port)
+    return _json_response(_readiness_names, host, port)
+
+
+def _memory_response() -> tuple[str, int]:
+    payload = {
+        "memory": worker_memory(master_pid()),
         "ts": datetime.now(timezone.utc).isoformat(),
     }
-    return json.dumps(payload), 200 if ok and browser_ok else 503
+    return json.dumps(payload), 200
+
+
+# Per-endpoint latency counters shared by every way the endpoints are served
+latency = LatencyStats()
+
+
+def _stats_response() -> tuple[str, int]:
+    payload = {"endpoints": latency.snapshot(), "ts": datetime.now(timezone.utc).isoformat()}
+    return json.dumps(payload), 200
+
+
+def _respond(path: str, host: str, port: int) -> tuple[str, int]:
+    if path == "/healthz":
+        return timed(latency, path, _liveness_response, host, port)
+    if path == "/readyz":
+        return timed(latency, path, _readiness_response, host, port)
+    if path == "/healthz/memory":
+        return timed(latency, path, _memory_response)
+    if path == "/healthz/stats":
+        return _stats_response()
+    if path == "/metrics":
+        return metrics.registry.render(), 200
+    raise KeyError(path)
+
+
+HEALTH_PATHS = ("/healthz", "/readyz", "/healthz/memory", "/healthz/stats", "/metrics")
+JSON = "application/json"
+CONTENT_TYPES = {"/metrics": metrics.CONTENT_TYPE}
 
 
 def _register_flask(app, host: str, port: int) -> None:
     from flask import Response
 
-    @app.route("/healthz")
-    def _health() -> Response:  # type: ignore[override]
-        body, code = _json_response(liveness_check)
-        return Response(body, status=code, mimetype="application/json")
+    def _view(path: str):
+        def view() -> Response:
+            body, code = _respond(path, host, port)
+            return Response(body, status=code, content_type=CONTENT_TYPES.get(path, JSON))
 
-    @app.route("/readyz")
-    def _ready() -> Response:  # type: ignore[override]
-        body, code = _json_response(lambda: readiness_check(host, port))
-        return Response(body, status=code, mimetype="application/json")
+        return view
+
+    for path in HEALTH_PATHS:
+        app.add_url_rule(path, endpoint=f"health{path.replace('/', '_')}", view_func=_view(path))
 
 
 def _register_fastapi(app, host: str, port: int) -> None:
     from fastapi import Response
 
-    @app.get("/healthz")
-    async def _health() -> Response:  # type: ignore[override]
-        body, code = _json_response(liveness_check)
-        return Response(content=body, status_code=code, media_type="application/json")
+    def _view(path: str):
+        async def view() -> Response:
+            body, code = _respond(path, host, port)
+            return Response(content=body, status_code=code, media_type=CONTENT_TYPES.get(path, JSON))
+
+        return view
 
-    @app.get("/readyz")
-    async def _ready() -> Response:  # type: ignore[override]
-        body, code = _json_response(lambda: readiness_check(host, port))
-        return Response(content=body, status_code=code, media_type="application/json")
+    for path in HEALTH_PATHS:
+        app.get(path)(_view(path))
 
 
 class _Handler(BaseHTTPRequestHandler):
@@ -90,15 +230,22 @@ class _Handler(BaseHTTPRequestHandler):
     port = 8030
 
     def do_GET(self) -> None:  # noqa: N802
-        if self.path == "/healthz":
-            body, code = _json_response(liveness_check)
-        elif self.path == "/readyz":
-            body, code = _json_response(lambda: readiness_check(self.host, self.port))
-        else:
+        if self.path not in HEALTH_PATHS:
             self.send_error(404)
             return
+        if self.path == "/healthz":
+            body, code = _respond(self.path, self.host, self.port)
+        elif self.server.try_acquire_shared():
+            try:
+                body, code = _respond(self.path, self.host, self.port)
+            finally:
+                self.server.release_shared()
+        else:
+            # Remaining workers are reserved for liveness
+            body, code = json.dumps({"status": "busy"}), 503
+            latency.record(self.path, 0.0, code)
         self.send_response(code)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", CONTENT_TYPES.get(self.path, JSON))
         self.end_headers()
         self.wfile.write(body.encode("utf-8"))
 
@@ -108,7 +255,13 @@ class _Handler(BaseHTTPRequestHandler):
 
 
 def setup_health(app: Optional[Any] = None, host: str = "127.0.0.1", port: int = 8030) -> Optional[HTTPServer]:
-    """Register health endpoints or start an internal server."""
+    """Register health endpoints or start an internal server.
+
+    Also starts the background probe monitor the endpoints read from. The
+    internal server binds ``host:port`` and serves requests concurrently.
+    """
+    settings = get_settings()
+    build_monitor(host, port, settings).start()
     if app is not None:
         if hasattr(app, "route"):
             _register_flask(app, host, port)
@@ -117,10 +270,13 @@ def setup_health(app: Optional[Any] = None, host: str = "127.0.0.1", port: int =
             _register_fastapi(app, host, port)
             return None
 
-    handler = _Handler
-    handler.host = host
-    handler.port = port
-    server = HTTPServer(("127.0.0.1", 8030), handler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    handler = type("_BoundHandler", (_Handler,), {"host": host, "port": port})
+    server = PooledHTTPServer(
+        (host, port),
+        handler,
+        threads=settings.health_server_threads,
+        reserved=settings.health_liveness_reserved,
+    )
+    thread = threading.Thread(target=server.serve_forever, name="familyhub-health-server", daemon=True)
     thread.start()
     return server
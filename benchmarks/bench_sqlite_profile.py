@@ -0,0 +1,141 @@
+"""Compare kiosk-style read/write concurrency with and without the SQLite profile.
+
+Runs one writer thread (short transactions, like chore completions) next to
+several reader threads (dashboard-style SELECTs) for a fixed duration against
+a temporary database, first with SQLite defaults (rollback journal,
+synchronous=FULL) and then with the profile from ``db.install_sqlite_profile``.
+
+Usage::
+
+    python benchmarks/bench_sqlite_profile.py [--seconds 5] [--readers 4] [--rows 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import replace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from config import get_settings  # noqa: E402
+from db import engine_options, install_sqlite_profile  # noqa: E402
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _prepare(url: str, rows: int) -> None:
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE chores (id INTEGER PRIMARY KEY, task_id TEXT, due_date TEXT, status TEXT)"
+        )
+        conn.exec_driver_sql("CREATE INDEX ix_due ON chores(due_date)")
+        conn.execute(
+            text("INSERT INTO chores(task_id, due_date, status) VALUES (:t, :d, 'pending')"),
+            [{"t": f"t{i % 50}", "d": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}"} for i in range(rows)],
+        )
+    engine.dispose()
+
+
+def run(profile: bool, seconds: float, readers: int, rows: int) -> dict:
+    settings = get_settings()
+    if not profile:
+        settings = replace(settings, sqlite_journal_mode="DELETE", sqlite_synchronous="FULL")
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        _prepare(url, rows)
+        opts = engine_options(url, settings) if profile else {}
+        engine = create_engine(url, pool_size=readers + 2, **opts)
+        install_sqlite_profile(engine, settings)
+
+        stop = time.perf_counter() + seconds
+        read_lat: list[float] = []
+        write_lat: list[float] = []
+        errors = [0]
+        lock = threading.Lock()
+
+        def reader() -> None:
+            local = []
+            while time.perf_counter() < stop:
+                t0 = time.perf_counter()
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(
+                            text("SELECT COUNT(*) FROM chores WHERE due_date >= :d AND status = 'pending'"),
+                            {"d": "2025-06-01"},
+                        ).scalar()
+                except Exception:
+                    with lock:
+                        errors[0] += 1
+                    continue
+                local.append(time.perf_counter() - t0)
+            with lock:
+                read_lat.extend(local)
+
+        def writer() -> None:
+            i = 0
+            while time.perf_counter() < stop:
+                t0 = time.perf_counter()
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(
+                            text("UPDATE chores SET status = :s WHERE id = :id"),
+                            {"s": "completed" if i % 2 else "pending", "id": 1 + i % rows},
+                        )
+                except Exception:
+                    with lock:
+                        errors[0] += 1
+                    continue
+                write_lat.append(time.perf_counter() - t0)
+                i += 1
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    return {
+        "reads_per_s": len(read_lat) / seconds,
+        "writes_per_s": len(write_lat) / seconds,
+        "read_p50_ms": statistics.median(read_lat) * 1000 if read_lat else 0.0,
+        "read_p99_ms": _percentile(read_lat, 99) * 1000,
+        "write_p99_ms": _percentile(write_lat, 99) * 1000,
+        "errors": errors[0],
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="SQLite profile concurrency benchmark")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    results = {
+        "default": run(False, args.seconds, args.readers, args.rows),
+        "profile": run(True, args.seconds, args.readers, args.rows),
+    }
+    keys = list(results["default"])
+    print(f"{'metric':<14}{'default':>12}{'profile':>12}")
+    for key in keys:
+        print(f"{key:<14}{results['default'][key]:>12.1f}{results['profile'][key]:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Startup-time benchmark with budgets.
+
+Measures, each in a fresh interpreter against a throwaway SQLite database:
+
+* import time of ``main`` (what every serving process pays), with the
+  slowest modules from ``python -X importtime``;
+* the explicit ``init_database()`` step;
+* latency of the first ``GET /`` through the Flask test client.
+
+Exits with status 1 when import time or first-request latency exceeds its
+budget, so it can gate CI or a deploy script.
+
+Usage::
+
+    python benchmarks/bench_startup.py [--import-budget-ms 1500] [--first-request-budget-ms 1000] [--top 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import main  # noqa: F401
+from app import app, init_database
+t1 = time.perf_counter()
+init_database()
+t2 = time.perf_counter()
+resp = app.test_client().get({path!r})
+t3 = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "init_database_ms": (t2 - t1) * 1000,
+    "first_request_ms": (t3 - t2) * 1000,
+    "status": resp.status_code,
+}}))
+"""
+
+
+def _env(tmp: str) -> dict:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+    env.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+    env.pop("SKIP_ROUTES", None)
+    return env
+
+
+def import_breakdown(env: dict, top: int) -> list[tuple[str, int, int]]:
+    """Return ``(module, self_us, cumulative_us)`` for the slowest imports."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        rows.append((name, int(self_us), int(cumulative)))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return rows[:top]
+
+
+def probe(env: dict, path: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(path=path)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FamilyHub startup benchmark")
+    parser.add_argument("--import-budget-ms", type=float, default=1500.0)
+    parser.add_argument("--first-request-budget-ms", type=float, default=1000.0)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _env(tmp)
+        breakdown = import_breakdown(env, args.top)
+        result = probe(env, args.path)
+
+    print("Slowest imports (cumulative ms / self ms):")
+    for name, self_us, cumulative in breakdown:
+        print(f"  {cumulative / 1000:9.1f} {self_us / 1000:9.1f}  {name}")
+    print()
+    print(f"import main        {result['import_ms']:9.1f} ms (budget {args.import_budget_ms:.0f})")
+    print(f"init_database()    {result['init_database_ms']:9.1f} ms")
+    print(
+        f"first GET {args.path:<8} {result['first_request_ms']:9.1f} ms "
+        f"(budget {args.first_request_budget_ms:.0f}, status {result['status']})"
+    )
+
+    failed = []
+    if result["import_ms"] > args.import_budget_ms:
+        failed.append("import")
+    if result["first_request_ms"] > args.first_request_budget_ms:
+        failed.append("first request")
+    if failed:
+        print(f"FAIL: over budget: {', '.join(failed)}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,577 @@
+"""Local stand-in for the Google Tasks v1 and Calendar v3 REST endpoints.
+
+Implements the calls FamilyHub makes, and the protocol details that matter for
+performance and resilience testing, against in-memory state:
+
+* Tasks: ``users/@me/lists`` (list, insert) and ``lists/{id}/tasks`` (list,
+  insert, get, patch, update, delete) with ``maxResults``/``pageToken``
+  paging (default page 20, max 100, like Google), ``updatedMin``,
+  ``showCompleted`` and ``showDeleted``.
+* Calendar: ``calendars/{id}/events`` (list, insert, get, patch, delete) with
+  ``timeMin``/``timeMax``, paging (default 250) and incremental sync: the last
+  page carries ``nextSyncToken``, a ``syncToken`` request returns only events
+  changed since (cancelled ones included), and expired tokens get
+  ``410 fullSyncRequired``.
+* ``multipart/mixed`` batch requests on ``/batch``, ``/batch/tasks/v1`` and
+  ``/batch/calendar/v3``.
+
+Every request (and every batch part) can be delayed by ``latency`` (+ uniform
+``jitter``) seconds and fail with 503 ``backendError`` or 429
+``rateLimitExceeded`` at the configured rates. :meth:`FakeGoogleServer.fail_next`
+queues deterministic failures for tests. ``GET /_fake/stats`` returns
+per-method request counts, and ``POST /_fake/config`` changes the injection
+settings of a running server.
+
+Point the app at it with ``FAMILYHUB_GOOGLE_API_ENDPOINT=http://127.0.0.1:8099``
+(see ``services.google_api.build_service``); no credentials are needed then.
+
+Usage::
+
+    python benchmarks/fake_google.py [--port 8099] [--latency-ms 80] [--jitter-ms 40]
+        [--error-rate 0.02] [--rate-limit-rate 0.05] [--tasks 200] [--events 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import date, datetime, timedelta, timezone
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+TASKS_PAGE = (20, 100)
+EVENTS_PAGE = (250, 2500)
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, reason: str, message: str = "") -> None:
+        super().__init__(message or reason)
+        self.status = status
+        self.reason = reason
+
+    def body(self) -> Dict[str, Any]:
+        message = str(self)
+        return {
+            "error": {
+                "code": self.status,
+                "message": message,
+                "errors": [{"domain": "global", "reason": self.reason, "message": message}],
+            }
+        }
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _parse_time(value: str, tz=timezone.utc) -> datetime:
+    if len(value) == 10:
+        return datetime.fromisoformat(value).replace(tzinfo=tz)
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=tz)
+
+
+def _encode_page(offset: int, seq: int) -> str:
+    return base64.urlsafe_b64encode(f"{offset}:{seq}".encode()).decode()
+
+
+def _decode_page(token: str) -> Tuple[int, int]:
+    try:
+        offset, seq = base64.urlsafe_b64decode(token.encode()).decode().split(":")
+        return int(offset), int(seq)
+    except ValueError:
+        raise ApiError(400, "invalid", "Invalid page token") from None
+
+
+def _page_size(query: Dict[str, str], limits: Tuple[int, int]) -> int:
+    default, maximum = limits
+    try:
+        return max(1, min(int(query.get("maxResults", default)), maximum))
+    except ValueError:
+        raise ApiError(400, "invalid", "Invalid maxResults") from None
+
+
+def _flag(query: Dict[str, str], name: str, default: bool) -> bool:
+    value = query.get(name)
+    return default if value is None else value.lower() == "true"
+
+
+class FakeGoogleState:
+    """Tasks and calendar data shared by all handler threads."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.seq = 0
+        # Sync tokens older than this sequence number are rejected (410)
+        self.sync_floor = 0
+        self.tasklists: Dict[str, Dict[str, Any]] = {}
+        self.tasks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.events: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.add_tasklist("My Tasks", list_id="@default")
+
+    def _next_seq(self) -> int:
+        self.seq += 1
+        return self.seq
+
+    # -- Tasks ---------------------------------------------------------
+    def add_tasklist(self, title: str, list_id: Optional[str] = None) -> Dict[str, Any]:
+        with self.lock:
+            list_id = list_id or uuid.uuid4().hex[:22]
+            item = {"kind": "tasks#taskList", "id": list_id, "title": title, "updated": _now()}
+            self.tasklists[list_id] = item
+            self.tasks.setdefault(list_id, {})
+            return item
+
+    def _tasklist(self, list_id: str) -> Dict[str, Dict[str, Any]]:
+        if list_id not in self.tasks:
+            raise ApiError(404, "notFound", f"Task list {list_id} not found")
+        return self.tasks[list_id]
+
+    def add_task(self, list_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            tasks = self._tasklist(list_id)
+            task_id = uuid.uuid4().hex[:22]
+            task = {
+                "kind": "tasks#task",
+                "id": task_id,
+                "status": "needsAction",
+                **{k: v for k, v in body.items() if v is not None and k not in ("id", "kind")},
+            }
+            task.update(updated=_now(), position=f"{len(tasks):020d}", _seq=self._next_seq())
+            tasks[task_id] = task
+            return task
+
+    def get_task(self, list_id: str, task_id: str) -> Dict[str, Any]:
+        task = self._tasklist(list_id).get(task_id)
+        if task is None or task.get("deleted"):
+            raise ApiError(404, "notFound", f"Task {task_id} not found")
+        return task
+
+    def update_task(self, list_id: str, task_id: str, body: Dict[str, Any], *, replace: bool) -> Dict[str, Any]:
+        with self.lock:
+            task = self.get_task(list_id, task_id)
+            if replace:
+                keep = {k: task[k] for k in ("kind", "id", "position")}
+                task.clear()
+                task.update(keep)
+            task.update({k: v for k, v in body.items() if k not in ("id", "kind")})
+            if task.get("status") == "needsAction":
+                task.pop("completed", None)
+            elif task.get("status") == "completed" and not task.get("completed"):
+                task["completed"] = _now()
+            task.update(updated=_now(), _seq=self._next_seq())
+            return task
+
+    def delete_task(self, list_id: str, task_id: str) -> None:
+        with self.lock:
+            task = self.get_task(list_id, task_id)
+            task.update(deleted=True, updated=_now(), _seq=self._next_seq())
+
+    def list_tasks(self, list_id: str, query: Dict[str, str]) -> Dict[str, Any]:
+        size = _page_size(query, TASKS_PAGE)
+        show_completed = _flag(query, "showCompleted", True)
+        show_deleted = _flag(query, "showDeleted", False)
+        updated_min = _parse_time(query["updatedMin"]) if "updatedMin" in query else None
+        with self.lock:
+            offset, seq = _decode_page(query["pageToken"]) if "pageToken" in query else (0, self.seq)
+            items = [
+                t
+                for t in self._tasklist(list_id).values()
+                if t["_seq"] <= seq
+                and (show_deleted or not t.get("deleted"))
+                and (show_completed or t.get("status") != "completed")
+                and (updated_min is None or _parse_time(t["updated"]) >= updated_min)
+            ]
+            page = items[offset : offset + size]
+            out: Dict[str, Any] = {"kind": "tasks#tasks", "etag": f'"{seq}"', "items": [_public(t) for t in page]}
+            if offset + size < len(items):
+                out["nextPageToken"] = _encode_page(offset + size, seq)
+            return out
+
+    # -- Calendar ------------------------------------------------------
+    def _calendar(self, calendar_id: str) -> Dict[str, Dict[str, Any]]:
+        return self.events.setdefault(calendar_id, {})
+
+    def add_event(self, calendar_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            event_id = body.get("id") or uuid.uuid4().hex
+            event = {"kind": "calendar#event", "status": "confirmed", **body, "id": event_id}
+            event.update(updated=_now(), _seq=self._next_seq())
+            self._calendar(calendar_id)[event_id] = event
+            return event
+
+    def get_event(self, calendar_id: str, event_id: str) -> Dict[str, Any]:
+        event = self._calendar(calendar_id).get(event_id)
+        if event is None or event.get("status") == "cancelled":
+            raise ApiError(404, "notFound", f"Event {event_id} not found")
+        return event
+
+    def patch_event(self, calendar_id: str, event_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            event = self.get_event(calendar_id, event_id)
+            event.update({k: v for k, v in body.items() if k not in ("id", "kind")})
+            event.update(updated=_now(), _seq=self._next_seq())
+            return event
+
+    def delete_event(self, calendar_id: str, event_id: str) -> None:
+        with self.lock:
+            event = self.get_event(calendar_id, event_id)
+            event.update(status="cancelled", updated=_now(), _seq=self._next_seq())
+
+    def expire_sync_tokens(self) -> None:
+        """Invalidate every sync token issued so far (clients must full-sync)."""
+        with self.lock:
+            self.sync_floor = self.seq + 1
+
+    def list_events(self, calendar_id: str, query: Dict[str, str]) -> Dict[str, Any]:
+        size = _page_size(query, EVENTS_PAGE)
+        sync = query.get("syncToken")
+        if sync and ("timeMin" in query or "timeMax" in query):
+            raise ApiError(400, "invalid", "syncToken cannot be combined with timeMin/timeMax")
+        with self.lock:
+            offset, seq = _decode_page(query["pageToken"]) if "pageToken" in query else (0, self.seq)
+            since = 0
+            if sync:
+                try:
+                    since = int(sync[1:]) if sync.startswith("s") else -1
+                except ValueError:
+                    since = -1
+                if since < self.sync_floor or since > self.seq:
+                    raise ApiError(410, "fullSyncRequired", "Sync token is no longer valid, a full sync is required.")
+            time_min = _parse_time(query["timeMin"]) if "timeMin" in query else None
+            time_max = _parse_time(query["timeMax"]) if "timeMax" in query else None
+            show_deleted = bool(sync) or _flag(query, "showDeleted", False)
+            items = []
+            for event in self._calendar(calendar_id).values():
+                if event["_seq"] > seq or event["_seq"] <= since:
+                    continue
+                if event.get("status") == "cancelled" and not show_deleted:
+                    continue
+                tz = time_min.tzinfo if time_min else timezone.utc
+                if time_min is not None and (_event_time(event, "end", tz) or time_min) <= time_min:
+                    continue
+                if time_max is not None and (_event_time(event, "start", tz) or time_max) >= time_max:
+                    continue
+                items.append(event)
+            if query.get("orderBy") == "startTime":
+                items.sort(key=lambda e: _event_time(e, "start") or datetime.max.replace(tzinfo=timezone.utc))
+            page = items[offset : offset + size]
+            out: Dict[str, Any] = {
+                "kind": "calendar#events",
+                "summary": calendar_id,
+                "timeZone": "UTC",
+                "updated": _now(),
+                "items": [_public(e) for e in page],
+            }
+            if offset + size < len(items):
+                out["nextPageToken"] = _encode_page(offset + size, seq)
+            else:
+                out["nextSyncToken"] = f"s{seq}"
+            return out
+
+
+def _event_time(event: Dict[str, Any], field: str, tz=timezone.utc) -> Optional[datetime]:
+    when = event.get(field) or {}
+    value = when.get("dateTime") or when.get("date")
+    return _parse_time(value, tz) if value else None
+
+
+def _public(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in item.items() if not k.startswith("_")}
+
+
+_TASKLISTS = re.compile(r"^/tasks/v1/users/@me/lists$")
+_TASKS = re.compile(r"^/tasks/v1/lists/([^/]+)/tasks$")
+_TASK = re.compile(r"^/tasks/v1/lists/([^/]+)/tasks/([^/]+)$")
+_EVENTS = re.compile(r"^/calendar/v3/calendars/([^/]+)/events$")
+_EVENT = re.compile(r"^/calendar/v3/calendars/([^/]+)/events/([^/]+)$")
+_BATCH_PATHS = ("/batch", "/batch/tasks/v1", "/batch/calendar/v3")
+
+
+class FakeGoogleServer:
+    """Threaded HTTP server around a :class:`FakeGoogleState`."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.state = FakeGoogleState()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.stats: Counter = Counter()
+        self._random = random.Random(seed)
+        self._failures: Deque[int] = deque()
+        self._lock = threading.Lock()
+        handler = type("_BoundHandler", (_Handler,), {"fake": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGoogleServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-google", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeGoogleServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Answer the next ``count`` API calls (or batch parts) with ``status``."""
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def configure(self, **settings: float) -> None:
+        for name in ("latency", "jitter", "error_rate", "rate_limit_rate"):
+            if name in settings:
+                setattr(self, name, float(settings[name]))
+
+    def _inject(self) -> None:
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            status = self._failures.popleft() if self._failures else None
+            roll = self._random.random()
+        if status is None:
+            if roll < self.rate_limit_rate:
+                status = 429
+            elif roll < self.rate_limit_rate + self.error_rate:
+                status = 503
+        if status == 429:
+            raise ApiError(429, "rateLimitExceeded", "Rate Limit Exceeded")
+        if status is not None:
+            raise ApiError(status, "backendError", "Backend Error")
+
+    def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Handle one API call; returns ``(status, json body)``."""
+        parts = urlsplit(target)
+        path = unquote(parts.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, ApiError(400, "parseError", "Invalid JSON").body()
+        state = self.state
+        try:
+            if _TASKLISTS.match(path):
+                key = f"tasklists.{'list' if method == 'GET' else 'insert'}"
+                self._count_and_inject(key)
+                if method == "GET":
+                    items = [dict(t) for t in state.tasklists.values()]
+                    return 200, {"kind": "tasks#taskLists", "items": items}
+                return 200, dict(state.add_tasklist(payload.get("title", "Untitled")))
+            match = _TASKS.match(path)
+            if match:
+                self._count_and_inject(f"tasks.{'list' if method == 'GET' else 'insert'}")
+                if method == "GET":
+                    return 200, state.list_tasks(match[1], query)
+                return 200, _public(state.add_task(match[1], payload))
+            match = _TASK.match(path)
+            if match:
+                verb = {"GET": "get", "PATCH": "patch", "PUT": "update", "DELETE": "delete"}.get(method)
+                if verb is None:
+                    raise ApiError(405, "methodNotAllowed", method)
+                self._count_and_inject(f"tasks.{verb}")
+                if verb == "get":
+                    return 200, _public(state.get_task(match[1], match[2]))
+                if verb == "delete":
+                    state.delete_task(match[1], match[2])
+                    return 204, None
+                return 200, _public(state.update_task(match[1], match[2], payload, replace=verb == "update"))
+            match = _EVENTS.match(path)
+            if match:
+                self._count_and_inject(f"calendar.events.{'list' if method == 'GET' else 'insert'}")
+                if method == "GET":
+                    return 200, state.list_events(match[1], query)
+                return 200, _public(state.add_event(match[1], payload))
+            match = _EVENT.match(path)
+            if match:
+                verb = {"GET": "get", "PATCH": "patch", "DELETE": "delete"}.get(method)
+                if verb is None:
+                    raise ApiError(405, "methodNotAllowed", method)
+                self._count_and_inject(f"calendar.events.{verb}")
+                if verb == "get":
+                    return 200, _public(state.get_event(match[1], match[2]))
+                if verb == "delete":
+                    state.delete_event(match[1], match[2])
+                    return 204, None
+                return 200, _public(state.patch_event(match[1], match[2], payload))
+            raise ApiError(404, "notFound", f"No route for {method} {path}")
+        except ApiError as exc:
+            return exc.status, exc.body()
+
+    def _count_and_inject(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+        self._inject()
+
+    def batch(self, content_type: str, body: bytes) -> Tuple[bytes, str]:
+        """Run every part of a ``multipart/mixed`` batch; returns ``(body, content type)``."""
+        message = BytesParser(policy=HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+        )
+        with self._lock:
+            self.stats["batch"] += 1
+        boundary = f"batch_{uuid.uuid4().hex}"
+        out: List[bytes] = []
+        for part in message.iter_parts():
+            raw = part.get_payload(decode=True) or b""
+            head, _, sub_body = raw.partition(b"\r\n\r\n")
+            if not _:
+                head, _, sub_body = raw.partition(b"\n\n")
+            request_line = head.splitlines()[0].decode()
+            method, target = request_line.split()[:2]
+            status, payload = self.dispatch(method, target, sub_body.strip())
+            content_id = part.get("Content-ID", "")
+            response_id = f"<response-{content_id[1:]}" if content_id.startswith("<") else content_id
+            data = json.dumps(payload).encode() if payload is not None else b""
+            out.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: {response_id}\r\n\r\n"
+                f"HTTP/1.1 {status} {_reason(status)}\r\nContent-Type: application/json; charset=UTF-8\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode()
+                + data
+                + b"\r\n"
+            )
+        out.append(f"--{boundary}--\r\n".encode())
+        return b"".join(out), f"multipart/mixed; boundary={boundary}"
+
+
+def _reason(status: int) -> str:
+    from http import HTTPStatus
+
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return "Unknown"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    fake: FakeGoogleServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _send(self, status: int, data: bytes, content_type: str = "application/json; charset=UTF-8") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path = urlsplit(self.path).path
+        if path == "/_fake/stats":
+            self._send(200, json.dumps(dict(self.fake.stats)).encode())
+            return
+        if path == "/_fake/config" and self.command == "POST":
+            self.fake.configure(**json.loads(body or b"{}"))
+            self._send(200, b"{}")
+            return
+        if path in _BATCH_PATHS and self.command == "POST":
+            data, content_type = self.fake.batch(self.headers.get("Content-Type", ""), body)
+            self._send(200, data, content_type)
+            return
+        status, payload = self.fake.dispatch(self.command, self.path, body)
+        self._send(status, json.dumps(payload).encode() if payload is not None else b"")
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+
+def seed(state: FakeGoogleState, *, tasks: int = 0, events: int = 0, calendar_id: str = "meals") -> None:
+    """Fill ``state`` with a "Family chores" list and a meals calendar around today."""
+    chores = state.add_tasklist("Family chores")
+    today = date.today()
+    for n in range(tasks):
+        state.add_task(
+            chores["id"],
+            {
+                "title": f"Chore {n}",
+                "notes": f"Assigned to: {('Alex', 'Sam', 'Jo')[n % 3]}",
+                "due": f"{today + timedelta(days=n % 14)}T00:00:00.000Z",
+            },
+        )
+    for n in range(events):
+        day = today + timedelta(days=n % 15 - 7)
+        state.add_event(
+            calendar_id,
+            {"summary": f"Dinner {n}", "start": {"date": day.isoformat()}, "end": {"date": (day + timedelta(days=1)).isoformat()}},
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of calls answered 429")
+    parser.add_argument("--tasks", type=int, default=50, help="chores to seed")
+    parser.add_argument("--events", type=int, default=15, help="meal events to seed (calendar id 'meals')")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for failure injection")
+    parser.add_argument(
+        "--events-file", metavar="PATH", help="JSON list of extra meal events (scripts/generate_data.py --meals-json)"
+    )
+    args = parser.parse_args(argv)
+
+    server = FakeGoogleServer(
+        args.host,
+        args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    seed(server.state, tasks=args.tasks, events=args.events)
+    if args.events_file:
+        with open(args.events_file, encoding="utf-8") as fh:
+            for body in json.load(fh):
+                server.state.add_event("meals", body)
+    print(f"fake Google APIs on {server.url} (FAMILYHUB_GOOGLE_API_ENDPOINT={server.url}, calendar id 'meals')")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
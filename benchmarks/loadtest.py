@@ -0,0 +1,402 @@
+"""End-to-end load test: a kiosk/phone traffic mix against one FamilyHub process.
+
+By default the harness builds a throwaway environment and drives it over
+real HTTP:
+
+* a local Google stand-in (``benchmarks/fake_google.py``) with optional
+  latency and error injection, seeded with one Google task per chore;
+* a temporary SQLite database with all migrations applied, chores pointing at
+  those tasks, users with points and rewards;
+* ``python main.py`` in a subprocess (``--server threaded|prefork``) using
+  both of the above.
+
+``--users`` virtual clients then replay a weighted mix of dashboard renders
+(``/``), ``/chores`` views, ``POST /chores/<id>/complete`` taps, ``/rewards/``
+views and ``POST /rewards/redeem`` redemptions for ``--seconds`` seconds with
+``--think-ms`` between requests. Requests in the first ``--warmup-seconds`` are
+not counted.
+
+The threaded server speaks HTTP/1.0 (``runtime.serving``), so every request
+opens a new TCP connection, like a kiosk browser against it. Latencies include
+that connect; its own percentiles are reported as ``connect_*`` in the total.
+
+Throughput, error rate and latency percentiles are reported per route and
+saved as JSON under ``--results-dir`` (default ``benchmarks/results/``) with
+the git commit in the file name. ``--compare`` prints the change against a
+previous result file.
+
+With ``--url`` an already running server is measured instead; only the read
+routes are replayed then, because the write routes need the seeded data.
+
+Usage::
+
+    python benchmarks/loadtest.py [--users 8] [--seconds 30] [--server threaded]
+        [--mix index=40,chores=25,complete=15,rewards=15,redeem=5]
+        [--google-latency-ms 80] [--google-error-rate 0.01] [--compare PREVIOUS.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from benchmarks.fake_google import FakeGoogleServer  # noqa: E402
+from bootstrap.migrations import apply_pending  # noqa: E402
+
+DEFAULT_MIX = "index=40,chores=25,complete=15,rewards=15,redeem=5"
+READ_ROUTES = ("index", "chores", "rewards")
+USERS = ("Briggs", "Hayes")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in READ_ROUTES + ("complete", "redeem"):
+            raise SystemExit(f"unknown route in --mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def seed_environment(db_url: str, fake: FakeGoogleServer, chores: int) -> List[Tuple[int, str]]:
+    """Migrate and fill the database; returns ``(occurrence id, due iso)`` per chore."""
+    engine = create_engine(db_url, future=True)
+    apply_pending(engine)
+    today = date.today()
+    occurrences = []
+    with engine.begin() as conn:
+        for name in USERS:
+            conn.execute(
+                text("INSERT INTO points_ledger(user_name, points, kind) VALUES(:u, 1000000, 'adjust')"),
+                {"u": name},
+            )
+        for n in range(chores):
+            due = today + timedelta(days=n % 7)
+            task = fake.state.add_task("@default", {"title": f"Chore {n}", "due": f"{due}T00:00:00.000Z"})
+            conn.execute(
+                text(
+                    "INSERT INTO chore_metadata(task_id, title, assigned_to, recurrence, points) "
+                    "VALUES(:t, :title, :who, :rule, 1)"
+                ),
+                {"t": task["id"], "title": f"Chore {n}", "who": USERS[n % 2], "rule": "FREQ=WEEKLY" if n % 3 else None},
+            )
+            row = conn.execute(
+                text("INSERT INTO chores(task_id, due_date, status) VALUES(:t, :d, 'pending') RETURNING id"),
+                {"t": task["id"], "d": due.isoformat()},
+            ).scalar_one()
+            occurrences.append((row, due.isoformat()))
+    for n in range(15):
+        day = today + timedelta(days=n - 7)
+        fake.state.add_event(
+            "meals",
+            {"summary": f"Dinner {n}", "start": {"date": day.isoformat()}, "end": {"date": (day + timedelta(days=1)).isoformat()}},
+        )
+    engine.dispose()
+    return occurrences
+
+
+def start_server(args, db_url: str, fake_url: str, tmp: str) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = dict(os.environ)
+    env.pop("SKIP_ROUTES", None)
+    env.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+    env.update(
+        DATABASE_URL=db_url,
+        HOST="127.0.0.1",
+        PORT=str(port),
+        FAMILYHUB_SERVER=args.server,
+        FAMILYHUB_GOOGLE_API_ENDPOINT=fake_url,
+        FAMILYHUB_CALENDAR_ID="meals",
+        FAMILYHUB_STALL_LOG=os.path.join(tmp, "stalls.log"),
+        FAMILYHUB_PROFILE_DIR=os.path.join(tmp, "profiles"),
+    )
+    log = open(os.path.join(tmp, "server.log"), "wb")
+    proc = subprocess.Popen([sys.executable, "main.py"], cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    base = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"server exited with {proc.returncode}; see {log.name}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/readyz")
+            if conn.getresponse().status == 200:
+                return proc, base
+        except OSError:
+            pass
+        time.sleep(0.25)
+    proc.terminate()
+    raise SystemExit(f"server not ready after 60s; see {log.name}")
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.connects: List[float] = []
+
+    def add(self, route: str, seconds: float, status: Optional[int], connect: Optional[float] = None) -> None:
+        with self.lock:
+            self.latencies[route].append(seconds)
+            if connect is not None:
+                self.connects.append(connect)
+            self.statuses[route][str(status or "exc")] += 1
+            if status is None or status >= 400:
+                self.errors[route] += 1
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(recorder: Recorder, seconds: float) -> Dict[str, Dict[str, float]]:
+    out = {}
+    everything: List[float] = []
+    total_errors = 0
+    for route, values in sorted(recorder.latencies.items()):
+        values = sorted(values)
+        everything.extend(values)
+        total_errors += recorder.errors[route]
+        out[route] = _stats(values, recorder.errors[route], seconds)
+        out[route]["statuses"] = dict(recorder.statuses[route])
+    out["total"] = _stats(sorted(everything), total_errors, seconds)
+    connects = sorted(recorder.connects)
+    out["total"]["connect_p50_ms"] = round(_percentile(connects, 50) * 1000, 2)
+    out["total"]["connect_p95_ms"] = round(_percentile(connects, 95) * 1000, 2)
+    return out
+
+
+def _stats(values: List[float], errors: int, seconds: float) -> Dict[str, float]:
+    n = len(values)
+    return {
+        "requests": n,
+        "rps": round(n / seconds, 2) if seconds else 0.0,
+        "error_rate": round(errors / n, 4) if n else 0.0,
+        "p50_ms": round(_percentile(values, 50) * 1000, 2),
+        "p90_ms": round(_percentile(values, 90) * 1000, 2),
+        "p95_ms": round(_percentile(values, 95) * 1000, 2),
+        "p99_ms": round(_percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+    }
+
+
+class Client(threading.Thread):
+    """One kiosk or phone replaying the mix, one connection per request."""
+
+    def __init__(self, base: str, mix: Dict[str, float], occurrences, recorder: Recorder, *, think: float,
+                 measure_from: float, stop_at: float, seed: int) -> None:
+        super().__init__(daemon=True)
+        parts = urlsplit(base)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.routes = list(mix)
+        self.weights = [mix[r] for r in self.routes]
+        self.occurrences = occurrences
+        self.recorder = recorder
+        self.think = think
+        self.measure_from = measure_from
+        self.stop_at = stop_at
+        self.random = random.Random(seed)
+
+    def _request(self, route: str) -> Tuple[str, str, Optional[bytes]]:
+        if route == "index":
+            return "GET", "/", None
+        if route == "chores":
+            return "GET", "/chores", None
+        if route == "rewards":
+            return "GET", "/rewards/", None
+        user = self.random.choice(USERS)
+        if route == "complete":
+            occ_id, due = self.random.choice(self.occurrences)
+            return "POST", f"/chores/{occ_id}/complete", json.dumps({"due_iso": due, "assigned_to": user}).encode()
+        return "POST", "/rewards/redeem", json.dumps({"user": user, "reward_id": 1}).encode()
+
+    def run(self) -> None:
+        while time.monotonic() < self.stop_at:
+            route = self.random.choices(self.routes, self.weights)[0]
+            method, path, body = self._request(route)
+            headers = {"Content-Type": "application/json"} if body else {}
+            t0 = time.monotonic()
+            status: Optional[int] = None
+            connect: Optional[float] = None
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            try:
+                conn.connect()
+                connect = time.monotonic() - t0
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                resp.read()
+                status = resp.status
+            except (OSError, http.client.HTTPException):
+                pass
+            finally:
+                conn.close()
+            if t0 >= self.measure_from:
+                self.recorder.add(route, time.monotonic() - t0, status, connect)
+            if self.think:
+                time.sleep(self.random.uniform(0.5, 1.5) * self.think)
+
+
+def git_commit() -> Tuple[str, bool]:
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True)
+        return sha.stdout.strip(), bool(dirty.stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def print_report(results: Dict[str, Dict[str, float]], previous: Optional[dict] = None) -> None:
+    print(f"{'route':<10} {'reqs':>7} {'rps':>8} {'err%':>6} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for route, s in results.items():
+        line = (
+            f"{route:<10} {s['requests']:>7} {s['rps']:>8.1f} {s['error_rate'] * 100:>5.1f}% "
+            f"{s['p50_ms']:>8.1f} {s['p90_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f} {s['max_ms']:>8.1f}"
+        )
+        old = (previous or {}).get(route)
+        if old:
+            line += f"   rps {_delta(s['rps'], old['rps'])}, p95 {_delta(s['p95_ms'], old['p95_ms'])}"
+        print(line)
+    total = results.get("total", {})
+    if "connect_p50_ms" in total:
+        print(f"TCP connect (included above): p50 {total['connect_p50_ms']:.2f} ms, p95 {total['connect_p95_ms']:.2f} ms")
+
+
+def _delta(new: float, old: float) -> str:
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FamilyHub end-to-end load test")
+    parser.add_argument("--url", help="measure an already running server (read routes only)")
+    parser.add_argument("--users", type=int, default=8, help="concurrent kiosks/phones")
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--warmup-seconds", type=float, default=3.0)
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean pause between a client's requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"route weights (default {DEFAULT_MIX})")
+    parser.add_argument("--server", choices=("threaded", "prefork"), default="threaded")
+    parser.add_argument("--chores", type=int, default=200, help="chores to seed")
+    parser.add_argument("--google-latency-ms", type=float, default=0.0)
+    parser.add_argument("--google-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--google-error-rate", type=float, default=0.0)
+    parser.add_argument("--google-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--results-dir", default=os.path.join(ROOT, "benchmarks", "results"))
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-lines", type=int, default=40, help="server log lines shown after 5xx responses")
+    parser.add_argument("--compare", help="previous result JSON to compare with")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    proc: Optional[subprocess.Popen] = None
+    fake: Optional[FakeGoogleServer] = None
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            if args.url:
+                base = args.url.rstrip("/")
+                mix = {r: w for r, w in mix.items() if r in READ_ROUTES}
+                occurrences: List[Tuple[int, str]] = []
+            else:
+                fake = FakeGoogleServer(
+                    latency=args.google_latency_ms / 1000,
+                    jitter=args.google_jitter_ms / 1000,
+                    error_rate=args.google_error_rate,
+                    rate_limit_rate=args.google_rate_limit_rate,
+                    seed=args.seed,
+                ).start()
+                db_url = f"sqlite:///{os.path.join(tmp, 'loadtest.db')}"
+                occurrences = seed_environment(db_url, fake, args.chores)
+                proc, base = start_server(args, db_url, fake.url, tmp)
+            print(f"target {base}, {args.users} users, {args.seconds:.0f}s, mix {mix}")
+
+            recorder = Recorder()
+            start = time.monotonic()
+            measure_from = start + args.warmup_seconds
+            stop_at = measure_from + args.seconds
+            clients = [
+                Client(base, mix, occurrences, recorder, think=args.think_ms / 1000,
+                       measure_from=measure_from, stop_at=stop_at, seed=args.seed + n)
+                for n in range(args.users)
+            ]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            google_calls = dict(fake.stats) if fake else None
+            server_errors = sum(
+                n for statuses in recorder.statuses.values() for code, n in statuses.items() if code.startswith("5")
+            )
+            if proc is not None and server_errors:
+                print(f"{server_errors} server errors; end of the server log:")
+                with open(os.path.join(tmp, "server.log"), encoding="utf-8", errors="replace") as fh:
+                    print("".join(fh.readlines()[-args.log_lines:]))
+        finally:
+            if proc is not None:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=15)
+                except subprocess.TimeoutExpired:  # pragma: no cover
+                    proc.kill()
+            if fake is not None:
+                fake.stop()
+
+    results = summarize(recorder, args.seconds)
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            previous = json.load(fh)["results"]
+    print_report(results, previous)
+
+    if not args.no_save:
+        commit, dirty = git_commit()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        os.makedirs(args.results_dir, exist_ok=True)
+        path = os.path.join(args.results_dir, f"loadtest-{commit}{'-dirty' if dirty else ''}-{stamp}.json")
+        record = {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": stamp,
+            "python": platform.python_version(),
+            "args": vars(args),
+            "google_calls": google_calls,
+            "results": results,
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(record, fh, indent=2)
+        print(f"saved {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
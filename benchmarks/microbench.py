@@ -0,0 +1,451 @@
+"""Micro-benchmarks for service hot paths, with stored regression baselines.
+
+Each case times one hot path in-process against a synthetic SQLite database
+with ``chores`` sized 1k, 100k and 1M rows (``--sizes``):
+
+* ``fetch_chores_week`` - ``chores_service.fetch_chores`` for the coming week
+* ``fetch_chores_all`` - the dashboard's unbounded ``fetch_chores`` (at most
+  100k rows; it materialises every occurrence)
+* ``auto_ignore_overdue`` - the overdue sweep over three days of missed chores
+* ``fetch_meals`` - ``meals_service.fetch_meals`` normalisation and dedup of
+  a calendar mapping with one day per 100 rows and duplicate titles
+* ``user_balance`` / ``leaderboard_week`` / ``redeem`` - ``points_service``
+  over the ledger (``redeem`` is rolled back after every run)
+* ``render_index`` - Jinja rendering of ``index.html`` with the week's chores
+* ``parse_rrule`` - 10k ``_parse_rrule`` calls (size independent, run once)
+
+Every case takes ``--repeat`` samples after one untimed warm-up (fast cases
+loop within a sample); the median per call is what gets compared. Results
+are appended to ``benchmarks/results/microbench.jsonl`` (one line per run
+with the git commit) so they can be tracked over time. ``--save-baseline``
+stores the medians in ``benchmarks/baselines/microbench.json``; later runs
+compare against it and exit with status 1 when a case is slower than its
+baseline by more than ``--tolerance`` (default 25%). Baselines are only meaningful on the
+machine that recorded them, so the file records the host and a warning is
+printed when it differs.
+
+Usage::
+
+    python benchmarks/microbench.py [--sizes 1k,100k,1m] [--cases fetch_chores_week,redeem]
+        [--repeat 5] [--tolerance 0.25] [--save-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from bootstrap.migrations import apply_pending  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines", "microbench.json")
+HISTORY_PATH = os.path.join(ROOT, "benchmarks", "results", "microbench.jsonl")
+DEFAULT_SIZES = "1k,100k,1m"
+USERS = ("Briggs", "Hayes", "Harper", "Rowan")
+RULES = (
+    "RRULE:FREQ=DAILY",
+    "RRULE:FREQ=WEEKLY",
+    "RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "RRULE:FREQ=WEEKLY;BYDAY=SA,SU",
+    "RRULE:FREQ=WEEKLY;BYDAY=WE",
+)
+OVERDUE_DAYS = 3
+
+
+def parse_size(value: str) -> int:
+    """``"1k"`` -> 1000, ``"1m"`` -> 1000000, ``"250"`` -> 250."""
+    value = value.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    return int(float(value.rstrip("km")) * scale)
+
+
+def size_label(rows: int) -> str:
+    if rows >= 1_000_000 and rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows >= 1_000 and rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic database
+# ---------------------------------------------------------------------------
+
+
+def populate(db_url: str, rows: int, *, seed: int = 1) -> None:
+    """Migrate ``db_url`` and generate about ``rows`` chore occurrences.
+
+    One daily chore definition per 1000 rows (at least 10) spans enough days
+    to reach ``rows``, ending six days from today; past occurrences are 85%
+    completed, the last ``OVERDUE_DAYS`` days are left pending for the
+    overdue sweep (see ``scripts/generate_data.py``).
+    """
+    # imported late: it loads config, which must see run_suite's DATABASE_URL
+    from scripts.generate_data import generate
+
+    engine = create_engine(db_url, future=True)
+    apply_pending(engine)
+    defs = max(10, rows // 1000)
+    generate(
+        engine,
+        users=USERS,
+        chores=defs,
+        days=max(1, rows // defs),
+        until=date.today() + timedelta(days=6),
+        rules=("RRULE:FREQ=DAILY",),
+        completion_rate=0.85,
+        overdue_days=OVERDUE_DAYS,
+        prefix="task",
+        seed=seed,
+    )
+    engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+class Case:
+    """One timed hot path; ``setup`` returns ``(prepare, run)`` callables.
+
+    ``prepare`` (untimed, may be None) restores state before every run.
+    """
+
+    def __init__(self, name: str, setup: Callable, *, max_rows: Optional[int] = None, sized: bool = True) -> None:
+        self.name = name
+        self.setup = setup
+        self.max_rows = max_rows
+        self.sized = sized
+
+
+def _week() -> Tuple[date, date]:
+    today = date.today()
+    return today, today + timedelta(days=6)
+
+
+def _setup_fetch_week(app, rows):
+    from services.chores_service import fetch_chores
+
+    start, end = _week()
+    return None, lambda: fetch_chores(start, end)
+
+
+def _setup_fetch_all(app, rows):
+    from services.chores_service import fetch_chores
+
+    return None, lambda: fetch_chores(include_completed=True)
+
+
+def _setup_auto_ignore(app, rows):
+    from db import db
+    from services.chores_service import auto_ignore_overdue
+
+    with db.engine.connect() as conn:
+        last_id = conn.execute(text("SELECT MAX(id) FROM chores")).scalar()
+        overdue = [
+            r[0]
+            for r in conn.execute(
+                text("SELECT id FROM chores WHERE status='pending' AND due_date < :d"),
+                {"d": date.today().isoformat()},
+            )
+        ]
+
+    def prepare():
+        with db.engine.begin() as conn:
+            conn.execute(text("DELETE FROM chores WHERE id > :id"), {"id": last_id})
+            conn.execute(
+                text("UPDATE chores SET status='pending', ignored_at=NULL WHERE id = :id"),
+                [{"id": i} for i in overdue],
+            )
+        db.session.remove()
+
+    return prepare, auto_ignore_overdue
+
+
+def _meal_mapping(rows: int) -> Dict[str, List[str]]:
+    today = date.today()
+    mapping = {}
+    for day in range(max(7, rows // 100)):
+        iso = (today + timedelta(days=day - rows // 200)).isoformat()
+        mapping[iso] = [f"Dinner {day % 37}", f"Lunch {day % 11}", f"Dinner {day % 37}", "Leftovers"]
+    return mapping
+
+
+def _setup_fetch_meals(app, rows):
+    from services import calendar_service, meals_service
+
+    mapping = _meal_mapping(rows)
+    calendar_service.get_meals = lambda: mapping
+    start, end = _week()
+    return None, lambda: meals_service.fetch_meals(start=start, end=end)
+
+
+def _setup_balance(app, rows):
+    from db import db
+    from services.points_service import user_balance
+
+    def run():
+        with db.engine.connect() as conn:
+            return user_balance(conn, USERS[0])
+
+    return None, run
+
+
+def _setup_leaderboard(app, rows):
+    from db import db
+    from services.points_service import leaderboard_week
+
+    today = date.today()
+    start = today - timedelta(days=today.weekday())
+
+    def run():
+        with db.engine.connect() as conn:
+            return leaderboard_week(conn, start, start + timedelta(days=6))
+
+    return None, run
+
+
+def _setup_redeem(app, rows):
+    from db import db
+    from services.points_service import redeem
+
+    with db.engine.connect() as conn:
+        reward_id = conn.execute(text("SELECT id FROM rewards WHERE active=1 ORDER BY cost_points LIMIT 1")).scalar()
+
+    def run():
+        with db.engine.connect() as conn:
+            trans = conn.begin()
+            try:
+                redeem(conn, user=USERS[0], reward_id=reward_id)
+            finally:
+                trans.rollback()
+
+    return None, run
+
+
+def _setup_render_index(app, rows):
+    from flask import render_template
+
+    from services.chores_service import fetch_chores
+    from services.meals_service import MealDTO
+
+    start, end = _week()
+    chores = fetch_chores(start, end)
+    meals = [MealDTO(date=start + timedelta(days=d), title=f"Dinner {d}") for d in range(7)]
+    leaderboard = [(name, 10 * i) for i, name in enumerate(USERS)]
+
+    def run():
+        with app.test_request_context("/"):
+            return render_template(
+                "index.html", chores=chores, meals=meals, today=start, leaderboard=leaderboard, points_enabled=True
+            )
+
+    return None, run
+
+
+def _setup_parse_rrule(app, rows):
+    from services.chores_service import _parse_rrule
+
+    start = date(2025, 1, 1)
+    inputs = [(RULES[i % len(RULES)], start + timedelta(days=i % 365)) for i in range(10_000)]
+
+    def run():
+        for rule, after in inputs:
+            _parse_rrule(rule, after)
+
+    return None, run
+
+
+CASES = {
+    case.name: case
+    for case in (
+        Case("fetch_chores_week", _setup_fetch_week),
+        Case("fetch_chores_all", _setup_fetch_all, max_rows=100_000),
+        Case("auto_ignore_overdue", _setup_auto_ignore),
+        Case("fetch_meals", _setup_fetch_meals),
+        Case("user_balance", _setup_balance),
+        Case("leaderboard_week", _setup_leaderboard),
+        Case("redeem", _setup_redeem),
+        Case("render_index", _setup_render_index),
+        Case("parse_rrule", _setup_parse_rrule, sized=False),
+    )
+}
+
+
+def time_case(prepare, run, repeat: int, min_sample_s: float = 0.05) -> Dict[str, float]:
+    """Median/min/max seconds per call over ``repeat`` samples.
+
+    Cases without ``prepare`` are called in a loop (like ``timeit``'s
+    autorange) until one sample takes ``min_sample_s``, so sub-millisecond
+    paths are not lost in timer and scheduler noise.
+    """
+    if prepare:
+        prepare()
+    t0 = time.perf_counter()
+    run()  # warm-up: caches, compiled statements, template bytecode
+    first = time.perf_counter() - t0
+    number = 1 if prepare else max(1, min(10_000, int(min_sample_s / max(first, 1e-6))))
+    timings = []
+    for _ in range(repeat):
+        if prepare:
+            prepare()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            run()
+        timings.append((time.perf_counter() - t0) / number)
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run_suite(sizes: List[int], names: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Run ``names`` at every size; returns ``{"case@size": timing}``."""
+    tmp = tempfile.mkdtemp(prefix="familyhub-microbench-")
+    db_path = os.path.join(tmp, "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.pop("SKIP_ROUTES", None)
+
+    # app first: models imports db from it
+    from app import app
+    from db import db
+    import logging
+
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("familyhub.sql").setLevel(logging.ERROR)
+    results: Dict[str, Dict[str, float]] = {}
+    ran_unsized = set()
+    for rows in sizes:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        t0 = time.perf_counter()
+        populate(os.environ["DATABASE_URL"], rows)
+        print(f"-- {size_label(rows)} rows (built in {time.perf_counter() - t0:.1f}s)")
+        for name in names:
+            case = CASES[name]
+            if case.max_rows is not None and rows > case.max_rows:
+                continue
+            if not case.sized and name in ran_unsized:
+                continue
+            key = f"{name}@{size_label(rows)}" if case.sized else name
+            with app.app_context():
+                prepare, run = case.setup(app, rows)
+                results[key] = time_case(prepare, run, repeat)
+                db.session.remove()
+            ran_unsized.add(name)
+            print(f"{key:<28} {results[key]['median_s'] * 1000:>10.2f} ms")
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Baselines and history
+# ---------------------------------------------------------------------------
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Keys whose median is more than ``tolerance`` slower than ``baseline``."""
+    regressions = []
+    for key, timing in results.items():
+        old = baseline.get(key)
+        if old and timing["median_s"] > old * (1 + tolerance):
+            regressions.append(key)
+    return regressions
+
+
+def git_commit() -> Tuple[str, bool]:
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True)
+        return sha.stdout.strip(), bool(dirty.stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="chore row counts, e.g. 1k,100k,1m")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated case names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs the baseline (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run's medians as the baseline")
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON lines file results are appended to")
+    args = parser.parse_args(argv)
+
+    names = [n for n in args.cases.split(",") if n]
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (known: {', '.join(CASES)})")
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s]
+
+    results = run_suite(sizes, names, args.repeat)
+    sha, dirty = git_commit()
+    record = {
+        "commit": sha + ("-dirty" if dirty else ""),
+        "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    if args.history:
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record) + "\n")
+
+    medians = {key: timing["median_s"] for key, timing in results.items()}
+    if args.save_baseline:
+        previous = load_baseline(args.baseline) or {}
+        stored = dict(previous.get("medians", {}), **medians)
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump({k: record[k] for k in ("commit", "at", "host", "python")} | {"medians": stored}, fh, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    if baseline.get("host") != record["host"]:
+        print(f"warning: baseline was recorded on {baseline.get('host')!r}, this is {record['host']!r}")
+    regressions = compare(results, baseline.get("medians", {}), args.tolerance)
+    for key in regressions:
+        old = baseline["medians"][key]
+        print(f"REGRESSION {key}: {medians[key] * 1000:.2f} ms vs baseline {old * 1000:.2f} ms")
+    if regressions:
+        return 1
+    print(f"no regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Versioned, checksummed, incremental SQL migrations.
+
+Each ``migrations/NNN_name.sql`` file is applied at most once. Applied files
+are recorded in ``schema_migrations`` together with a SHA-256 checksum of the
+file contents and how long the file took to apply, so re-running the runner
+only executes pending files and non-idempotent DDL (``ALTER TABLE ... ADD
+COLUMN``) never runs twice.
+
+Every file runs inside its own transaction together with its bookkeeping row:
+either the whole file is applied and recorded, or nothing is.
+
+SQLite has no ``ADD COLUMN IF NOT EXISTS``: an ``ALTER TABLE ... ADD COLUMN``
+statement whose column already exists (databases created by
+``db.create_all()``) is skipped instead of failing the file.
+
+SQLite files live directly in ``migrations/``; other dialects use a
+subdirectory named after the SQLAlchemy dialect (``migrations/postgresql/``)
+with the same version numbers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+_BOOKKEEPING_DDL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+_ADD_COLUMN = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)", re.IGNORECASE | re.MULTILINE)
+
+
+class MigrationError(RuntimeError):
+    """Raised when a migration file fails to apply."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single migration file on disk."""
+
+    version: str
+    name: str
+    path: Path
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.path.read_bytes()).hexdigest()
+
+
+def migrations_dir(dialect_name: Optional[str] = None) -> Path:
+    """Return the migrations directory for a SQLAlchemy dialect.
+
+    Dialects with their own SQL flavour keep files in a subdirectory named
+    after the dialect (``migrations/postgresql/``); SQLite uses the top level.
+    """
+    if dialect_name:
+        candidate = MIGRATIONS_DIR / dialect_name
+        if candidate.is_dir():
+            return candidate
+    return MIGRATIONS_DIR
+
+
+def discover(directory: Optional[Path] = None) -> List[Migration]:
+    """Return migration files in ``directory`` ordered by version."""
+    directory = Path(directory or MIGRATIONS_DIR)
+    found = []
+    for path in sorted(directory.glob("*.sql")):
+        version = path.stem.split("_", 1)[0]
+        found.append(Migration(version=version, name=path.stem, path=path))
+    return found
+
+
+def split_statements(sql: str) -> List[str]:
+    """Split a SQL script into complete statements.
+
+    Uses :func:`sqlite3.complete_statement` so semicolons inside string
+    literals and ``CREATE TRIGGER ... BEGIN ... END`` bodies are handled.
+    """
+    statements: List[str] = []
+    buf = ""
+    for line in sql.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            stmt = buf.strip()
+            if _has_code(stmt):
+                statements.append(stmt)
+            buf = ""
+    if _has_code(buf):
+        statements.append(buf.strip())
+    return statements
+
+
+def _has_code(chunk: str) -> bool:
+    lines = (line.split("--", 1)[0].strip() for line in chunk.splitlines())
+    return any(line and line != ";" for line in lines)
+
+
+def ensure_bookkeeping(conn) -> None:
+    conn.exec_driver_sql(_BOOKKEEPING_DDL)
+
+
+def applied_migrations(conn) -> Dict[str, str]:
+    """Return ``{version: checksum}`` for every recorded migration."""
+    ensure_bookkeeping(conn)
+    rows = conn.execute(text("SELECT version, checksum FROM schema_migrations"))
+    return {row[0]: row[1] for row in rows}
+
+
+def pending_migrations(engine, directory: Optional[Path] = None) -> List[Migration]:
+    """Return migrations that have not been applied yet, in order."""
+    with engine.begin() as conn:
+        applied = applied_migrations(conn)
+    directory = directory or migrations_dir(engine.dialect.name)
+    return [m for m in discover(directory) if m.version not in applied]
+
+
+def _begin(conn) -> None:
+    # pysqlite only opens a transaction implicitly before DML; start one
+    # explicitly so DDL in the file is rolled back together with it.
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("BEGIN")
+
+
+def _column_exists(conn, statement: str) -> bool:
+    """True for a SQLite ``ADD COLUMN`` statement whose column is already there."""
+    if conn.dialect.name != "sqlite":
+        return False
+    match = _ADD_COLUMN.search(statement)
+    if not match:
+        return False
+    table, column = match.groups()
+    columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+    return column in columns
+
+
+def _record(conn, migration: Migration, duration_ms: int) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO schema_migrations(version, name, checksum, duration_ms) "
+            "VALUES(:v, :n, :c, :d)"
+        ),
+        {"v": migration.version, "n": migration.name, "c": migration.checksum, "d": duration_ms},
+    )
+
+
+def apply_pending(engine, directory: Optional[Path] = None) -> List[Migration]:
+    """Apply every pending migration, each in its own transaction.
+
+    Already-applied versions are skipped via a single lookup of the recorded
+    versions. A checksum mismatch on an applied file is logged but the file is
+    not re-run. Returns the migrations applied by this call.
+    """
+    directory = directory or migrations_dir(engine.dialect.name)
+    with engine.begin() as conn:
+        applied = applied_migrations(conn)
+
+    done: List[Migration] = []
+    for migration in discover(directory):
+        recorded = applied.get(migration.version)
+        if recorded is not None:
+            if recorded != migration.checksum:
+                logger.warning(
+                    "Migration %s changed after it was applied (checksum mismatch)", migration.name
+                )
+            continue
+        started = time.perf_counter()
+        try:
+            with engine.begin() as conn:
+                _begin(conn)
+                for statement in split_statements(migration.sql):
+                    if _column_exists(conn, statement):
+                        logger.info("%s: column already exists, skipping %s", migration.name, statement)
+                        continue
+                    conn.exec_driver_sql(statement)
+                duration_ms = int((time.perf_counter() - started) * 1000)
+                _record(conn, migration, duration_ms)
+        except Exception as exc:
+            raise MigrationError(f"Failed applying {migration.name}: {exc}") from exc
+        logger.info("Applied %s in %d ms", migration.name, duration_ms)
+        done.append(migration)
+    return done
+
+
+def baseline(engine, up_to: str, directory: Optional[Path] = None) -> List[Migration]:
+    """Record migrations up to ``up_to`` as applied without running them.
+
+    For databases created before ``schema_migrations`` existed, where the
+    files were already executed by hand.
+    """
+    directory = directory or migrations_dir(engine.dialect.name)
+    marked: List[Migration] = []
+    with engine.begin() as conn:
+        applied = applied_migrations(conn)
+        for migration in discover(directory):
+            if migration.version > up_to or migration.version in applied:
+                continue
+            _record(conn, migration, 0)
+            marked.append(migration)
+    return marked
+
+
+def schema_is_current(engine, directory: Optional[Path] = None) -> bool:
+    """Cheap startup check: every migration file has been recorded.
+
+    Costs a directory listing and one indexed query; returns False when the
+    bookkeeping table does not exist yet.
+    """
+    directory = directory or migrations_dir(engine.dialect.name)
+    versions = {m.version for m in discover(directory)}
+    try:
+        with engine.connect() as conn:
+            recorded = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+    except Exception:
+        return False
+    return versions <= recorded
@@ -8,8 +8,12 @@ from typing import Iterable
 logger = logging.getLogger(__name__)
 
 
-def validate_startup(required_envs: Iterable[str] | None = None) -> None:
-    """Validate runtime configuration and exit with explicit codes."""
+def validate_startup(required_envs: Iterable[str] | None = None, *, check_port: bool = True) -> None:
+    """Validate runtime configuration and exit with explicit codes.
+
+    ``check_port=False`` skips the bind test when the listening socket is
+    inherited from systemd (it is already bound, by design).
+    """
     required_envs = list(required_envs or [])
 
     if sys.version_info < (3, 11):
@@ -23,14 +27,15 @@ def validate_startup(required_envs: Iterable[str] | None = None) -> None:
 
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
-    sock = socket.socket()
-    try:
-        sock.bind((host, port))
-    except OSError:
-        logger.error("Port %s is unavailable on host %s", port, host)
-        sys.exit(3)
-    finally:
-        sock.close()
+    if check_port:
+        sock = socket.socket()
+        try:
+            sock.bind((host, port))
+        except OSError:
+            logger.error("Port %s is unavailable on host %s", port, host)
+            sys.exit(3)
+        finally:
+            sock.close()
 
     try:
         tmpdir = tempfile.gettempdir()
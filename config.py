@@ -27,9 +27,89 @@ class Settings:
     calendar_id: str | None = os.getenv("FAMILYHUB_CALENDAR_ID")
     # Path to the Google service account credentials file
     google_credentials_path: str | None = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    # Base URL replacing the Google API hosts, e.g. benchmarks/fake_google.py (no credentials needed)
+    google_api_endpoint: str | None = os.getenv("FAMILYHUB_GOOGLE_API_ENDPOINT")
     # Points / rewards feature flags
     points_enabled: bool = os.getenv("POINTS_ENABLED", "true").lower() == "true"
     points_default: int = int(os.getenv("POINTS_DEFAULT", "1"))
+    # Chore archival: settled occurrences older than this move to chores_archive
+    archive_after_days: int = int(os.getenv("FAMILYHUB_ARCHIVE_AFTER_DAYS", "90"))
+    archive_batch_size: int = int(os.getenv("FAMILYHUB_ARCHIVE_BATCH_SIZE", "500"))
+    # Optional separate SQLite file for the archive (ATTACHed as "archive")
+    archive_database_path: str | None = os.getenv("FAMILYHUB_ARCHIVE_DB")
+    # Rows per DELETE batch of the orphan/fake-id cleanup (scripts/cleanup_chores.py)
+    cleanup_batch_size: int = int(os.getenv("FAMILYHUB_CLEANUP_BATCH_SIZE", "500"))
+    # SQLite connection profile, applied on every new connection (see db.py)
+    sqlite_journal_mode: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    sqlite_synchronous: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    sqlite_mmap_size: int = int(os.getenv("SQLITE_MMAP_SIZE", str(64 * 1024 * 1024)))
+    # Negative values are KiB (SQLite convention): -16000 ~= 16 MB page cache
+    sqlite_cache_size: int = int(os.getenv("SQLITE_CACHE_SIZE", "-16000"))
+    sqlite_temp_store: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    sqlite_busy_timeout_ms: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    sqlite_foreign_keys: bool = os.getenv("SQLITE_FOREIGN_KEYS", "true").lower() == "true"
+    # WSGI serving mode for main.py: "dev", "threaded" or "prefork" (gunicorn)
+    server_mode: str = os.getenv("FAMILYHUB_SERVER", "threaded")
+    server_threads: int = int(os.getenv("FAMILYHUB_SERVER_THREADS", "8"))
+    server_workers: int = int(os.getenv("FAMILYHUB_SERVER_WORKERS", "2"))
+    # Seconds to let in-flight requests finish after SIGTERM
+    graceful_timeout: float = float(os.getenv("FAMILYHUB_GRACEFUL_TIMEOUT", "20"))
+    # prefork only: warm imports/templates and gc.freeze() in the master before forking
+    preload: bool = os.getenv("FAMILYHUB_PRELOAD", "true").lower() == "true"
+    # Run app.run_startup_tasks() (schema check, overdue sweep) from main()
+    startup_tasks: bool = os.getenv("FAMILYHUB_STARTUP_TASKS", "true").lower() == "true"
+    # Prefetch meals/task list, compile templates and touch hot tables before /readyz passes
+    warmup: bool = os.getenv("FAMILYHUB_WARMUP", "true").lower() == "true"
+    warmup_threads: int = int(os.getenv("FAMILYHUB_WARMUP_THREADS", "4"))
+    # Background health probe intervals (seconds): cheap probes (liveness, own
+    # socket) and slow ones (DNS, SQLite check, Chromium process walk)
+    health_probe_interval: float = float(os.getenv("FAMILYHUB_HEALTH_PROBE_INTERVAL", "5"))
+    health_slow_probe_interval: float = float(os.getenv("FAMILYHUB_HEALTH_SLOW_PROBE_INTERVAL", "30"))
+    # Incremental integrity checks of DB_PATH (health/integrity.py): local hours
+    # "START-END" in which slices run, pages per slice, seconds between slices
+    integrity_idle_hours: str = os.getenv("FAMILYHUB_INTEGRITY_IDLE_HOURS", "2-5")
+    integrity_slice_pages: int = int(os.getenv("FAMILYHUB_INTEGRITY_SLICE_PAGES", "2000"))
+    integrity_interval: float = float(os.getenv("FAMILYHUB_INTEGRITY_INTERVAL", "300"))
+    # Standalone health server: worker threads, of which this many are kept for /healthz
+    health_server_threads: int = int(os.getenv("FAMILYHUB_HEALTH_SERVER_THREADS", "4"))
+    health_liveness_reserved: int = int(os.getenv("FAMILYHUB_HEALTH_LIVENESS_RESERVED", "1"))
+    # systemd watchdog tied to request serving (runtime/watchdog.py): stop petting
+    # ("skip") or send WATCHDOG=trigger once a request has been stuck this long
+    watchdog_stall_seconds: float = float(os.getenv("FAMILYHUB_WATCHDOG_STALL_SECONDS", "30"))
+    watchdog_probe_path: str = os.getenv("FAMILYHUB_WATCHDOG_PROBE_PATH", "/healthz")
+    watchdog_probe_interval: float = float(os.getenv("FAMILYHUB_WATCHDOG_PROBE_INTERVAL", "10"))
+    watchdog_action: str = os.getenv("FAMILYHUB_WATCHDOG_ACTION", "trigger")
+    # Stall detector (runtime/stall_detector.py): dump thread stacks of requests
+    # running longer than the threshold to a rotating log, rate-limited
+    stall_detector: bool = os.getenv("FAMILYHUB_STALL_DETECTOR", "true").lower() == "true"
+    stall_threshold_seconds: float = float(os.getenv("FAMILYHUB_STALL_THRESHOLD_SECONDS", "5"))
+    stall_sample_interval: float = float(os.getenv("FAMILYHUB_STALL_SAMPLE_INTERVAL", "1"))
+    stall_max_dumps_per_minute: int = int(os.getenv("FAMILYHUB_STALL_MAX_DUMPS_PER_MINUTE", "6"))
+    stall_log_path: str = os.getenv("FAMILYHUB_STALL_LOG", "logs/stalls.log")
+    # Request tracing (runtime/tracing.py): JSONL trace trees and/or a Server-Timing header
+    tracing: bool = os.getenv("FAMILYHUB_TRACING", "false").lower() == "true"
+    trace_log_path: str = os.getenv("FAMILYHUB_TRACE_LOG", "logs/traces.jsonl")
+    server_timing: bool = os.getenv("FAMILYHUB_SERVER_TIMING", "false").lower() == "true"
+    # SQL audit (runtime/sql_audit.py): slow statement log threshold (0 disables)
+    slow_query_ms: float = float(os.getenv("FAMILYHUB_SLOW_QUERY_MS", "100"))
+    # Statement shape repeated this often in one request is reported as N+1 (0 disables)
+    sql_repeat_threshold: int = int(os.getenv("FAMILYHUB_SQL_REPEAT_THRESHOLD", "5"))
+    # Token required by diagnostic /admin endpoints (disabled when unset)
+    admin_token: str | None = os.getenv("FAMILYHUB_ADMIN_TOKEN")
+    # Profiler captures (runtime/profiler.py): directory, files kept, SIGUSR2 sample length
+    profile_dir: str = os.getenv("FAMILYHUB_PROFILE_DIR", "logs/profiles")
+    profile_keep: int = int(os.getenv("FAMILYHUB_PROFILE_KEEP", "20"))
+    profile_signal_seconds: float = float(os.getenv("FAMILYHUB_PROFILE_SIGNAL_SECONDS", "10"))
+    # tracemalloc mode (runtime/memtrace.py, started from /admin/memory/start)
+    memtrace_interval: float = float(os.getenv("FAMILYHUB_MEMTRACE_INTERVAL", "300"))
+    memtrace_frames: int = int(os.getenv("FAMILYHUB_MEMTRACE_FRAMES", "10"))
+    memtrace_top: int = int(os.getenv("FAMILYHUB_MEMTRACE_TOP", "20"))
+    # Heap snapshot files: own directory and count, so they never rotate profiles out
+    memtrace_dir: str = os.getenv("FAMILYHUB_MEMTRACE_DIR", "logs/memtrace")
+    memtrace_keep: int = int(os.getenv("FAMILYHUB_MEMTRACE_KEEP", "24"))
+    # Resident memory history: sample interval in seconds (0 disables) and samples kept
+    rss_sample_interval: float = float(os.getenv("FAMILYHUB_RSS_SAMPLE_INTERVAL", "60"))
+    rss_history_size: int = int(os.getenv("FAMILYHUB_RSS_HISTORY_SIZE", "1440"))
 
 
 def get_settings() -> Settings:
@@ -1,9 +1,10 @@
 import datetime as _dt
 import os
 import socket
-import sqlite3
 import time
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
+
+from health.integrity import fast_check
 
 
 def liveness_check() -> Tuple[bool, Dict[str, float]]:
@@ -34,15 +35,10 @@ def _check_socket(host: str, port: int, timeout: float = 0.1) -> Tuple[bool, str
 
 
 def _check_db(path: str) -> Tuple[bool, str]:
+    # Header check plus the persisted verdict of the incremental checker
+    # (health.integrity); full quick_check passes run in idle hours instead.
     try:
-        if not os.path.exists(path):
-            return False, "missing"
-        con = sqlite3.connect(path, timeout=0.2)
-        try:
-            con.execute("PRAGMA quick_check")
-        finally:
-            con.close()
-        return True, "ok"
+        return fast_check(path)
     except Exception as exc:
         return False, str(exc)
 
@@ -55,29 +51,29 @@ def _check_dns(host: str) -> Tuple[bool, str]:
         return False, str(exc)
 
 
-def readiness_check(host: str, port: int) -> Tuple[bool, Dict[str, str]]:
-    """Readiness check with optional dependency probes.
+def readiness_probes(host: str, port: int) -> Dict[str, Callable[[], Tuple[bool, str]]]:
+    """Individual readiness probes, keyed by the name used in ``details``.
 
     - Connect to the provided host/port if given.
-    - If DB_PATH env is set, ensure the SQLite file is healthy.
+    - If DB_PATH env is set, check the SQLite header and last integrity verdict.
     - Resolve an external hostname to verify DNS.
     """
-    details: Dict[str, str] = {}
-    ok = True
-
+    probes: Dict[str, Callable[[], Tuple[bool, str]]] = {}
     if host and port:
-        sock_ok, msg = _check_socket(host, port)
-        details["socket"] = msg
-        ok &= sock_ok
-
+        probes["socket"] = lambda: _check_socket(host, port)
     db_path = os.environ.get("DB_PATH")
     if db_path:
-        db_ok, msg = _check_db(db_path)
-        details["db"] = msg
-        ok &= db_ok
+        probes["db"] = lambda: _check_db(db_path)
+    probes["dns"] = lambda: _check_dns("www.google.com")
+    return probes
 
-    dns_ok, msg = _check_dns("www.google.com")
-    details["dns"] = msg
-    ok &= dns_ok
 
+def readiness_check(host: str, port: int) -> Tuple[bool, Dict[str, str]]:
+    """Readiness check running every probe from :func:`readiness_probes`."""
+    details: Dict[str, str] = {}
+    ok = True
+    for name, probe in readiness_probes(host, port).items():
+        probe_ok, msg = probe()
+        details[name] = msg
+        ok &= probe_ok
     return bool(ok), details
@@ -0,0 +1,210 @@
+"""Incremental SQLite integrity checking with a persisted verdict.
+
+``PRAGMA quick_check`` over the whole file costs time proportional to the
+database size, which is too much for every readiness probe. Instead:
+
+* the hot path (:func:`fast_check`) validates the 100-byte file header and
+  reads the last persisted verdict - no table pages are touched;
+* :class:`IntegrityChecker.run_slice` runs ``PRAGMA quick_check(<table>)`` on
+  a few tables at a time, bounded by a page budget per slice, and is only
+  scheduled during idle hours (``Settings.integrity_idle_hours``). A cursor in
+  the verdict file lets the next slice continue where the previous one
+  stopped, so a full pass is spread over several slices. Per-table page
+  counts come from ``dbstat``, which itself reads every page, so they are
+  measured once per full pass (when the cursor wraps) and kept in the verdict;
+* results are written to ``<db>.integrity.json`` next to the database (not
+  inside it, so a damaged database cannot hide its own verdict).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import struct
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("familyhub.health.integrity")
+
+HEADER_MAGIC = b"SQLite format 3\x00"
+
+
+def verdict_path(db_path: str) -> str:
+    return f"{db_path}.integrity.json"
+
+
+def check_header(db_path: str) -> Tuple[bool, str]:
+    """Validate the SQLite file header without opening the database."""
+    try:
+        size = os.path.getsize(db_path)
+        with open(db_path, "rb") as fh:
+            header = fh.read(100)
+    except OSError as exc:
+        return False, str(exc)
+    if size == 0:
+        return True, "empty"
+    if len(header) < 100 or not header.startswith(HEADER_MAGIC):
+        return False, "bad header magic"
+    page_size = struct.unpack(">H", header[16:18])[0]
+    page_size = 65536 if page_size == 1 else page_size
+    if page_size < 512 or page_size & (page_size - 1):
+        return False, f"invalid page size {page_size}"
+    if size % page_size:
+        return False, f"file size {size} is not a multiple of page size {page_size}"
+    return True, "ok"
+
+
+def load_verdict(db_path: str) -> Dict[str, Any]:
+    try:
+        with open(verdict_path(db_path), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_verdict(db_path: str, verdict: Dict[str, Any]) -> None:
+    # Unique temp file per writer: two processes never publish each other's
+    # half-written verdict
+    path = verdict_path(db_path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".integrity-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(verdict, fh, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+def fast_check(db_path: str) -> Tuple[bool, str]:
+    """Hot-path check: header validation plus the last persisted verdict."""
+    if not os.path.exists(db_path):
+        return False, "missing"
+    ok, msg = check_header(db_path)
+    if not ok:
+        return False, msg
+    verdict = load_verdict(db_path)
+    bad = sorted(t for t, r in verdict.get("tables", {}).items() if r.get("result") != "ok")
+    if bad:
+        return False, f"integrity errors in {', '.join(bad)}"
+    if verdict.get("last_full_pass"):
+        return True, f"ok (full pass {verdict['last_full_pass']})"
+    return True, "ok (no full pass yet)"
+
+
+def in_idle_window(hours: str, now: Optional[datetime] = None) -> bool:
+    """``hours`` is ``"START-END"`` in local hours, e.g. ``"2-5"`` or ``"23-4"``."""
+    start, end = (int(part) for part in hours.split("-", 1))
+    hour = (now or datetime.now()).hour
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class IntegrityChecker:
+    """Run ``quick_check`` one table slice at a time against ``db_path``."""
+
+    def __init__(self, db_path: str, *, page_budget: int = 2000, timeout: float = 1.0) -> None:
+        self.db_path = db_path
+        self.page_budget = page_budget
+        self.timeout = timeout
+
+    def _connect(self) -> sqlite3.Connection:
+        uri = f"file:{self.db_path}?mode=ro"
+        return sqlite3.connect(uri, uri=True, timeout=self.timeout)
+
+    @staticmethod
+    def _count_pages(con: sqlite3.Connection, tables: List[str]) -> Dict[str, int]:
+        """Page count per table (table plus indexes) from ``dbstat``.
+
+        Reads every page of the database; empty when ``dbstat`` is missing.
+        """
+        try:
+            pages = dict(
+                con.execute(
+                    "SELECT s.tbl_name, COUNT(*) FROM dbstat d "
+                    "JOIN sqlite_schema s ON s.name = d.name GROUP BY s.tbl_name"
+                ).fetchall()
+            )
+        except sqlite3.Error:
+            return {}
+        return {t: pages.get(t, 0) for t in tables}
+
+    def _table_pages(self, con: sqlite3.Connection, verdict: Dict[str, Any]) -> List[Tuple[str, Optional[int]]]:
+        """Tables with their page count, in name order.
+
+        Counts are refreshed into ``verdict["pages"]`` at the start of a full
+        pass and reused by the later slices of that pass. Tables without a
+        count (no ``dbstat``, or created mid-pass) count as a whole slice.
+        """
+        tables = [
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_schema WHERE type = 'table' ORDER BY name"
+            )
+        ]
+        if not verdict.get("cursor") or "pages" not in verdict:
+            verdict["pages"] = self._count_pages(con, tables)
+        return [(t, verdict["pages"].get(t)) for t in tables]
+
+    def run_slice(self) -> Dict[str, Any]:
+        """Check the next tables within the page budget and persist the verdict."""
+        verdict = load_verdict(self.db_path)
+        results: Dict[str, Any] = verdict.setdefault("tables", {})
+        cursor = verdict.get("cursor", "")
+        started = time.perf_counter()
+        checked: List[str] = []
+        con = self._connect()
+        try:
+            tables = self._table_pages(con, verdict)
+            remaining = [(t, p) for t, p in tables if t > cursor] or tables
+            # Forget tables that no longer exist
+            for name in set(results) - {t for t, _ in tables}:
+                results.pop(name)
+            spent = 0
+            for name, pages in remaining:
+                if checked and (pages is None or spent + pages > self.page_budget):
+                    break
+                rows = [r[0] for r in con.execute(f'PRAGMA quick_check("{name}")')]
+                results[name] = {
+                    "result": "ok" if rows == ["ok"] else "; ".join(rows[:10]),
+                    "checked_at": datetime.now(timezone.utc).isoformat(),
+                }
+                spent += pages or 0
+                checked.append(name)
+        finally:
+            con.close()
+
+        last = tables[-1][0] if tables else ""
+        if not checked or checked[-1] == last:
+            verdict["cursor"] = ""
+            verdict["last_full_pass"] = datetime.now(timezone.utc).isoformat()
+        else:
+            verdict["cursor"] = checked[-1]
+        verdict["last_slice"] = {
+            "tables": checked,
+            "ms": int((time.perf_counter() - started) * 1000),
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        save_verdict(self.db_path, verdict)
+        bad = [t for t in checked if results[t]["result"] != "ok"]
+        if bad:
+            logger.error("integrity: errors in %s", bad)
+        return verdict
+
+
+def scheduled_slice(db_path: str, settings) -> Tuple[bool, str]:
+    """Health-monitor probe: run one slice when inside the idle window."""
+    if not os.path.exists(db_path):
+        return False, "missing"
+    if not in_idle_window(settings.integrity_idle_hours):
+        return True, "outside idle window"
+    checker = IntegrityChecker(db_path, page_budget=settings.integrity_slice_pages)
+    verdict = checker.run_slice()
+    return True, f"checked {', '.join(verdict['last_slice']['tables']) or 'nothing'}"
@@ -0,0 +1,189 @@
+"""Background health monitor with cached probe results.
+
+Probes such as the Chromium process walk, DNS resolution and the SQLite check
+are too expensive to run on every ``/healthz`` / ``/readyz`` hit. A
+:class:`HealthMonitor` runs each registered probe on its own interval in its
+own daemon thread and keeps the latest result with timestamps, so the
+endpoints only serialize :meth:`HealthMonitor.snapshot` output.
+
+A result older than ``stale_factor`` intervals (probe thread stuck or dead)
+is reported as failing instead of being served forever.
+
+With ``publish_path`` set, every new result is also written to a JSON file.
+Prefork workers read the master's expensive probes from there
+(:func:`published_probe`) instead of running them again in every process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("familyhub.health.monitor")
+
+ProbeFn = Callable[[], Tuple[bool, Any]]
+
+
+@dataclass
+class ProbeResult:
+    ok: bool
+    details: Any
+    checked_at: float  # time.time() of completion
+    duration_ms: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "details": self.details,
+            "checked_at": datetime.fromtimestamp(self.checked_at, timezone.utc).isoformat(),
+            "age_s": round(time.time() - self.checked_at, 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+
+
+@dataclass
+class Probe:
+    name: str
+    fn: ProbeFn
+    interval: float
+    next_run: float = 0.0
+    result: Optional[ProbeResult] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class HealthMonitor:
+    """Run probes periodically in the background and cache their results."""
+
+    def __init__(self, *, stale_factor: float = 3.0, publish_path: Optional[str] = None) -> None:
+        self.stale_factor = stale_factor
+        self.publish_path = publish_path
+        self._publish_lock = threading.Lock()
+        self._probes: Dict[str, Probe] = {}
+        self._stop = threading.Event()
+        self._threads: Dict[str, threading.Thread] = {}
+
+    def add(self, name: str, fn: ProbeFn, interval: float) -> None:
+        """Register ``fn`` (returning ``(ok, details)``) to run every ``interval`` seconds."""
+        self._probes[name] = Probe(name=name, fn=fn, interval=max(interval, 0.1))
+
+    def run_probe(self, name: str) -> ProbeResult:
+        """Run one probe now and cache its result."""
+        probe = self._probes[name]
+        with probe.lock:
+            t0 = time.perf_counter()
+            try:
+                ok, details = probe.fn()
+            except Exception as exc:
+                logger.warning("health probe %s raised: %s", name, exc)
+                ok, details = False, {"error": str(exc)}
+            probe.result = ProbeResult(
+                ok=bool(ok),
+                details=details,
+                checked_at=time.time(),
+                duration_ms=(time.perf_counter() - t0) * 1000,
+            )
+            probe.next_run = time.monotonic() + probe.interval
+            result = probe.result
+        if self.publish_path:
+            self._publish()
+        return result
+
+    def result(self, name: str) -> ProbeResult:
+        """Latest cached result; probes synchronously only if never run."""
+        probe = self._probes[name]
+        if probe.result is None:
+            return self.run_probe(name)
+        result = probe.result
+        age = time.time() - result.checked_at
+        if age > probe.interval * self.stale_factor:
+            return ProbeResult(
+                ok=False,
+                details={"error": f"stale result ({age:.0f}s old)", "last": result.details},
+                checked_at=result.checked_at,
+                duration_ms=result.duration_ms,
+            )
+        return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: self.result(name).as_dict() for name in self._probes}
+
+    def _publish(self) -> None:
+        data = {
+            name: {"ok": p.result.ok, "details": p.result.details, "checked_at": p.result.checked_at}
+            for name, p in self._probes.items()
+            if p.result is not None
+        }
+        directory = os.path.dirname(self.publish_path) or "."
+        with self._publish_lock:
+            try:
+                fd, tmp = tempfile.mkstemp(dir=directory, prefix=".health-", suffix=".tmp")
+            except OSError as exc:
+                logger.warning("health monitor: cannot publish results to %s: %s", self.publish_path, exc)
+                return
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(data, fh, default=str)
+                os.replace(tmp, self.publish_path)
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("health monitor: cannot publish results to %s: %s", self.publish_path, exc)
+                with contextlib.suppress(OSError):
+                    os.remove(tmp)
+
+    def _loop(self, name: str) -> None:
+        probe = self._probes[name]
+        while not self._stop.is_set():
+            delay = probe.next_run - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+                continue
+            self.run_probe(name)
+
+    def start(self) -> "HealthMonitor":
+        """Start one daemon thread per probe so a slow probe never delays the others."""
+        self._stop.clear()
+        for name in self._probes:
+            thread = self._threads.get(name)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(
+                    target=self._loop, args=(name,), name=f"familyhub-health-{name}", daemon=True
+                )
+                self._threads[name] = thread
+                thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        for thread in self._threads.values():
+            thread.join(timeout)
+        self._threads.clear()
+
+
+def published_probe(path: str, name: str, max_age: float) -> ProbeFn:
+    """Probe returning probe ``name`` from another process's published results.
+
+    Fails when the file or the probe is missing, or the result is older than
+    ``max_age`` seconds (the publishing monitor is stuck or gone).
+    """
+
+    def probe() -> Tuple[bool, Any]:
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entry = json.load(fh).get(name)
+        except (OSError, ValueError):
+            return False, {"error": "no published result"}
+        if entry is None:
+            return False, {"error": "no published result"}
+        age = time.time() - entry["checked_at"]
+        if age > max_age:
+            return False, {"error": f"stale published result ({age:.0f}s old)", "last": entry["details"]}
+        return entry["ok"], entry["details"]
+
+    return probe
@@ -0,0 +1,83 @@
+"""Concurrent standalone health server and per-endpoint latency counters.
+
+Used by ``app_health.setup_health`` when there is no web app to attach the
+endpoints to. Connections are handled on the bounded thread pool shared with
+the WSGI server (``runtime.thread_pool``). Endpoints other than liveness may
+only occupy ``threads - reserved`` workers at a time; beyond that they get an
+immediate 503, so the watchdog's ``/healthz`` always finds a free worker and
+never queues behind slow readiness probes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from http.server import HTTPServer
+from typing import Any, Dict
+
+from runtime.thread_pool import ThreadPoolMixIn
+
+
+class LatencyStats:
+    """Thread-safe count / error / total / max latency per endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, endpoint: str, seconds: float, status: int) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            entry = self._stats.setdefault(
+                endpoint, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            )
+            entry["count"] += 1
+            entry["errors"] += status >= 500
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["last_ms"] = ms
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            out = {}
+            for endpoint, entry in self._stats.items():
+                out[endpoint] = {
+                    "count": int(entry["count"]),
+                    "errors": int(entry["errors"]),
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                    "last_ms": round(entry["last_ms"], 3),
+                }
+            return out
+
+
+class PooledHTTPServer(ThreadPoolMixIn, HTTPServer):
+    """``HTTPServer`` handling each connection on a bounded thread pool."""
+
+    def __init__(self, server_address, handler, *, threads: int = 4, reserved: int = 1) -> None:
+        super().__init__(server_address, handler)
+        self.init_pool(max(2, threads), "familyhub-health-http")
+        self.reserved = min(max(1, reserved), self.threads - 1)
+        self._shared_slots = threading.BoundedSemaphore(self.threads - self.reserved)
+
+    def try_acquire_shared(self) -> bool:
+        """Claim a worker for a non-liveness endpoint without waiting."""
+        return self._shared_slots.acquire(blocking=False)
+
+    def release_shared(self) -> None:
+        self._shared_slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.shutdown_pool()
+
+
+def timed(stats: LatencyStats, endpoint: str, fn, *args) -> tuple[str, int]:
+    """Call ``fn(*args)`` returning ``(body, status)`` and record its latency."""
+    t0 = time.perf_counter()
+    status = 500
+    try:
+        body, status = fn(*args)
+        return body, status
+    finally:
+        stats.record(endpoint, time.perf_counter() - t0, status)
@@ -26,6 +26,7 @@ from flask import (
 )
 from sqlalchemy import text
 from db import db
+from sql_compat import insert_ignore, upsert
 from calendar_api import get_meals  # legacy JSON endpoint still uses mapping
 import routes
 from services.chores_service import (
@@ -36,6 +37,7 @@ from services.meals_service import MealDTO
 from services import points_service
 from config import get_settings
 from models import ChoreTemplate
+from runtime.tracing import span
 from services.schedule_utils import (
     WK,
     BY,
@@ -115,21 +117,34 @@ def index():
         except Exception:  # pragma: no cover - points tables may be missing
             leaderboard = []
 
-    return render_template(
-        "index.html",
-        chores=chores_today,
-        meals=meals,
-        today=today,
-        leaderboard=leaderboard,
-        points_enabled=settings.points_enabled,
-    )
+    with span("render", template="index.html"):
+        return render_template(
+            "index.html",
+            chores=chores_today,
+            meals=meals,
+            today=today,
+            leaderboard=leaderboard,
+            points_enabled=settings.points_enabled,
+        )
 
 
 @bp.route("/chores")
 def view_chores():
-    """Renders the page that displays all chores, including completed ones."""
+    """Renders the page that displays all chores, including completed ones.
+
+    Optional ``start``/``end`` query args (ISO dates) select a history range;
+    ranges reaching past the archive cutoff include archived occurrences.
+    """
     logger.info("view_chores: loading all chores (include completed)")
-    chores: list[ChoreDTO] = routes.fetch_chores(include_completed=True)
+    kwargs = {}
+    for arg in ("start", "end"):
+        value = request.args.get(arg)
+        if value:
+            try:
+                kwargs[arg] = date.fromisoformat(value)
+            except ValueError:
+                return (f"Invalid {arg} date", 400)
+    chores: list[ChoreDTO] = routes.fetch_chores(include_completed=True, **kwargs)
     logger.info("view_chores: loaded %d chores", len(chores))
     return render_template("chores.html", chores=chores)
 
@@ -300,17 +315,20 @@ def complete_chore_route(chore_id):
     # Update local cache and award points idempotently
     with db.engine.begin() as conn:
         if post_due:
-            conn.execute(text("""
-                INSERT INTO chore_metadata(task_id, last_due_iso) VALUES(:id,:d)
-                ON CONFLICT(task_id) DO UPDATE SET last_due_iso=excluded.last_due_iso
-            """), {"id": chore_id, "d": post_due[:10]})
+            upsert(
+                conn,
+                "chore_metadata",
+                {"task_id": chore_id, "last_due_iso": post_due[:10]},
+                index_elements=["task_id"],
+            )
         if user and due_iso:
             pts = points_service.get_chore_points(conn, chore_id, fallback=1)
             occurrence_key = f"{chore_id}:{due_iso}"
-            conn.execute(text("""
-                INSERT OR IGNORE INTO points_ledger(user_name, task_id, points, kind, occurrence_key)
-                VALUES(:u, :t, :p, 'earn', :ok)
-            """), {"u": user, "t": chore_id, "p": pts, "ok": occurrence_key})
+            insert_ignore(
+                conn,
+                "points_ledger",
+                {"user_name": user, "task_id": chore_id, "points": pts, "kind": "earn", "occurrence_key": occurrence_key},
+            )
     return ("", 204)
 
 
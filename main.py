@@ -3,13 +3,21 @@
 import logging
 import os
 import time
-from werkzeug.serving import make_server
 
-from app import app  # noqa: E402
+from app import app, run_startup_tasks  # noqa: E402
 import routes  # noqa: F401,E402
 from app_health import setup_health  # noqa: E402
 from bootstrap.validate_startup import validate_startup  # noqa: E402
+from config import get_settings  # noqa: E402
+from runtime.serving import serve  # noqa: E402
 from runtime.sdnotify_heartbeat import SdNotifyHeartbeat  # noqa: E402
+from runtime.systemd_socket import listen_fds  # noqa: E402
+from runtime.warmup import start_warmup  # noqa: E402
+from runtime.watchdog import build_guard  # noqa: E402
+from runtime.inflight import tracker  # noqa: E402
+from runtime.stall_detector import start_stall_detector  # noqa: E402
+from runtime.profiler import install_signal_handler  # noqa: E402
+from runtime.memtrace import start_rss_history  # noqa: E402
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,28 +32,40 @@ def _env_bool(name: str, default: str = "true") -> bool:
 
 
 def main() -> None:
-    validate_startup()
+    fds = listen_fds()
+    fd = fds[0] if fds else None
+    validate_startup(check_port=fd is None)
+    settings = get_settings()
+    if settings.startup_tasks:
+        run_startup_tasks()
+    if settings.warmup:
+        # prefork workers must inherit warm caches, so finish before forking
+        start_warmup(app, settings, wait=settings.server_mode == "prefork")
+    install_signal_handler(settings)
+    if settings.server_mode != "prefork":
+        # prefork workers start their own detector and RSS history after forking
+        start_stall_detector(settings)
+        start_rss_history(settings)
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     health_enabled = _env_bool("FAMILYHUB_HEALTH_ENABLED", "true")
 
-    notifier = SdNotifyHeartbeat() if health_enabled else None
+    notifier = None
     if health_enabled:
+        guard = build_guard(app, tracker, settings).start()
+        notifier = SdNotifyHeartbeat(guard.check, action=settings.watchdog_action)
         setup_health(app, host, port)
     logger.info(
-        "FamilyHub starting host=%s port=%s health=%s watchdog=%s",
+        "FamilyHub starting host=%s port=%s socket=%s server=%s health=%s watchdog=%s",
         host,
         port,
+        "systemd" if fd is not None else "bound",
+        settings.server_mode,
         health_enabled,
         bool(notifier and notifier._interval),
     )
 
-    server = make_server(host, port, app)
-    if notifier:
-        notifier.notify_ready()
-        notifier.start()
-        logger.info("READY=1 sent")
-    server.serve_forever()
+    serve(app, host, port, settings=settings, notifier=notifier, fd=fd)
 
 
 if __name__ == "__main__":
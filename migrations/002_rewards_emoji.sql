@@ -0,0 +1,4 @@
+-- rewards.emoji, seeded by 004. 003's CREATE TABLE IF NOT EXISTS with the
+-- column never runs because 001 already created rewards; numbered 002 so a
+-- fresh database has the column before 004 seeds it.
+ALTER TABLE rewards ADD COLUMN emoji TEXT;
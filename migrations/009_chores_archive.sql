@@ -0,0 +1,13 @@
+-- Cold storage for settled chore occurrences (see services/archive_service.py)
+CREATE TABLE IF NOT EXISTS chores_archive (
+    id INTEGER PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    due_date DATE NOT NULL,
+    status TEXT CHECK(status IN ('pending','completed','ignored')),
+    completed_at TIMESTAMP,
+    ignored_at TIMESTAMP,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_chores_archive_due_date ON chores_archive(due_date);
+CREATE INDEX IF NOT EXISTS ix_chores_status_due_date ON chores(status, due_date);
@@ -0,0 +1,7 @@
+-- Chore template catalog (previously only created by db.create_all())
+CREATE TABLE IF NOT EXISTS chore_templates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(120) NOT NULL,
+    category VARCHAR(50) NOT NULL,
+    is_active BOOLEAN DEFAULT 1
+);
@@ -0,0 +1,7 @@
+-- One template per (name, category), so catalog imports can upsert on it
+-- (services/templates_service.py). Older databases may hold duplicates from
+-- repeated seeding: keep the oldest row of each pair.
+DELETE FROM chore_templates
+WHERE id NOT IN (SELECT MIN(id) FROM chore_templates GROUP BY name, category);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_chore_templates_name_category ON chore_templates(name, category);
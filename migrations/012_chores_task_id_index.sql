@@ -0,0 +1,4 @@
+-- Occurrences by definition: the NOT EXISTS checks of the orphan/fake-id
+-- cleanup (services/cleanup_service.py) and the next-occurrence lookup when
+-- a chore is completed or ignored would otherwise scan the whole table.
+CREATE INDEX IF NOT EXISTS ix_chores_task_id_due_date ON chores(task_id, due_date);
@@ -0,0 +1,4 @@
+-- chore_metadata.title (required by the ORM model, fetch_chores and the
+-- archive join). 006's CREATE TABLE IF NOT EXISTS with the column never runs
+-- because 001 already created chore_metadata.
+ALTER TABLE chore_metadata ADD COLUMN title TEXT NOT NULL DEFAULT '';
@@ -0,0 +1,7 @@
+-- One earn per chore occurrence: the kiosk complete route inserts
+-- "<task_id>:<due date>" here and relies on the unique index to ignore
+-- repeats (sql_compat.insert_ignore). NULL keys (redeem/adjust rows and
+-- older earns) never collide.
+ALTER TABLE points_ledger ADD COLUMN occurrence_key TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_points_ledger_occurrence ON points_ledger(occurrence_key);
@@ -0,0 +1,34 @@
+-- PostgreSQL flavour of migrations/001_points.sql
+CREATE TABLE IF NOT EXISTS chore_metadata (
+  task_id      TEXT PRIMARY KEY,
+  assigned_to  TEXT,
+  priority     TEXT,
+  points       INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS points_ledger (
+  id           BIGSERIAL PRIMARY KEY,
+  user_name    TEXT NOT NULL,
+  task_id      TEXT,
+  points       INTEGER NOT NULL,
+  kind         TEXT CHECK(kind IN ('earn','redeem','adjust')) NOT NULL,
+  occurred_at  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  UNIQUE (user_name, task_id, kind)
+);
+
+CREATE TABLE IF NOT EXISTS rewards (
+  id           SERIAL PRIMARY KEY,
+  title        TEXT NOT NULL,
+  cost_points  INTEGER NOT NULL,
+  active       INTEGER NOT NULL DEFAULT 1,
+  emoji        TEXT
+);
+
+CREATE TABLE IF NOT EXISTS redemptions (
+  id           BIGSERIAL PRIMARY KEY,
+  user_name    TEXT NOT NULL,
+  reward_id    INTEGER NOT NULL REFERENCES rewards(id),
+  points       INTEGER NOT NULL,
+  status       TEXT CHECK(status IN ('pending','approved','denied','fulfilled')) NOT NULL DEFAULT 'pending',
+  created_at   TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
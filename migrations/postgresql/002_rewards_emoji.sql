@@ -0,0 +1,2 @@
+-- PostgreSQL flavour of migrations/002_rewards_emoji.sql
+ALTER TABLE rewards ADD COLUMN IF NOT EXISTS emoji TEXT;
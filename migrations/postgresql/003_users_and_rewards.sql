@@ -0,0 +1,11 @@
+-- PostgreSQL flavour of migrations/003_users_and_rewards.sql
+CREATE TABLE IF NOT EXISTS users (
+  id SERIAL PRIMARY KEY,
+  name TEXT NOT NULL UNIQUE,
+  color TEXT,
+  avatar TEXT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_ledger_once
+ON points_ledger(user_name, task_id, kind)
+WHERE task_id IS NOT NULL AND kind='earn';
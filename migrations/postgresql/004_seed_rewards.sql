@@ -0,0 +1,11 @@
+-- PostgreSQL flavour of migrations/004_seed_rewards.sql
+INSERT INTO users (name, color, avatar) VALUES
+('Briggs','#7dd3fc','B'),
+('Hayes','#a7f3d0','H')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO rewards (title, cost_points, emoji, active) VALUES
+('1 Hour Screen Time', 1, '📺', 1),
+('Ice Cream',          2, '🍦', 1),
+('New Book',           5, '📚', 1)
+ON CONFLICT DO NOTHING;
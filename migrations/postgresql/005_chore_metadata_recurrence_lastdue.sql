@@ -0,0 +1,3 @@
+-- PostgreSQL flavour of migrations/005_chore_metadata_recurrence_lastdue.sql
+ALTER TABLE chore_metadata ADD COLUMN IF NOT EXISTS recurrence TEXT;
+ALTER TABLE chore_metadata ADD COLUMN IF NOT EXISTS last_due_iso TEXT;
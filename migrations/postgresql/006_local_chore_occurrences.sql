@@ -0,0 +1,11 @@
+-- PostgreSQL flavour of migrations/006_local_chore_occurrences.sql
+ALTER TABLE chore_metadata ADD COLUMN IF NOT EXISTS title TEXT;
+
+CREATE TABLE IF NOT EXISTS chores (
+    id SERIAL PRIMARY KEY,
+    task_id TEXT NOT NULL REFERENCES chore_metadata(task_id),
+    due_date DATE NOT NULL,
+    status TEXT CHECK(status IN ('pending','completed','ignored')) DEFAULT 'pending',
+    completed_at TIMESTAMP,
+    ignored_at TIMESTAMP
+);
@@ -0,0 +1,2 @@
+-- PostgreSQL flavour of migrations/007_users_is_parent.sql
+ALTER TABLE users ADD COLUMN IF NOT EXISTS is_parent INTEGER DEFAULT 0;
@@ -0,0 +1,2 @@
+-- PostgreSQL flavour of migrations/008_users_image_url.sql
+ALTER TABLE users ADD COLUMN IF NOT EXISTS image_url TEXT;
@@ -0,0 +1,7 @@
+-- PostgreSQL flavour of migrations/010_chore_templates.sql
+CREATE TABLE IF NOT EXISTS chore_templates (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(120) NOT NULL,
+    category VARCHAR(50) NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE
+);
@@ -0,0 +1,5 @@
+-- PostgreSQL flavour of migrations/011_chore_templates_unique.sql
+DELETE FROM chore_templates
+WHERE id NOT IN (SELECT MIN(id) FROM chore_templates GROUP BY name, category);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_chore_templates_name_category ON chore_templates(name, category);
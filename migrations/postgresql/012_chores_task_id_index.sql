@@ -0,0 +1,2 @@
+-- PostgreSQL flavour of migrations/012_chores_task_id_index.sql
+CREATE INDEX IF NOT EXISTS ix_chores_task_id_due_date ON chores(task_id, due_date);
@@ -0,0 +1,3 @@
+-- PostgreSQL flavour of migrations/013_chore_metadata_title.sql (006 already
+-- adds the column here)
+ALTER TABLE chore_metadata ADD COLUMN IF NOT EXISTS title TEXT;
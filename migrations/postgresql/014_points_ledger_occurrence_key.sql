@@ -0,0 +1,4 @@
+-- PostgreSQL flavour of migrations/014_points_ledger_occurrence_key.sql
+ALTER TABLE points_ledger ADD COLUMN IF NOT EXISTS occurrence_key TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_points_ledger_occurrence ON points_ledger(occurrence_key);
@@ -2,19 +2,25 @@
 
 Note: The User and OAuth models required for Replit Auth are currently commented out.
 They are preserved here for context but are not active in the current database schema.
+Re-enabling them also needs these imports (kept out so every process does not load
+flask_dance/flask_login for nothing):
+
+    from flask_dance.consumer.storage.sqla import OAuthConsumerMixin
+    from flask_login import UserMixin
+    from sqlalchemy import UniqueConstraint
 """
 
 from datetime import datetime
 from app import db
-from flask_dance.consumer.storage.sqla import OAuthConsumerMixin
-from flask_login import UserMixin
-from sqlalchemy import UniqueConstraint
 
 
 class ChoreTemplate(db.Model):
     """Represents a template for a recurring chore."""
 
     __tablename__ = "chore_templates"
+    __table_args__ = (
+        db.Index("ux_chore_templates_name_category", "name", "category", unique=True),
+    )
     id = db.Column(
         db.Integer, primary_key=True, doc="Unique identifier for the chore template."
     )
@@ -54,6 +60,20 @@ class ChoreOccurrence(db.Model):
     ignored_at = db.Column(db.DateTime, nullable=True)
     # Relationships
     chore_def = db.relationship("ChoreMetadata", backref="occurrences")
+
+
+# Archived (cold) chore occurrences; see services/archive_service.py
+class ArchivedChoreOccurrence(db.Model):
+    __tablename__ = "chores_archive"
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    task_id = db.Column(db.String, nullable=False)
+    due_date = db.Column(db.Date, nullable=False, index=True)
+    status = db.Column(db.String, nullable=True)
+    completed_at = db.Column(db.DateTime, nullable=True)
+    ignored_at = db.Column(db.DateTime, nullable=True)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
 # class User(UserMixin, db.Model):
 #    __tablename__ = 'users'
 #    id = db.Column(db.String, primary_key=True)
@@ -4,10 +4,16 @@ Importing this module registers the kiosk blueprint for test contexts
 and exposes common service helpers for monkeypatching.
 """
 
+import os
+
 from services.meals_service import fetch_meals  # noqa: F401
 from services.chores_service import fetch_chores  # noqa: F401
 
 from app import app
-from kiosk import bp as kiosk_bp
 
-app.register_blueprint(kiosk_bp, name="")
+# app.py registers the blueprints itself unless SKIP_ROUTES is set (and the
+# kiosk package imports this module while app.py is still initialising).
+if os.environ.get("SKIP_ROUTES"):
+    from kiosk import bp as kiosk_bp
+
+    app.register_blueprint(kiosk_bp, name="")
@@ -0,0 +1,122 @@
+"""In-flight request tracking for the watchdog and stall detector.
+
+:class:`InflightTracker` wraps the WSGI app and records, per request, the
+handling thread, path and start time while it runs, plus the durations of
+recently finished requests. Consumers only read snapshots:
+
+* ``runtime.watchdog`` stops petting the systemd watchdog when the oldest
+  in-flight request or the recent p99 exceeds the stall threshold;
+* ``runtime.stall_detector`` dumps the stacks of threads stuck in a request.
+
+Overhead per request is two dict operations and a deque append under a lock.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class InflightRequest:
+    id: int
+    thread_id: int
+    method: str
+    path: str
+    started: float  # time.monotonic()
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.monotonic()) - self.started
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class InflightTracker:
+    """Track running requests and recent request durations."""
+
+    def __init__(self, history: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._inflight: Dict[int, InflightRequest] = {}
+        # (finished at monotonic, duration seconds)
+        self._recent: Deque[Tuple[float, float]] = deque(maxlen=history)
+
+    def begin(self, method: str, path: str) -> InflightRequest:
+        req = InflightRequest(next(self._ids), threading.get_ident(), method, path, time.monotonic())
+        with self._lock:
+            self._inflight[req.id] = req
+        return req
+
+    def end(self, req: InflightRequest) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self._inflight.pop(req.id, None) is not None:
+                self._recent.append((now, now - req.started))
+
+    def reset(self) -> None:
+        """Forget everything (e.g. in a freshly forked worker)."""
+        with self._lock:
+            self._inflight.clear()
+            self._recent.clear()
+
+    def inflight(self) -> List[InflightRequest]:
+        with self._lock:
+            return list(self._inflight.values())
+
+    def oldest_age(self) -> float:
+        """Age in seconds of the oldest running request (0 when idle)."""
+        now = time.monotonic()
+        with self._lock:
+            return max((now - r.started for r in self._inflight.values()), default=0.0)
+
+    def p99(self, window: float = 60.0) -> Optional[float]:
+        """p99 duration of requests finished in the last ``window`` seconds."""
+        cutoff = time.monotonic() - window
+        with self._lock:
+            durations = [d for finished, d in self._recent if finished >= cutoff]
+        return _percentile(durations, 99) if durations else None
+
+    def middleware(self, wsgi_app: Callable) -> Callable:
+        """Wrap ``wsgi_app`` so every request is tracked until its body is closed."""
+        tracker = self
+
+        def app(environ, start_response) -> Iterable[bytes]:
+            req = tracker.begin(environ.get("REQUEST_METHOD", ""), environ.get("PATH_INFO", ""))
+            try:
+                result = wsgi_app(environ, start_response)
+            except BaseException:
+                tracker.end(req)
+                raise
+            return _ClosingIterator(result, lambda: tracker.end(req))
+
+        return app
+
+
+class _ClosingIterator:
+    """Response iterable that runs ``on_close`` once the server closes it."""
+
+    def __init__(self, result: Iterable[bytes], on_close: Callable[[], None]) -> None:
+        self._result = result
+        self._on_close = on_close
+
+    def __iter__(self):
+        return iter(self._result)
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._result, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._on_close()
+
+
+# Process-wide tracker installed around the Flask app in app.py
+tracker = InflightTracker()
@@ -0,0 +1,251 @@
+"""Memory growth diagnostics: tracemalloc snapshots and RSS history.
+
+:class:`MemoryTracer` is started on demand (``POST /admin/memory/start``)
+because tracing every allocation costs CPU and memory. While it runs it takes
+a :mod:`tracemalloc` snapshot every ``interval`` seconds, logs the allocation
+sites that grew most since the previous snapshot and stores each snapshot in
+the profile capture directory (``runtime.profiler.ProfileStore``), where
+``tracemalloc.Snapshot.load()`` can read it for offline comparison.
+:meth:`MemoryTracer.report` lists the top sites and the growth since the
+previous and the first snapshot, by ``file:line``.
+
+:class:`RssHistory` samples this process's resident memory at a fixed
+interval for the whole process lifetime (cheap, always on), so slow growth
+over days is visible in ``/admin/memory`` and as
+``familyhub_process_memory_growth_bytes{kind="rss"}`` in ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import linecache
+import logging
+import os
+import pickle
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger("familyhub.memtrace")
+
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _site(traceback: tracemalloc.Traceback) -> str:
+    frame = traceback[0]
+    line = linecache.getline(frame.filename, frame.lineno).strip()
+    return f"{frame.filename}:{frame.lineno}" + (f" {line}" if line else "")
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, limit: int = 20) -> List[Dict[str, Any]]:
+    """Largest allocation sites of ``snapshot`` by ``file:line``."""
+    return [
+        {"site": _site(stat.traceback), "size": stat.size, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def growth(new: tracemalloc.Snapshot, old: tracemalloc.Snapshot, limit: int = 20) -> List[Dict[str, Any]]:
+    """Sites whose allocated size grew most from ``old`` to ``new``."""
+    diffs = [d for d in new.compare_to(old, "lineno") if d.size_diff > 0]
+    return [
+        {"site": _site(d.traceback), "size": d.size, "size_diff": d.size_diff, "count_diff": d.count_diff}
+        for d in diffs[:limit]
+    ]
+
+
+class MemoryTracer:
+    def __init__(self, *, interval: float = 300.0, frames: int = 10, top: int = 20, store=None) -> None:
+        self.interval = interval
+        self.frames = frames
+        self.top = top
+        self.store = store
+        self._lock = threading.Lock()
+        self._first: Optional[Tuple[float, tracemalloc.Snapshot]] = None
+        self._previous: Optional[Tuple[float, tracemalloc.Snapshot]] = None
+        self._latest: Optional[Tuple[float, tracemalloc.Snapshot]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "MemoryTracer":
+        with self._lock:
+            if self.running:
+                return self
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+            self._first = self._previous = self._latest = None
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="familyhub-memtrace", daemon=True)
+            self._thread.start()
+        logger.info("memtrace: tracing allocations (%d frames), snapshot every %.0fs", self.frames, self.interval)
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        tracemalloc.stop()
+        logger.info("memtrace: stopped")
+
+    def _loop(self) -> None:
+        self.snapshot()
+        while not self._stop.wait(self.interval):
+            try:
+                self.snapshot()
+            except Exception:  # pragma: no cover - keep sampling
+                logger.exception("memtrace snapshot failed")
+
+    def snapshot(self) -> Optional[str]:
+        """Take a snapshot now; returns the stored capture name, if stored."""
+        if not tracemalloc.is_tracing():
+            return None
+        snap = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        now = time.time()
+        with self._lock:
+            self._previous = self._latest
+            self._latest = (now, snap)
+            if self._first is None:
+                self._first = self._latest
+            previous = self._previous
+        if previous is not None:
+            for entry in growth(snap, previous[1], limit=5):
+                logger.info("memtrace: +%d B (%+d blocks) %s", entry["size_diff"], entry["count_diff"], entry["site"])
+        if self.store is not None:
+            return self.store.save("heap", pickle.dumps(snap), ".tracemalloc")
+        return None
+
+    def report(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        limit = limit or self.top
+        with self._lock:
+            first, previous, latest = self._first, self._previous, self._latest
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        out: Dict[str, Any] = {
+            "running": self.running,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "snapshots_taken_at": [s[0] for s in (first, previous, latest) if s is not None],
+        }
+        if latest is not None:
+            out["top"] = top_sites(latest[1], limit)
+            if previous is not None:
+                out["growth_since_previous"] = growth(latest[1], previous[1], limit)
+            if first is not None and first is not latest:
+                out["growth_since_start"] = growth(latest[1], first[1], limit)
+        return out
+
+
+class RssHistory:
+    """Ring buffer of ``(timestamp, rss_bytes)`` samples for this process."""
+
+    def __init__(self, interval: float = 60.0, keep: int = 1440) -> None:
+        self.interval = interval
+        self.samples: Deque[Tuple[float, int]] = deque(maxlen=keep)
+        self.baseline: Optional[int] = None
+        self._process = psutil.Process(os.getpid())
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> int:
+        rss = self._process.memory_info().rss
+        if self.baseline is None:
+            self.baseline = rss
+        self.samples.append((time.time(), rss))
+        return rss
+
+    def _loop(self) -> None:
+        self.sample()
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "RssHistory":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="familyhub-rss", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def as_dict(self) -> Dict[str, Any]:
+        samples = list(self.samples)
+        return {
+            "interval_s": self.interval,
+            "baseline_rss": self.baseline,
+            "samples": [{"ts": ts, "rss": rss} for ts, rss in samples],
+        }
+
+
+_tracer: Optional[MemoryTracer] = None
+_history: Optional[RssHistory] = None
+_pid: Optional[int] = None
+
+
+def _reset_after_fork() -> None:
+    global _tracer, _history, _pid
+    if _pid != os.getpid():
+        _tracer = _history = None
+        _pid = os.getpid()
+
+
+def tracer_for(settings) -> MemoryTracer:
+    """This process's tracer (created on first use)."""
+    global _tracer
+    _reset_after_fork()
+    if _tracer is None:
+        _tracer = MemoryTracer(
+            interval=settings.memtrace_interval,
+            frames=settings.memtrace_frames,
+            top=settings.memtrace_top,
+            store=snapshot_store(settings),
+        )
+    return _tracer
+
+
+def snapshot_store(settings):
+    """Heap snapshot files, kept apart from the profiler's captures."""
+    from runtime.profiler import ProfileStore
+
+    return ProfileStore(settings.memtrace_dir, keep=settings.memtrace_keep)
+
+
+def start_rss_history(settings) -> Optional[RssHistory]:
+    """Start sampling RSS in this process (idempotent; call again after fork)."""
+    global _history
+    _reset_after_fork()
+    if settings.rss_sample_interval <= 0:
+        return None
+    if _history is None:
+        _history = RssHistory(settings.rss_sample_interval, settings.rss_history_size).start()
+    return _history
+
+
+def rss_history() -> Optional[RssHistory]:
+    _reset_after_fork()
+    return _history
+
+
+def growth_samples() -> Dict[Tuple[str, ...], float]:
+    """Gauge values for ``familyhub_process_memory_growth_bytes``."""
+    out: Dict[Tuple[str, ...], float] = {}
+    history = rss_history()
+    if history is not None and history.baseline is not None:
+        out[("rss",)] = float(psutil.Process(os.getpid()).memory_info().rss - history.baseline)
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        out[("traced",)] = float(current)
+        out[("traced_peak",)] = float(peak)
+    return out
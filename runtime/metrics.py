@@ -0,0 +1,329 @@
+"""Minimal in-process metrics registry with Prometheus text exposition.
+
+Counters, gauges and histograms with labels, plus gauge callbacks evaluated
+at scrape time (process memory). Kept dependency-free instead of pulling in
+``prometheus_client``; the output follows text format 0.0.4 so any Prometheus
+or VictoriaMetrics scraper can read ``/metrics``.
+
+Metric families used across the app are defined at the bottom of this module:
+
+* ``familyhub_http_request_duration_seconds{endpoint,method,status}``
+* ``familyhub_google_api_duration_seconds{method}`` and
+  ``familyhub_google_api_errors_total`` / ``..._retries_total``
+* ``familyhub_db_queries_total{operation}`` /
+  ``familyhub_db_query_duration_seconds{operation}``
+* ``familyhub_http_request_db_queries{endpoint}`` /
+  ``familyhub_http_request_db_seconds{endpoint}`` (per request, see
+  ``runtime.sql_audit``), ``familyhub_db_repeated_queries_total{endpoint}``
+  and ``familyhub_db_slow_queries_total{operation}``
+* ``familyhub_cache_requests_total{cache,result}`` (hit ratio = hit / all)
+* ``familyhub_process_memory_bytes{kind}`` and
+  ``familyhub_process_memory_growth_bytes{kind}`` (RSS growth since start,
+  tracemalloc totals while tracing; see ``runtime.memtrace``)
+
+Values are per process; in prefork mode each worker keeps its own.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> Iterable[str]:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_labels(self.labelnames, key)} {_fmt(value)}"
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, *args, callback: Optional[Callable[[], Dict[LabelValues, float]]] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> Iterable[str]:
+        values = dict(self._values)
+        if self._callback is not None:
+            try:
+                values.update(self._callback())
+            except Exception:  # pragma: no cover - a broken callback must not break scraping
+                pass
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_labels(self.labelnames, key)} {_fmt(value)}"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            row[index] += 1
+            row[-1] += value
+
+    def time(self, **labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+    def count(self, **labels: str) -> int:
+        row = self._values.get(self._key(labels))
+        return int(sum(row[:-1])) if row else 0
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, row in items:
+            cumulative = 0.0
+            for bound, n in zip(list(self.buckets) + [math.inf], row[:-1]):
+                cumulative += n
+                le = 'le="%s"' % _fmt(bound)
+                yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {_fmt(cumulative)}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(row[-1])}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {_fmt(cumulative)}"
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]) -> None:
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self._t0, **self.labels)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, doc: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, doc, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, doc: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self._register(Gauge(name, doc, labelnames, callback=callback))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, doc: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, doc, labelnames, buckets=buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Text exposition of every registered metric."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def _memory_samples() -> Dict[LabelValues, float]:
+    from runtime.process_memory import process_memory
+
+    info = process_memory(os.getpid())
+    return {(kind,): float(info[kind]) for kind in ("rss", "uss", "pss") if info.get(kind) is not None}
+
+
+def _memory_growth_samples() -> Dict[LabelValues, float]:
+    from runtime.memtrace import growth_samples
+
+    return growth_samples()
+
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "familyhub_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("endpoint", "method", "status"),
+)
+GOOGLE_API_SECONDS = registry.histogram(
+    "familyhub_google_api_duration_seconds", "Google API call latency (including retries)", ("method",)
+)
+GOOGLE_API_ERRORS = registry.counter(
+    "familyhub_google_api_errors_total", "Google API calls that failed after retries", ("method",)
+)
+GOOGLE_API_RETRIES = registry.counter(
+    "familyhub_google_api_retries_total", "Google API call retries", ("method",)
+)
+DB_QUERIES = registry.counter("familyhub_db_queries_total", "SQL statements executed", ("operation",))
+DB_QUERY_SECONDS = registry.histogram(
+    "familyhub_db_query_duration_seconds",
+    "SQL statement latency",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+HTTP_REQUEST_DB_QUERIES = registry.histogram(
+    "familyhub_http_request_db_queries",
+    "SQL statements per request by route",
+    ("endpoint",),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+HTTP_REQUEST_DB_SECONDS = registry.histogram(
+    "familyhub_http_request_db_seconds", "Time spent in SQL per request by route", ("endpoint",)
+)
+DB_REPEATED_QUERIES = registry.counter(
+    "familyhub_db_repeated_queries_total", "Requests repeating one statement shape (likely N+1)", ("endpoint",)
+)
+DB_SLOW_QUERIES = registry.counter(
+    "familyhub_db_slow_queries_total", "SQL statements slower than FAMILYHUB_SLOW_QUERY_MS", ("operation",)
+)
+CACHE_REQUESTS = registry.counter(
+    "familyhub_cache_requests_total", "Cache lookups by result (hit/miss)", ("cache", "result")
+)
+PROCESS_MEMORY = registry.gauge(
+    "familyhub_process_memory_bytes", "Memory of this process", ("kind",), callback=_memory_samples
+)
+PROCESS_MEMORY_GROWTH = registry.gauge(
+    "familyhub_process_memory_growth_bytes",
+    "RSS growth since start (rss) and tracemalloc-traced bytes while tracing",
+    ("kind",),
+    callback=_memory_growth_samples,
+)
+
+
+def cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def install_flask(app) -> None:
+    """Record ``familyhub_http_request_duration_seconds`` for every request of ``app``.
+
+    Endpoints are labelled by URL rule (``/chores/<id>``), not raw path, to keep
+    label cardinality bounded.
+    """
+    from flask import g, request
+
+    @app.before_request
+    def _metrics_start() -> None:
+        g._metrics_t0 = time.perf_counter()
+
+    @app.after_request
+    def _metrics_observe(response):
+        t0 = g.pop("_metrics_t0", None)
+        if t0 is not None:
+            rule = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - t0, endpoint=rule, method=request.method, status=str(response.status_code)
+            )
+        return response
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "?"
+
+
+def install_engine(engine) -> None:
+    """Count and time every SQL statement executed through ``engine``."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_metrics_t0", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get("_metrics_t0")
+        if not stack:
+            return
+        op = _operation(statement)
+        DB_QUERIES.inc(operation=op)
+        DB_QUERY_SECONDS.observe(time.perf_counter() - stack.pop(), operation=op)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("_metrics_t0") if context.connection is not None else None
+        if stack:
+            stack.pop()
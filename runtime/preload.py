@@ -0,0 +1,77 @@
+"""Copy-on-write friendly preloading for the prefork (gunicorn) server.
+
+The master process imports and warms everything the workers will need
+(lazily imported Google client libraries, compiled Jinja templates) and then
+calls :func:`gc.freeze` right before forking. Frozen objects move to the
+permanent generation, so the workers' garbage collector never touches them
+and does not dirty the shared pages (reference-count/GC header writes are
+what break copy-on-write sharing on the Pi).
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger("familyhub.preload")
+
+# Heavy modules imported by request handlers; loading them once in the
+# master keeps a single shared copy instead of one per worker.
+WARM_MODULES = (
+    "googleapiclient.discovery",
+    "google.oauth2.service_account",
+    "services.calendar_service",
+    "services.chores_service",
+    "services.meals_service",
+    "services.points_service",
+    "tasks_api",
+)
+
+_master_pid: Optional[int] = None
+
+
+def warm(app) -> None:
+    """Import heavy modules and compile every template of ``app``."""
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as exc:  # pragma: no cover - optional modules
+            logger.warning("preload: could not import %s: %s", name, exc)
+    compiled = compile_templates(app)
+    logger.info("preload: warmed %d modules and %d templates", len(WARM_MODULES), compiled)
+
+
+def compile_templates(app) -> int:
+    """Compile every HTML template into the Jinja cache; returns the count."""
+    env = app.jinja_env
+    compiled = 0
+    for template in env.list_templates(extensions=("html",)):
+        try:
+            env.get_template(template)
+            compiled += 1
+        except Exception as exc:  # pragma: no cover - broken template
+            logger.warning("preload: template %s failed: %s", template, exc)
+    return compiled
+
+
+def freeze() -> None:
+    """Collect garbage once, then move all surviving objects to the permanent generation."""
+    gc.collect()
+    gc.freeze()
+    logger.info("preload: gc.freeze() moved %d objects to the permanent generation", gc.get_freeze_count())
+
+
+def prepare_for_fork(app) -> None:
+    """Run in the master after the app is loaded and before workers fork."""
+    global _master_pid
+    _master_pid = os.getpid()
+    warm(app)
+    freeze()
+
+
+def master_pid() -> Optional[int]:
+    """PID of the preloading master, or None when not running preforked."""
+    return _master_pid
@@ -0,0 +1,49 @@
+"""Per-process memory figures (RSS/USS/PSS) for sizing worker counts.
+
+USS (unique set size) is the memory that would be freed if the process
+exited - i.e. what each additional worker really costs once shared,
+copy-on-write pages are excluded.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+
+def process_memory(pid: Optional[int] = None) -> Dict[str, Any]:
+    """Return ``{pid, rss, uss, pss}`` in bytes for one process."""
+    proc = psutil.Process(pid or os.getpid())
+    try:
+        info = proc.memory_full_info()
+        uss = info.uss
+        pss = getattr(info, "pss", None)
+    except (psutil.AccessDenied, psutil.ZombieProcess):  # pragma: no cover
+        info = proc.memory_info()
+        uss = pss = None
+    return {"pid": proc.pid, "rss": info.rss, "uss": uss, "pss": pss}
+
+
+def worker_memory(master: Optional[int] = None) -> Dict[str, Any]:
+    """Memory of the master and every worker, or of this process alone.
+
+    ``master`` is the preforking master PID (see
+    :func:`runtime.preload.master_pid`); without one only the current process
+    is reported.
+    """
+    if master is None:
+        return {"master": None, "workers": [process_memory()]}
+    workers: List[Dict[str, Any]] = []
+    try:
+        children = psutil.Process(master).children()
+    except psutil.NoSuchProcess:  # pragma: no cover
+        children = []
+    for child in children:
+        try:
+            workers.append(process_memory(child.pid))
+        except psutil.NoSuchProcess:  # pragma: no cover - worker exited
+            continue
+    total_uss = sum(w["uss"] or 0 for w in workers)
+    return {"master": process_memory(master), "workers": workers, "workers_uss_total": total_uss}
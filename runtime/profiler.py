@@ -0,0 +1,252 @@
+"""In-process profiling for kiosks where py-spy cannot be attached.
+
+* :func:`sample_stacks` - statistical sampler: every ``interval`` seconds it
+  reads every thread's stack via :func:`sys._current_frames` and counts
+  identical stacks. The result is in collapsed-stack format
+  (``thread;module:func;module:func COUNT`` per line), which
+  ``flamegraph.pl``/speedscope/inferno render directly.
+* :func:`start_capture` - runs the sampler in a background thread and
+  returns the capture name at once (``/admin/profile``);
+* :func:`install_signal_handler` - ``kill -USR2 <pid>`` samples for
+  ``Settings.profile_signal_seconds`` in the same way.
+* :func:`install_flask` - per-request ``cProfile`` when a request carries
+  ``X-FamilyHub-Profile: 1`` and a valid admin token.
+
+Every capture is written to a :class:`ProfileStore` directory that keeps only
+the newest ``Settings.profile_keep`` files, so production slowness can be
+looked at after the fact (``/admin/profiles``).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import gc
+import io
+import logging
+import marshal
+import os
+import pstats
+import re
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("familyhub.profiler")
+
+PROFILE_HEADER = "X-FamilyHub-Profile"
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+# Held while a background sample runs; one capture per process at a time
+_capture_lock = threading.Lock()
+
+
+def current_frames() -> Dict[int, Any]:
+    """:func:`sys._current_frames` with the garbage collector paused.
+
+    CPython 3.11 builds the result while holding the interpreter's thread-list
+    lock; a collection triggered by that allocation that frees a
+    ``threading.local`` needs the same lock and deadlocks the process.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return sys._current_frames()
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", os.path.basename(code.co_filename))
+    return f"{module}:{code.co_name}:{frame.f_lineno}"
+
+
+def sample_stacks(seconds: float, interval: float = 0.005, *, include_idle: bool = False) -> str:
+    """Sample all threads for ``seconds`` and return collapsed stacks.
+
+    Threads parked in a wait (innermost frame in ``threading``/``selectors``/
+    ``socket``/``queue``) are skipped unless ``include_idle`` is set, so the
+    profile shows where CPU and blocking calls actually go.
+    """
+    me = threading.get_ident()
+    counts: Counter = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in current_frames().items():
+            if ident == me:
+                continue
+            if not include_idle and frame.f_globals.get("__name__") in (
+                "threading",
+                "selectors",
+                "socket",
+                "queue",
+                "concurrent.futures.thread",
+            ):
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            counts[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return "".join(f"{stack} {n}\n" for stack, n in counts.most_common())
+
+
+class ProfileStore:
+    """Directory of captures keeping only the newest ``keep`` files."""
+
+    def __init__(self, directory: str, keep: int = 20) -> None:
+        self.directory = directory
+        self.keep = keep
+
+    def _path(self, name: str) -> str:
+        if not _NAME_RE.match(name):
+            raise ValueError(f"invalid profile name {name!r}")
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def new_name(kind: str, suffix: str) -> str:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        return f"{stamp}-{os.getpid()}-{kind}{suffix}"
+
+    def save(self, kind: str, data: bytes, suffix: str, name: Optional[str] = None) -> str:
+        """Write a capture; ``name`` defaults to a fresh :meth:`new_name`."""
+        os.makedirs(self.directory, exist_ok=True)
+        name = name or self.new_name(kind, suffix)
+        with open(self._path(name), "wb") as fh:
+            fh.write(data)
+        self._rotate()
+        return name
+
+    def _rotate(self) -> None:
+        for name in self.list()[self.keep:]:
+            try:
+                os.remove(self._path(name))
+            except OSError:  # pragma: no cover - removed concurrently
+                pass
+
+    def list(self) -> List[str]:
+        """Capture names, newest first."""
+        try:
+            names = [n for n in os.listdir(self.directory) if _NAME_RE.match(n)]
+        except FileNotFoundError:
+            return []
+        return sorted(names, reverse=True)
+
+    def read(self, name: str) -> bytes:
+        with open(self._path(name), "rb") as fh:
+            return fh.read()
+
+
+def store_for(settings) -> ProfileStore:
+    return ProfileStore(settings.profile_dir, keep=settings.profile_keep)
+
+
+def capture_sample(
+    settings, seconds: float, interval: float = 0.005, name: Optional[str] = None
+) -> tuple[str, str]:
+    """Sample for ``seconds`` and store the result; returns ``(name, collapsed)``."""
+    collapsed = sample_stacks(seconds, interval)
+    name = store_for(settings).save("sample", collapsed.encode("utf-8"), ".collapsed", name)
+    return name, collapsed
+
+
+def start_capture(settings, seconds: float, interval: float = 0.005) -> Optional[str]:
+    """Sample in a background thread; returns the name the capture is stored as.
+
+    Callers (``/admin/profile``, SIGUSR2) return immediately, so a long
+    capture never holds a request open past the watchdog and stall
+    thresholds. The file appears in the store once sampling finishes.
+    Returns None without sampling while another capture is still running.
+    """
+    if not _capture_lock.acquire(blocking=False):
+        return None
+    name = ProfileStore.new_name("sample", ".collapsed")
+
+    def _run() -> None:
+        try:
+            capture_sample(settings, seconds, interval, name)
+            logger.info("profiler: %.0fs sample stored as %s", seconds, name)
+        except Exception:
+            logger.exception("profiler: sample %s failed", name)
+        finally:
+            _capture_lock.release()
+
+    try:
+        threading.Thread(target=_run, name="familyhub-profiler", daemon=True).start()
+    except RuntimeError:
+        _capture_lock.release()
+        raise
+    return name
+
+
+def install_signal_handler(settings, signum: int = getattr(signal, "SIGUSR2", 0)) -> bool:
+    """Sample for ``settings.profile_signal_seconds`` on ``signum``.
+
+    Must be called from the main thread; returns False where the signal does
+    not exist.
+    """
+    if not signum:  # pragma: no cover - non-POSIX
+        return False
+
+    def _handler(_signum, _frame) -> None:
+        if start_capture(settings, settings.profile_signal_seconds) is None:
+            logger.info("profiler: capture already running, signal ignored")
+
+    signal.signal(signum, _handler)
+    return True
+
+
+def install_flask(app, settings) -> None:
+    """Profile single requests with ``cProfile`` on demand.
+
+    Only requests with ``X-FamilyHub-Profile: 1`` and a valid admin token are
+    profiled; the stored capture name is returned in the same header.
+    """
+    from flask import g, request
+
+    from admin.auth import has_admin_token
+
+    @app.before_request
+    def _profile_start() -> None:
+        if request.headers.get(PROFILE_HEADER) != "1" or not has_admin_token():
+            return
+        g._profiler = cProfile.Profile()
+        g._profiler.enable()
+
+    @app.after_request
+    def _profile_stop(response):
+        profiler: Optional[cProfile.Profile] = g.pop("_profiler", None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        profiler.create_stats()
+        name = store_for(settings).save("request", marshal.dumps(profiler.stats), ".pstats")
+        response.headers[PROFILE_HEADER] = name
+        return response
+
+
+def summary(data: bytes, limit: int = 30) -> str:
+    """Human-readable top functions of a stored ``.pstats`` capture.
+
+    The files are regular ``dump_stats`` output, so snakeviz or
+    ``python -m pstats`` can open them too.
+    """
+
+    class _Loaded:
+        def __init__(self, stats: Dict) -> None:
+            self.stats = stats
+
+        def create_stats(self) -> None:
+            pass
+
+    out = io.StringIO()
+    stats = pstats.Stats(_Loaded(marshal.loads(data)), stream=out)
+    stats.sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
@@ -1,20 +1,37 @@
+import logging
 import os
 import threading
 import time
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 try:  # optional dependency
     from sdnotify import SystemdNotifier
 except Exception:  # pragma: no cover
     SystemdNotifier = None  # type: ignore
 
+logger = logging.getLogger("familyhub.sdnotify")
+
 
 class SdNotifyHeartbeat:
-    """Systemd READY and WATCHDOG notifications."""
+    """Systemd READY and WATCHDOG notifications.
+
+    When ``health_check`` is set (see ``runtime.watchdog.WatchdogGuard``) it
+    is consulted before every ``WATCHDOG=1``. While it reports unhealthy the
+    heartbeat stops petting the watchdog; with ``action="trigger"`` it sends
+    ``WATCHDOG=trigger`` once so systemd acts immediately.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        health_check: Optional[Callable[[], Tuple[bool, str]]] = None,
+        *,
+        action: str = "skip",
+    ) -> None:
         self._notifier: Optional[SystemdNotifier] = None
         self._interval: Optional[float] = None
+        self.health_check = health_check
+        self.action = action
+        self._triggered = False
         if SystemdNotifier and os.getenv("NOTIFY_SOCKET"):
             self._notifier = SystemdNotifier()
             watchdog = os.getenv("WATCHDOG_USEC")
@@ -25,13 +42,33 @@ class SdNotifyHeartbeat:
         if self._notifier:
             self._notifier.notify("READY=1")
 
+    def notify_stopping(self) -> None:
+        if self._notifier:
+            self._notifier.notify("STOPPING=1")
+
     def start(self) -> None:
         if self._notifier and self._interval:
             thread = threading.Thread(target=self._loop, daemon=True)
             thread.start()
 
+    def beat(self) -> bool:
+        """Send one watchdog notification if healthy; returns whether it petted."""
+        assert self._notifier is not None
+        if self.health_check is not None:
+            ok, reason = self.health_check()
+            if not ok:
+                if self.action == "trigger" and not self._triggered:
+                    logger.error("watchdog: %s; sending WATCHDOG=trigger", reason)
+                    self._notifier.notify("WATCHDOG=trigger")
+                    self._triggered = True
+                else:
+                    logger.error("watchdog: %s; not petting", reason)
+                return False
+        self._triggered = False
+        self._notifier.notify("WATCHDOG=1")
+        return True
+
     def _loop(self) -> None:
         while True:
-            assert self._notifier is not None
-            self._notifier.notify("WATCHDOG=1")
+            self.beat()
             time.sleep(self._interval)
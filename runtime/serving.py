@@ -0,0 +1,192 @@
+"""WSGI serving modes for ``main.py``.
+
+``Settings.server_mode`` selects one of:
+
+* ``dev`` - werkzeug's single-threaded development server (previous default).
+* ``threaded`` - werkzeug server dispatching connections to a bounded thread
+  pool, so one slow Google call no longer stalls every other client. When all
+  workers are busy the accept loop waits and new connections queue in the
+  kernel backlog instead of spawning unbounded threads.
+* ``prefork`` - gunicorn arbiter with the app preloaded in the master before
+  forking workers (requires the optional ``gunicorn`` dependency). With
+  ``Settings.preload`` the master also warms imports/templates and freezes
+  the GC heap first (see ``runtime.preload``).
+
+All modes send sdnotify ``READY=1`` once the listening socket is bound, keep
+the WATCHDOG heartbeat running, and drain in-flight requests on SIGTERM for
+up to ``Settings.graceful_timeout`` seconds.
+
+Passing ``fd`` serves on an already-bound listening socket (systemd socket
+activation, see ``runtime.systemd_socket``) instead of binding host/port.
+"""
+
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+from typing import Any, Optional
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler, make_server
+
+from runtime.inflight import tracker
+from runtime.preload import prepare_for_fork
+from runtime.memtrace import start_rss_history
+from runtime.stall_detector import start_stall_detector
+from runtime.thread_pool import ThreadPoolMixIn
+
+logger = logging.getLogger("familyhub.serving")
+
+SERVER_MODES = ("dev", "threaded", "prefork")
+
+
+class _PooledRequestHandler(WSGIRequestHandler):
+    # One request per connection: idle keep-alive sockets would otherwise
+    # pin pool workers while the browser holds the connection open.
+    protocol_version = "HTTP/1.0"
+
+
+class PooledWSGIServer(ThreadPoolMixIn, BaseWSGIServer):
+    """werkzeug server handling each connection on a bounded thread pool."""
+
+    multithread = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        app: Any,
+        *,
+        threads: int = 8,
+        fd: Optional[int] = None,
+        handler: Optional[type[WSGIRequestHandler]] = None,
+    ) -> None:
+        super().__init__(host, port, app, handler=handler or _PooledRequestHandler, fd=fd)
+        self.init_pool(threads, "familyhub-http")
+
+
+def _install_sigterm(server) -> None:
+    def _on_sigterm(signum, _frame) -> None:
+        logger.info("signal %s received; stopping accept loop", signum)
+        # shutdown() blocks until serve_forever returns, so it must not run
+        # on the main thread that is executing serve_forever.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
+
+
+def serve_threaded(app, host: str, port: int, *, settings, notifier=None, fd: Optional[int] = None) -> None:
+    server = PooledWSGIServer(host, port, app, threads=settings.server_threads, fd=fd)
+    _install_sigterm(server)
+    _ready(notifier)
+    logger.info("serving threaded on %s:%s threads=%d", host, server.port, server.threads)
+    server.serve_forever()
+    _stopping(notifier)
+    if server.drain(settings.graceful_timeout):
+        logger.info("drained in-flight requests")
+    else:
+        logger.warning("graceful timeout (%.0fs) hit with requests in flight", settings.graceful_timeout)
+
+
+def serve_dev(app, host: str, port: int, *, settings, notifier=None, fd: Optional[int] = None) -> None:
+    server = make_server(host, port, app, fd=fd)
+    _install_sigterm(server)
+    _ready(notifier)
+    server.serve_forever()
+
+
+def serve_prefork(app, host: str, port: int, *, settings, notifier=None, fd: Optional[int] = None) -> None:
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("FAMILYHUB_SERVER=prefork requires gunicorn to be installed") from exc
+
+    options = {
+        "bind": f"{host}:{port}" if fd is None else f"fd://{fd}",
+        "workers": settings.server_workers,
+        "threads": settings.server_threads,
+        "worker_class": "gthread" if settings.server_threads > 1 else "sync",
+        "preload_app": True,
+        "graceful_timeout": int(settings.graceful_timeout),
+        "when_ready": lambda _arbiter: _when_ready(app, settings, notifier),
+        "post_fork": lambda _arbiter, _worker: _post_fork(app, settings),
+        "on_exit": lambda _arbiter: _stopping(notifier),
+    }
+
+    class _FamilyHubApplication(BaseApplication):
+        def load_config(self) -> None:
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    logger.info(
+        "serving prefork on %s workers=%d threads=%d",
+        options["bind"],
+        settings.server_workers,
+        settings.server_threads,
+    )
+    _FamilyHubApplication().run()
+
+
+def _when_ready(app, settings, notifier) -> None:
+    # Runs in the gunicorn master before the first workers are forked.
+    if settings.preload:
+        prepare_for_fork(app)
+    _ready(notifier)
+
+
+def reset_engine_pools(app) -> None:
+    """Forget the database connections inherited from the master.
+
+    The preloading master has already used its pools (startup tasks, warm-up,
+    health probes). SQLite connections must not be used across ``fork()``, so
+    each worker drops its copy of every pool without closing the master's
+    connections (``dispose(close=False)``) and opens its own on demand.
+    """
+    extension = app.extensions.get("sqlalchemy")
+    if extension is None:
+        return
+    with app.app_context():
+        for engine in extension.engines.values():
+            engine.dispose(close=False)
+
+
+def _post_fork(app, settings) -> None:
+    # Runs in each new worker: drop request state and database connections
+    # inherited from the master, restart the health probe threads (they do
+    # not survive fork) and watch this worker's own requests for stalls and
+    # memory growth.
+    from app_health import restart_monitor_after_fork
+
+    reset_engine_pools(app)
+    tracker.reset()
+    restart_monitor_after_fork()
+    start_stall_detector(settings, per_process=True)
+    start_rss_history(settings)
+
+
+def _ready(notifier) -> None:
+    if notifier:
+        notifier.notify_ready()
+        notifier.start()
+        logger.info("READY=1 sent")
+
+
+def _stopping(notifier) -> None:
+    if notifier:
+        notifier.notify_stopping()
+
+
+def serve(app, host: str, port: int, *, settings, notifier=None, fd: Optional[int] = None) -> None:
+    """Serve ``app`` using ``settings.server_mode``, on ``fd`` when given."""
+    mode = settings.server_mode
+    if mode == "prefork":
+        serve_prefork(app, host, port, settings=settings, notifier=notifier, fd=fd)
+    elif mode == "threaded":
+        serve_threaded(app, host, port, settings=settings, notifier=notifier, fd=fd)
+    elif mode == "dev":
+        serve_dev(app, host, port, settings=settings, notifier=notifier, fd=fd)
+    else:
+        raise ValueError(f"Unknown FAMILYHUB_SERVER mode {mode!r}; expected one of {SERVER_MODES}")
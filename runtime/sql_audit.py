@@ -0,0 +1,172 @@
+"""Per-request SQL statement accounting: counts, time, N+1 shapes, slow queries.
+
+:func:`install_engine` hooks SQLAlchemy's cursor events. While a
+:class:`QueryStats` collector is active (every Flask request after
+:func:`install_flask`, or a :func:`capture` block in scripts and tests) each
+statement is counted, timed and reduced to a *shape* - literals and
+parameter lists folded - so the same query issued in a loop shows up as
+one shape with a high count, the usual signature of lazy-loading N+1
+access such as ``occ.chore_def`` per occurrence.
+
+At the end of a request the totals go to ``runtime.metrics``
+(``familyhub_http_request_db_queries`` / ``..._db_seconds`` per route), and
+a shape repeated ``Settings.sql_repeat_threshold`` times or more is logged
+and counted as ``familyhub_db_repeated_queries_total``. Independently of
+requests, statements slower than ``Settings.slow_query_ms`` are logged
+together with SQLite's ``EXPLAIN QUERY PLAN``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+from runtime.metrics import (
+    DB_REPEATED_QUERIES,
+    DB_SLOW_QUERIES,
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DB_SECONDS,
+)
+
+logger = logging.getLogger("familyhub.sql")
+
+_active: contextvars.ContextVar[Tuple["QueryStats", ...]] = contextvars.ContextVar(
+    "familyhub_sql_audit", default=()
+)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+
+def shape(statement: str) -> str:
+    """Statement with literals and parameter lists folded to ``?``."""
+    out = _STRING_RE.sub("?", statement)
+    out = _NUMBER_RE.sub("?", out)
+    out = _SPACE_RE.sub(" ", out).strip()
+    return _LIST_RE.sub("(?)", out)
+
+
+class QueryStats:
+    """Statements seen while this collector was active."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.connections = 0
+        self.shapes: Counter = Counter()
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.seconds += duration
+        self.shapes[shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times, most frequent first."""
+        return [(s, n) for s, n in self.shapes.most_common() if n >= threshold]
+
+    def describe(self, limit: int = 10) -> str:
+        lines = [f"{self.count} statements, {self.seconds * 1000:.1f} ms, {self.connections} checkouts"]
+        lines.extend(f"  {n:4d} x {s[:200]}" for s, n in self.shapes.most_common(limit))
+        return "\n".join(lines)
+
+
+@contextmanager
+def capture() -> Iterator[QueryStats]:
+    """Collect statements executed in this context (nests with requests)."""
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    driver = conn.connection.driver_connection
+    rows = driver.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+    return "; ".join(str(row[-1]) for row in rows)
+
+
+def install_engine(engine, settings) -> None:
+    """Account statements executed through ``engine`` and log slow ones."""
+    from sqlalchemy import event
+
+    slow_s = settings.slow_query_ms / 1000.0
+    explain = engine.dialect.name == "sqlite"
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_conn, record, proxy):
+        for stats in _active.get():
+            stats.connections += 1
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_audit_t0", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get("_audit_t0")
+        if not stack:
+            return
+        duration = time.perf_counter() - stack.pop()
+        for stats in _active.get():
+            stats.add(statement, duration)
+        if slow_s and duration >= slow_s:
+            op = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "?"
+            DB_SLOW_QUERIES.inc(operation=op)
+            plan = ""
+            if explain and not executemany and op in _EXPLAINABLE:
+                try:
+                    plan = _explain(conn, statement, parameters)
+                except Exception as exc:  # pragma: no cover - plan is best effort
+                    plan = f"<unavailable: {exc}>"
+            logger.warning("slow query %.1f ms: %s | plan: %s", duration * 1000, shape(statement)[:500], plan)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("_audit_t0") if context.connection is not None else None
+        if stack:
+            stack.pop()
+
+
+def install_flask(app, settings) -> None:
+    """Open a collector per request and report it when the request ends."""
+    from flask import g, request
+
+    threshold = settings.sql_repeat_threshold
+
+    @app.before_request
+    def _audit_start() -> None:
+        stats = QueryStats()
+        g._sql_audit = (stats, _active.set(_active.get() + (stats,)))
+
+    @app.teardown_request
+    def _audit_finish(_exc) -> None:
+        entry: Optional[tuple] = g.pop("_sql_audit", None)
+        if entry is None:
+            return
+        stats, token = entry
+        _active.reset(token)
+        rule = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+        HTTP_REQUEST_DB_QUERIES.observe(stats.count, endpoint=rule)
+        HTTP_REQUEST_DB_SECONDS.observe(stats.seconds, endpoint=rule)
+        repeated = stats.repeated(threshold) if threshold else []
+        if repeated:
+            DB_REPEATED_QUERIES.inc(endpoint=rule)
+            statement, n = repeated[0]
+            logger.warning(
+                "possible N+1 on %s %s: %d statements, %d x %s",
+                request.method,
+                rule,
+                stats.count,
+                n,
+                statement[:300],
+            )
@@ -0,0 +1,166 @@
+"""Dump thread stacks of requests that run longer than a threshold.
+
+A daemon thread polls ``runtime.inflight.tracker`` every ``interval``
+seconds. For each request older than ``threshold`` it captures the stack of
+the handling thread via :func:`sys._current_frames` (up to
+``samples_per_request`` samples, one per poll, so a hang shows where the time
+goes) and, with the first sample, the stacks of every other thread too.
+Entries go to a rotating log file.
+
+Idle cost is one lock-protected dict copy per poll; dumps are rate-limited
+to ``max_dumps_per_minute`` so a wedged process cannot flood the disk.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Deque, Dict, Optional
+
+from runtime.inflight import InflightTracker, tracker as default_tracker
+from runtime.profiler import current_frames
+
+logger = logging.getLogger("familyhub.stall")
+
+
+def _file_logger(path: str) -> logging.Logger:
+    """Logger writing only to a rotating ``path`` (1 MB x 3 backups)."""
+    log = logging.getLogger(f"familyhub.stall.dump.{path}")
+    if not log.handlers:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+    return log
+
+
+def _thread_names() -> Dict[int, str]:
+    return {t.ident: t.name for t in threading.enumerate() if t.ident is not None}
+
+
+class StallDetector:
+    def __init__(
+        self,
+        tracker: InflightTracker,
+        log_path: str,
+        *,
+        threshold: float = 5.0,
+        interval: float = 1.0,
+        samples_per_request: int = 5,
+        max_dumps_per_minute: int = 6,
+    ) -> None:
+        self.tracker = tracker
+        self.log_path = log_path
+        self.threshold = threshold
+        self.interval = interval
+        self.samples_per_request = samples_per_request
+        self.max_dumps_per_minute = max_dumps_per_minute
+        self._samples: Dict[int, int] = {}
+        self._dumps: Deque[float] = deque()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._log: Optional[logging.Logger] = None
+
+    def _allow_dump(self, now: float) -> bool:
+        while self._dumps and now - self._dumps[0] > 60:
+            self._dumps.popleft()
+        if len(self._dumps) >= self.max_dumps_per_minute:
+            return False
+        self._dumps.append(now)
+        return True
+
+    def check_once(self) -> int:
+        """Sample stalled requests once; returns the number of dumps written."""
+        now = time.monotonic()
+        inflight = self.tracker.inflight()
+        live_ids = {r.id for r in inflight}
+        for req_id in list(self._samples):
+            if req_id not in live_ids:
+                del self._samples[req_id]
+
+        written = 0
+        for req in inflight:
+            age = req.age(now)
+            taken = self._samples.get(req.id, 0)
+            if age < self.threshold or taken >= self.samples_per_request:
+                continue
+            if not self._allow_dump(now):
+                break
+            frames = current_frames()
+            names = _thread_names()
+            lines = [
+                f"stall: {req.method} {req.path} running {age:.1f}s "
+                f"(request {req.id}, thread {names.get(req.thread_id, req.thread_id)}, "
+                f"sample {taken + 1}/{self.samples_per_request})\n"
+            ]
+            frame = frames.get(req.thread_id)
+            lines.extend(traceback.format_stack(frame) if frame else ["  <thread gone>\n"])
+            if taken == 0:
+                for ident, other in frames.items():
+                    if ident in (req.thread_id, threading.get_ident()):
+                        continue
+                    lines.append(f"-- thread {names.get(ident, ident)}\n")
+                    lines.extend(traceback.format_stack(other))
+            if self._log is None:
+                self._log = _file_logger(self.log_path)
+            self._log.info("".join(lines).rstrip())
+            if taken == 0:
+                logger.warning(
+                    "stall: %s %s running %.1fs; stacks written to %s", req.method, req.path, age, self.log_path
+                )
+            self._samples[req.id] = taken + 1
+            written += 1
+        return written
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check_once()
+            except Exception:  # pragma: no cover - never take the detector down
+                logger.exception("stall detector iteration failed")
+
+    def start(self) -> "StallDetector":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="familyhub-stall", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+_detectors: Dict[int, StallDetector] = {}
+
+
+def start_stall_detector(
+    settings, tracker: InflightTracker = default_tracker, *, per_process: bool = False
+) -> Optional[StallDetector]:
+    """Start the detector for this process (once per pid; safe after fork).
+
+    With ``per_process`` (prefork workers) the pid is added to the log file
+    name, since several processes must not rotate the same file.
+    """
+    if not settings.stall_detector:
+        return None
+    pid = os.getpid()
+    if pid not in _detectors:
+        path = settings.stall_log_path
+        if per_process:
+            root, ext = os.path.splitext(path)
+            path = f"{root}.{pid}{ext}"
+        _detectors[pid] = StallDetector(
+            tracker,
+            path,
+            threshold=settings.stall_threshold_seconds,
+            interval=settings.stall_sample_interval,
+            max_dumps_per_minute=settings.stall_max_dumps_per_minute,
+        ).start()
+    return _detectors[pid]
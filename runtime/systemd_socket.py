@@ -0,0 +1,38 @@
+"""systemd socket activation (``sd_listen_fds``) support.
+
+With ``systemd/familyhub.socket`` enabled, systemd owns the listening socket
+and hands it to the service as file descriptor 3 together with the
+``LISTEN_PID``/``LISTEN_FDS`` environment variables. Connections arriving
+while the service restarts queue in the kernel backlog instead of being
+refused.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import List
+
+SD_LISTEN_FDS_START = 3
+
+
+def listen_fds(unset_environment: bool = True) -> List[int]:
+    """Return file descriptors passed by systemd, or ``[]`` when not activated.
+
+    Mirrors ``sd_listen_fds(3)``: the descriptors are only ours when
+    ``LISTEN_PID`` matches this process. The environment variables are removed
+    by default so child processes do not try to claim the sockets again.
+    """
+    try:
+        if int(os.environ.get("LISTEN_PID", "0")) != os.getpid():
+            return []
+        count = int(os.environ.get("LISTEN_FDS", "0"))
+    except ValueError:
+        return []
+    finally:
+        if unset_environment:
+            for name in ("LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES"):
+                os.environ.pop(name, None)
+    fds = list(range(SD_LISTEN_FDS_START, SD_LISTEN_FDS_START + count))
+    for fd in fds:
+        os.set_inheritable(fd, False)
+    return fds
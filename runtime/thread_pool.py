@@ -0,0 +1,70 @@
+"""Bounded thread-pool request handling shared by FamilyHub's HTTP servers.
+
+``socketserver.ThreadingMixIn`` starts one thread per connection with no
+upper bound. :class:`ThreadPoolMixIn` hands connections to a fixed
+``ThreadPoolExecutor`` instead; when every worker is busy the accept loop
+waits and new connections queue in the kernel backlog. Used by the WSGI
+server (``runtime.serving.PooledWSGIServer``) and the standalone health
+server (``health.server.PooledHTTPServer``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ThreadPoolMixIn:
+    """``socketserver`` mix-in processing each connection on a bounded pool.
+
+    List it before the server class and call :meth:`init_pool` from
+    ``__init__``.
+    """
+
+    threads = 1
+
+    def init_pool(self, threads: int, thread_name_prefix: str) -> None:
+        self.threads = threads
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(threads)
+
+    def process_request(self, request, client_address) -> None:
+        # Blocks the accept loop when every worker is busy.
+        self._slots.acquire()
+        try:
+            self._pool.submit(self._process, request, client_address)
+        except RuntimeError:  # pool already shut down
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def drain(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for in-flight requests, then stop the pool.
+
+        Returns True when every worker became idle in time.
+        """
+        deadline = time.monotonic() + timeout
+        acquired = 0
+        try:
+            for _ in range(self.threads):
+                if not self._slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                    return False
+                acquired += 1
+            return True
+        finally:
+            for _ in range(acquired):
+                self._slots.release()
+            self.shutdown_pool()
+
+    def shutdown_pool(self) -> None:
+        """Stop accepting work; queued connections are dropped."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
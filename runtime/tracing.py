@@ -0,0 +1,198 @@
+"""Lightweight per-request tracing spans.
+
+``span`` works as a context manager or decorator::
+
+    with span("fetch_meals", days=7):
+        ...
+
+    @span("leaderboard_week")
+    def leaderboard_week(...): ...
+
+Spans nest through a :mod:`contextvars` stack. A trace is only collected
+while a request is being traced (see :func:`install_flask`); elsewhere, and
+in threads started without the request context, ``span`` costs one context
+variable lookup.
+
+Finished request traces are written as one JSON object per line to
+``Settings.trace_log_path`` (when ``FAMILYHUB_TRACING=true``), and with
+``FAMILYHUB_SERVER_TIMING=true`` the top-level breakdown is returned in a
+``Server-Timing`` header for the browser devtools.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import re
+import time
+from contextlib import ContextDecorator
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("familyhub.tracing")
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("familyhub_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "attrs", "start", "end", "children", "root_start")
+
+    def __init__(self, name: str, attrs: Dict[str, Any], root_start: Optional[float] = None) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.children: List["Span"] = []
+        self.root_start = root_start if root_start is not None else self.start
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - self.root_start) * 1000, 3),
+            "dur_ms": round(self.duration_ms, 3),
+        }
+        if self.attrs:
+            out["attrs"] = self.attrs
+        if self.children:
+            out["children"] = [c.to_dict() for c in self.children]
+        return out
+
+
+class span(ContextDecorator):
+    """Record a child span of the current span (no-op outside a trace)."""
+
+    def __init__(self, name: str, **attrs: Any) -> None:
+        self.name = name
+        self.attrs = attrs
+        self._token: Optional[contextvars.Token] = None
+        self._span: Optional[Span] = None
+
+    def _recreate_cm(self) -> "span":
+        # Each decorated call gets its own span
+        return span(self.name, **self.attrs)
+
+    def __enter__(self) -> Optional[Span]:
+        parent = _current.get()
+        if parent is None:
+            return None
+        self._span = Span(self.name, dict(self.attrs), parent.root_start)
+        parent.children.append(self._span)
+        self._token = _current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._span is None:
+            return
+        self._span.end = time.perf_counter()
+        if exc_type is not None:
+            self._span.attrs["error"] = exc_type.__name__
+        _current.reset(self._token)
+
+
+def record(name: str, duration_s: float, **attrs: Any) -> None:
+    """Attach an already-measured child span (e.g. from SQLAlchemy events)."""
+    parent = _current.get()
+    if parent is None:
+        return
+    child = Span(name, attrs, parent.root_start)
+    child.end = time.perf_counter()
+    child.start = child.end - duration_s
+    parent.children.append(child)
+
+
+def start_trace(name: str, **attrs: Any) -> contextvars.Token:
+    return _current.set(Span(name, attrs))
+
+
+def finish_trace(token: contextvars.Token) -> Optional[Span]:
+    root = _current.get()
+    _current.reset(token)
+    if root is not None and root.end is None:
+        root.end = time.perf_counter()
+    return root
+
+
+_TOKEN_RE = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+
+def server_timing(root: Span) -> str:
+    """``Server-Timing`` value: total plus top-level children summed by name."""
+    totals: Dict[str, float] = {}
+    for child in root.children:
+        totals[child.name] = totals.get(child.name, 0.0) + child.duration_ms
+    parts = [f"{_TOKEN_RE.sub('_', name)};dur={ms:.1f}" for name, ms in totals.items()]
+    parts.append(f"total;dur={root.duration_ms:.1f}")
+    return ", ".join(parts)
+
+
+def _trace_logger(path: str) -> logging.Logger:
+    log = logging.getLogger(f"familyhub.tracing.file.{path}")
+    if not log.handlers:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=5 * 1024 * 1024, backupCount=2, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+    return log
+
+
+def install_flask(app, settings) -> None:
+    """Trace every request of ``app`` according to ``settings``."""
+    if not (settings.tracing or settings.server_timing):
+        return
+    from flask import g, request
+
+    trace_log = _trace_logger(settings.trace_log_path) if settings.tracing else None
+
+    @app.before_request
+    def _trace_start() -> None:
+        g._trace_token = start_trace(f"{request.method} {request.path}")
+
+    @app.after_request
+    def _trace_header(response):
+        root = _current.get()
+        if settings.server_timing and root is not None:
+            root.end = time.perf_counter()
+            response.headers["Server-Timing"] = server_timing(root)
+        return response
+
+    @app.teardown_request
+    def _trace_finish(_exc) -> None:
+        token = g.pop("_trace_token", None)
+        if token is None:
+            return
+        root = finish_trace(token)
+        if trace_log is not None and root is not None:
+            entry = root.to_dict()
+            entry["ts"] = time.time()
+            entry["endpoint"] = request.url_rule.rule if request.url_rule is not None else None
+            trace_log.info(json.dumps(entry, default=str))
+
+
+def install_engine(engine) -> None:
+    """Record each SQL statement as a ``db`` child span of the active span."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("_trace_t0", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get("_trace_t0")
+        if stack and _current.get() is not None:
+            record("db", time.perf_counter() - stack.pop(), sql=statement[:200])
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("_trace_t0") if context.connection is not None else None
+        if stack:
+            stack.pop()
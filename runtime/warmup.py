@@ -0,0 +1,168 @@
+"""Cache warm-up stage run by ``main.py`` before the app reports ready.
+
+Right after ``validate_startup`` the process fills the caches the first
+kiosk page load would otherwise pay for, in parallel threads:
+
+* meals: ``calendar_service.get_meals()`` (TTL cache),
+* task list: ``tasks_api.get_or_create_task_list`` (per-process id cache),
+* templates: compile every Jinja template,
+* hot tables: one cheap SELECT per table to pull pages into the SQLite cache.
+
+Until the stage finishes, ``/readyz`` (see ``app_health``) answers 503 with
+``status: warming``. A failing task is logged and recorded but does not keep
+the app un-ready forever: the stage still ends in ``ready``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger("familyhub.warmup")
+
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+
+# Tables read by the dashboard and chores pages.
+HOT_TABLES = ("chores", "chore_metadata", "chore_templates", "points_ledger", "rewards")
+
+
+class WarmupStage:
+    """Run warm-up tasks on a thread pool and track their progress."""
+
+    def __init__(self, tasks: Dict[str, Callable[[], object]], *, threads: int = 4) -> None:
+        self.tasks = dict(tasks)
+        self.threads = max(1, threads)
+        self.state = PENDING
+        self.results: Dict[str, Dict[str, object]] = {}
+        self.started_at: Optional[float] = None
+        self.duration_ms: Optional[int] = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    def _run_task(self, name: str, fn: Callable[[], object]) -> None:
+        t0 = time.perf_counter()
+        try:
+            fn()
+            result = {"ok": True}
+        except Exception as exc:
+            logger.warning("warmup: %s failed: %s", name, exc)
+            result = {"ok": False, "error": str(exc)}
+        result["ms"] = int((time.perf_counter() - t0) * 1000)
+        with self._lock:
+            self.results[name] = result
+
+    def run(self) -> None:
+        """Run every task and block until all have finished."""
+        self.state = WARMING
+        self.started_at = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="familyhub-warmup") as pool:
+                for name, fn in self.tasks.items():
+                    pool.submit(self._run_task, name, fn)
+        finally:
+            self.duration_ms = int((time.perf_counter() - self.started_at) * 1000)
+            self.state = READY
+            self._done.set()
+            failed = [n for n, r in self.results.items() if not r["ok"]]
+            logger.info("warmup: finished in %d ms (failed: %s)", self.duration_ms, failed or "none")
+
+    def start(self) -> threading.Thread:
+        """Run the stage in a background thread."""
+        self.state = WARMING
+        thread = threading.Thread(target=self.run, name="familyhub-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            results = {name: dict(r) for name, r in self.results.items()}
+        return {"state": self.state, "duration_ms": self.duration_ms, "tasks": results}
+
+
+_stage: Optional[WarmupStage] = None
+
+
+def current_stage() -> Optional[WarmupStage]:
+    """The stage started by :func:`start_warmup`, or None when warm-up is off."""
+    return _stage
+
+
+def _in_app_context(app, fn: Callable[[], object]) -> Callable[[], object]:
+    def _run() -> object:
+        with app.app_context():
+            return fn()
+
+    return _run
+
+
+def _prefetch_meals() -> None:
+    from services import calendar_service
+
+    result = calendar_service.get_meals()
+    if "error" in result:
+        raise RuntimeError(result["error"])
+
+
+def _resolve_task_list(title: str) -> None:
+    import tasks_api
+
+    tasks_api.get_or_create_task_list(tasks_api.build_google_service(), title)
+
+
+def _touch_tables() -> None:
+    from sqlalchemy import text
+
+    from db import db
+
+    with db.engine.connect() as conn:
+        for table in HOT_TABLES:
+            try:
+                conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            except Exception as exc:  # table not migrated yet
+                logger.info("warmup: skipping %s: %s", table, exc)
+
+
+def default_tasks(app, settings) -> Dict[str, Callable[[], object]]:
+    """The standard warm-up tasks for ``app``.
+
+    Google-backed tasks are only included when credentials (or a fake API
+    endpoint) are configured.
+    """
+    from runtime.preload import compile_templates
+
+    tasks: Dict[str, Callable[[], object]] = {
+        "templates": lambda: compile_templates(app),
+        "tables": _in_app_context(app, _touch_tables),
+    }
+    if settings.google_credentials_path or settings.google_api_endpoint:
+        tasks["task_list"] = lambda: _resolve_task_list(settings.google_tasks_list_title)
+        if settings.calendar_id:
+            tasks["meals"] = _in_app_context(app, _prefetch_meals)
+    return tasks
+
+
+def start_warmup(app, settings, *, wait: bool = False) -> WarmupStage:
+    """Create the process-wide stage for ``app`` and start it.
+
+    With ``wait`` the call blocks until warm-up has finished (used before
+    forking prefork workers so they inherit the warm caches).
+    """
+    global _stage
+    _stage = WarmupStage(default_tasks(app, settings), threads=settings.warmup_threads)
+    if wait:
+        _stage.run()
+    else:
+        _stage.start()
+    return _stage
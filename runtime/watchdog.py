@@ -0,0 +1,104 @@
+"""Tie the systemd watchdog to real request serving.
+
+:class:`WatchdogGuard` periodically sends a synthetic in-process request
+through the WSGI stack (so it shows up in ``runtime.inflight``) and decides
+whether the process is still serving:
+
+* the oldest in-flight request must be younger than ``stall_seconds``;
+* the p99 of requests finished in the last ``p99_window`` seconds must be
+  below ``stall_seconds``;
+* a synthetic request must have completed within the last
+  ``stall_seconds + probe_interval`` seconds.
+
+``SdNotifyHeartbeat`` calls :meth:`WatchdogGuard.check` before each
+``WATCHDOG=1`` and stops petting (or sends ``WATCHDOG=trigger``) once it
+fails, so systemd restarts a wedged kiosk within seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+
+from runtime.inflight import InflightTracker
+
+logger = logging.getLogger("familyhub.watchdog")
+
+SYNTHETIC_HEADER = "X-FamilyHub-Synthetic"
+
+
+class WatchdogGuard:
+    def __init__(
+        self,
+        app,
+        tracker: InflightTracker,
+        *,
+        stall_seconds: float = 30.0,
+        probe_path: str = "/healthz",
+        probe_interval: float = 10.0,
+        p99_window: float = 60.0,
+    ) -> None:
+        self.app = app
+        self.tracker = tracker
+        self.stall_seconds = stall_seconds
+        self.probe_path = probe_path
+        self.probe_interval = probe_interval
+        self.p99_window = p99_window
+        self.last_probe_ok: float = time.monotonic()
+        self.last_probe_status: Optional[int] = None
+        self._probe_running = threading.Event()
+        self._stop = threading.Event()
+
+    def probe(self) -> None:
+        """Send one synthetic request through the app (blocking)."""
+        self._probe_running.set()
+        try:
+            resp = self.app.test_client().get(
+                self.probe_path, headers={SYNTHETIC_HEADER: "1"}, buffered=True
+            )
+            self.last_probe_status = resp.status_code
+            # Any answer (even 503 from readiness-style checks) proves the
+            # request path is not wedged.
+            self.last_probe_ok = time.monotonic()
+        except Exception as exc:
+            logger.warning("watchdog: synthetic request to %s failed: %s", self.probe_path, exc)
+        finally:
+            self._probe_running.clear()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.probe_interval):
+            if self._probe_running.is_set():
+                continue  # previous probe still stuck; check() reports it
+            threading.Thread(target=self.probe, name="familyhub-watchdog-probe", daemon=True).start()
+
+    def start(self) -> "WatchdogGuard":
+        threading.Thread(target=self._loop, name="familyhub-watchdog", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def check(self) -> Tuple[bool, str]:
+        """Return ``(healthy, reason)``."""
+        oldest = self.tracker.oldest_age()
+        if oldest > self.stall_seconds:
+            return False, f"oldest in-flight request running for {oldest:.1f}s"
+        p99 = self.tracker.p99(self.p99_window)
+        if p99 is not None and p99 > self.stall_seconds:
+            return False, f"p99 latency {p99:.1f}s over the last {self.p99_window:.0f}s"
+        since_probe = time.monotonic() - self.last_probe_ok
+        if since_probe > self.stall_seconds + self.probe_interval:
+            return False, f"no synthetic request completed for {since_probe:.1f}s"
+        return True, "ok"
+
+
+def build_guard(app, tracker: InflightTracker, settings) -> WatchdogGuard:
+    return WatchdogGuard(
+        app,
+        tracker,
+        stall_seconds=settings.watchdog_stall_seconds,
+        probe_path=settings.watchdog_probe_path,
+        probe_interval=settings.watchdog_probe_interval,
+    )
@@ -0,0 +1,37 @@
+"""Move settled chore occurrences older than the configured age into the archive.
+
+Usage::
+
+    python scripts/archive_chores.py [--older-than-days N] [--batch-size N]
+
+Safe to run from cron or a systemd timer while the app is serving: rows are
+moved in bounded batches, each in its own short transaction.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SKIP_ROUTES", "1")
+
+from app import app  # noqa: E402
+from db import db  # noqa: E402
+from services.archive_service import archive_old_chores  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--older-than-days", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args(argv)
+    with app.app_context():
+        moved = archive_old_chores(
+            db.engine,
+            older_than_days=args.older_than_days,
+            batch_size=args.batch_size,
+        )
+    print(f"Archived {moved} chore occurrences.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Run incremental SQLite integrity check slices outside the idle window.
+
+Usage::
+
+    python scripts/check_integrity.py DB_PATH [--full] [--slice-pages N]
+
+Without ``--full`` one slice runs (continuing from the persisted cursor);
+with ``--full`` slices run until a complete pass has finished. The verdict is
+written to ``DB_PATH.integrity.json`` where readiness probes pick it up.
+Exits 1 when any table reports integrity errors.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import get_settings  # noqa: E402
+from health.integrity import IntegrityChecker, fast_check  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("db_path")
+    parser.add_argument("--full", action="store_true", help="run slices until a full pass completes")
+    parser.add_argument("--slice-pages", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    pages = args.slice_pages or get_settings().integrity_slice_pages
+    checker = IntegrityChecker(args.db_path, page_budget=pages, timeout=30.0)
+    while True:
+        verdict = checker.run_slice()
+        print(f"checked {', '.join(verdict['last_slice']['tables']) or 'nothing'} "
+              f"in {verdict['last_slice']['ms']} ms")
+        if not args.full or not verdict["cursor"]:
+            break
+    ok, msg = fast_check(args.db_path)
+    print(json.dumps({"ok": ok, "verdict": msg}))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
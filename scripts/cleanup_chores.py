@@ -0,0 +1,48 @@
+"""Remove orphaned chore occurrences and chores with fake (UUID) task ids.
+
+Usage::
+
+    python scripts/cleanup_chores.py --dry-run        # counts only
+    python scripts/cleanup_chores.py [--only fake_chores,orphaned_chores,fake_metadata]
+        [--batch-size N] [--pause SECONDS]
+
+Safe to run while the app is serving: rows are deleted with set-based
+statements in bounded batches, each in its own short transaction (see
+``services.cleanup_service``).
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SKIP_ROUTES", "1")
+
+from app import app  # noqa: E402
+from db import db  # noqa: E402
+from services.cleanup_service import TARGETS, cleanup_chores, count_cleanup  # noqa: E402
+
+
+def main(argv=None, default_targets=tuple(TARGETS)):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="count matching rows without deleting")
+    parser.add_argument("--only", default=",".join(default_targets), help="comma-separated targets")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between batches")
+    args = parser.parse_args(argv)
+    targets = [t for t in args.only.split(",") if t]
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(unknown)} (known: {', '.join(TARGETS)})")
+
+    with app.app_context():
+        if args.dry_run:
+            for target, n in count_cleanup(db.engine, targets).items():
+                print(f"{target}: {n} rows would be deleted")
+            return
+        deleted = cleanup_chores(db.engine, targets=targets, batch_size=args.batch_size, pause=args.pause)
+    for target, n in deleted.items():
+        print(f"{target}: deleted {n} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+"""Generate a large synthetic FamilyHub dataset for scale testing.
+
+Creates users, recurring chore definitions (``chore_metadata``), every
+occurrence of those chores over ``--days`` days up to a week from today
+(``chores``), an ``earn`` ledger entry per completion, weekly reward
+redemptions and - with ``--meals-json`` - a dinner per day as Google
+Calendar event bodies for the fake Google server
+(``benchmarks/fake_google.py --events-file``).
+
+Past occurrences are completed with probability ``--completion-rate`` and
+ignored otherwise, except the last ``--overdue-days`` days, which stay
+pending as if the overdue sweep had not run yet.
+
+Everything is written with ``executemany`` in a single transaction. On
+SQLite the connection also relaxes durability for the run
+(``synchronous=OFF``, in-memory rollback journal, large page cache) and the
+secondary indexes of ``chores``/``points_ledger`` are rebuilt once at the
+end instead of row by row, so a million-row fixture builds in seconds; the
+previous journal mode is restored afterwards. Do not point it at a database you cannot rebuild.
+
+Usage::
+
+    python scripts/generate_data.py [--users 4] [--chores 25] [--days 730]
+        [--completion-rate 0.8] [--overdue-days 0] [--meals-json meals.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from bootstrap.migrations import apply_pending  # noqa: E402
+from config import get_settings  # noqa: E402
+from sql_compat import insert_ignore_stmt  # noqa: E402
+
+# Recurrence rules in the shapes ``chores_service._parse_rrule`` understands,
+# weighted towards the common daily/weekday chores
+RULES = (
+    "RRULE:FREQ=DAILY",
+    "RRULE:FREQ=DAILY",
+    "RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "RRULE:FREQ=WEEKLY;BYDAY=SA,SU",
+    "RRULE:FREQ=WEEKLY;BYDAY=SA",
+    "RRULE:FREQ=WEEKLY;BYDAY=MO,TH",
+)
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_NAMES = ("Briggs", "Hayes", "Harper", "Rowan", "Emery", "Quinn", "Sage", "Reese")
+_COLORS = ("#7dd3fc", "#a7f3d0", "#fca5a5", "#fde68a", "#c4b5fd", "#f9a8d4")
+_CHORES = (
+    "Make your bed", "Feed the dog", "Empty the dishwasher", "Take out the trash",
+    "Water plants", "Fold laundry", "Tidy the living room", "Set the table",
+    "Clear the table", "Sweep the kitchen", "Walk the dog", "Vacuum the stairs",
+)
+_DINNERS = (
+    "Tacos", "Spaghetti", "Chicken curry", "Pizza night", "Stir fry", "Chili",
+    "Salmon and rice", "Burgers", "Soup and sandwiches", "Pancakes for dinner",
+)
+
+RELAXED_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA cache_size=-262144",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def user_names(count: int) -> List[str]:
+    """``count`` user names: the stock names first, then ``Kid N``."""
+    return [_NAMES[n] if n < len(_NAMES) else f"Kid {n + 1}" for n in range(count)]
+
+
+def _rule_weekdays(rule: str) -> frozenset:
+    """Weekdays (0=Monday) a rule from :data:`RULES` falls on."""
+    body = rule.upper()
+    if "BYDAY=" in body:
+        days = body.split("BYDAY=", 1)[1].split(";", 1)[0].split(",")
+        return frozenset(_WEEKDAYS[d] for d in days)
+    return frozenset(range(7))
+
+
+def _insert_many(conn, table_name: str, columns: Sequence[str], rows: List[tuple]) -> None:
+    """``executemany`` of tuple ``rows``; straight to the DBAPI cursor on SQLite.
+
+    SQLAlchemy's per-row parameter processing costs more than SQLite's own
+    insert work at this volume.
+    """
+    if not rows:
+        return
+    if conn.dialect.name == "sqlite":
+        sql = f"INSERT INTO {table_name}({', '.join(columns)}) VALUES({', '.join('?' * len(columns))})"
+        conn.connection.driver_connection.cursor().executemany(sql, rows)
+        return
+    sql = f"INSERT INTO {table_name}({', '.join(columns)}) VALUES({', '.join(':' + c for c in columns)})"
+    conn.execute(text(sql), [dict(zip(columns, row)) for row in rows])
+
+
+def _drop_indexes(conn, tables: Sequence[str]) -> List[str]:
+    """Drop the explicit indexes on ``tables`` (SQLite); returns their DDL.
+
+    Rebuilding an index once over sorted data is cheaper than updating it
+    row by row; constraint indexes (``sqlite_autoindex_*``) have no DDL and
+    stay.
+    """
+    if conn.dialect.name != "sqlite":
+        return []
+    rows = conn.execute(
+        text(
+            "SELECT name, sql FROM sqlite_master WHERE type='index' AND sql IS NOT NULL "
+            f"AND tbl_name IN ({', '.join(repr(t) for t in tables)})"
+        )
+    ).fetchall()
+    for name, _ in rows:
+        conn.exec_driver_sql(f'DROP INDEX "{name}"')
+    return [ddl for _, ddl in rows]
+
+
+def meal_events(first: date, last: date, *, seed: int = 1) -> List[Dict]:
+    """Calendar event bodies: a dinner every day, lunch at weekends."""
+    rng = random.Random(seed)
+    events = []
+    day = first
+    while day <= last:
+        end = (day + timedelta(days=1)).isoformat()
+        events.append({"summary": rng.choice(_DINNERS), "start": {"date": day.isoformat()}, "end": {"date": end}})
+        if day.weekday() >= 5:
+            events.append({"summary": "Lunch out", "start": {"date": day.isoformat()}, "end": {"date": end}})
+        day += timedelta(days=1)
+    return events
+
+
+def generate(
+    engine,
+    *,
+    users: Sequence[str],
+    chores: int = 25,
+    days: int = 730,
+    until: Optional[date] = None,
+    rules: Sequence[str] = RULES,
+    completion_rate: float = 0.8,
+    overdue_days: int = 0,
+    redeem_rate: float = 0.5,
+    prefix: str = "gen",
+    seed: int = 1,
+) -> Dict[str, int]:
+    """Bulk-insert the dataset described in the module docstring.
+
+    Occurrences run from ``until - days + 1`` to ``until`` (default: a week
+    from today). Returns row counts per table. Raises ``ValueError`` when
+    ``chore_metadata`` already holds chores with ``prefix``.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    until = until or today + timedelta(days=7)
+    first = until - timedelta(days=days - 1)
+    sqlite = engine.dialect.name == "sqlite"
+    counts: Dict[str, int] = {}
+
+    with engine.connect() as conn:
+        previous_journal = None
+        if sqlite:
+            previous_journal = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+            for pragma in RELAXED_PRAGMAS:
+                conn.exec_driver_sql(pragma)
+            conn.commit()
+        try:
+            with conn.begin():
+                taken = conn.execute(
+                    text("SELECT COUNT(*) FROM chore_metadata WHERE task_id LIKE :p"), {"p": f"{prefix}-%"}
+                ).scalar()
+                if taken:
+                    raise ValueError(f"chore_metadata already has {prefix}-* chores; pass another --prefix")
+                palette = [{"name": n, "color": _COLORS[i % len(_COLORS)], "avatar": n[:1]} for i, n in enumerate(users)]
+                conn.execute(insert_ignore_stmt(conn.dialect.name, "users", palette))
+                counts["users"] = len(users)
+
+                definitions = []
+                for n in range(chores):
+                    rule = rules[n % len(rules)]
+                    definitions.append(
+                        {
+                            "task_id": f"{prefix}-{n}",
+                            "title": _CHORES[n % len(_CHORES)] + (f" {n // len(_CHORES) + 1}" if n >= len(_CHORES) else ""),
+                            "assigned_to": users[n % len(users)],
+                            "recurrence": rule,
+                            "points": 1 + n % 5,
+                            "_days": _rule_weekdays(rule),
+                        }
+                    )
+                conn.execute(
+                    text(
+                        "INSERT INTO chore_metadata(task_id, title, assigned_to, recurrence, points) "
+                        "VALUES(:task_id, :title, :assigned_to, :recurrence, :points)"
+                    ),
+                    [{k: v for k, v in d.items() if k != "_days"} for d in definitions],
+                )
+                counts["chore_metadata"] = len(definitions)
+
+                rewards = [tuple(r) for r in conn.execute(text("SELECT id, cost_points FROM rewards WHERE active=1"))]
+                next_id = (conn.execute(text("SELECT MAX(id) FROM chores")).scalar() or 0) + 1
+                occurrences: List[tuple] = []
+                ledger: List[tuple] = []
+                redemptions: List[tuple] = []
+                balances = dict.fromkeys(users, 0)
+                pending_from = today - timedelta(days=overdue_days)
+                day = first
+                while day <= until:
+                    weekday = day.weekday()
+                    due = day.isoformat()
+                    evening = f"{due} 18:00:00"
+                    swept = f"{(day + timedelta(days=1)).isoformat()} 00:05:00"
+                    for d in definitions:
+                        if weekday not in d["_days"]:
+                            continue
+                        if day >= pending_from:
+                            occurrences.append((next_id, d["task_id"], due, "pending", None, None))
+                        elif rng.random() < completion_rate:
+                            occurrences.append((next_id, d["task_id"], due, "completed", evening, None))
+                            ledger.append((d["assigned_to"], str(next_id), d["points"], "earn", evening))
+                            balances[d["assigned_to"]] += d["points"]
+                        else:
+                            occurrences.append((next_id, d["task_id"], due, "ignored", None, swept))
+                        next_id += 1
+                    # Saturday: everyone may cash in points for a reward
+                    if weekday == 5 and day < today and rewards:
+                        for name in users:
+                            affordable = [r for r in rewards if r[1] <= balances[name]]
+                            if affordable and rng.random() < redeem_rate:
+                                reward_id, cost = rng.choice(affordable)
+                                stamp = f"{due} 10:00:00"
+                                balances[name] -= cost
+                                redemptions.append((name, reward_id, cost, "fulfilled", stamp))
+                                ledger.append((name, None, -cost, "redeem", stamp))
+                    day += timedelta(days=1)
+
+                indexes = _drop_indexes(conn, ("chores", "points_ledger"))
+                _insert_many(
+                    conn, "chores", ("id", "task_id", "due_date", "status", "completed_at", "ignored_at"), occurrences
+                )
+                _insert_many(conn, "points_ledger", ("user_name", "task_id", "points", "kind", "occurred_at"), ledger)
+                _insert_many(
+                    conn, "redemptions", ("user_name", "reward_id", "points", "status", "created_at"), redemptions
+                )
+                for ddl in indexes:
+                    conn.exec_driver_sql(ddl)
+                counts["chores"] = len(occurrences)
+                counts["points_ledger"] = len(ledger)
+                counts["redemptions"] = len(redemptions)
+        finally:
+            if previous_journal:
+                conn.exec_driver_sql(f"PRAGMA journal_mode={previous_journal}")
+                conn.commit()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--chores", type=int, default=25, help="recurring chore definitions")
+    parser.add_argument("--days", type=int, default=730, help="days of occurrences, ending a week from today")
+    parser.add_argument("--completion-rate", type=float, default=0.8, help="share of past occurrences completed")
+    parser.add_argument("--overdue-days", type=int, default=0, help="recent past days left pending")
+    parser.add_argument("--redeem-rate", type=float, default=0.5, help="chance a user redeems a reward each Saturday")
+    parser.add_argument("--prefix", default="gen", help="task_id prefix of generated chores")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--meals-json", metavar="PATH", help="also write meal events for fake_google.py --events-file")
+    parser.add_argument("--no-migrate", action="store_true", help="do not apply pending migrations first")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    engine = create_engine(settings.database_url, future=True)
+    if not args.no_migrate:
+        apply_pending(engine)
+    started = time.perf_counter()
+    try:
+        counts = generate(
+            engine,
+            users=user_names(args.users),
+            chores=args.chores,
+            days=args.days,
+            completion_rate=args.completion_rate,
+            overdue_days=args.overdue_days,
+            redeem_rate=args.redeem_rate,
+            prefix=args.prefix,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+    for table_name, n in counts.items():
+        print(f'{table_name:<15} {n:>10}')
+    print(f'Generated {sum(counts.values())} rows in {elapsed:.1f}s.')
+    if args.meals_json:
+        until = date.today() + timedelta(days=7)
+        events = meal_events(until - timedelta(days=args.days - 1), until, seed=args.seed)
+        with open(args.meals_json, 'w', encoding='utf-8') as fh:
+            json.dump(events, fh)
+        print(f'Wrote {len(events)} meal events to {args.meals_json}.')
+
+
+if __name__ == '__main__':
+    main()
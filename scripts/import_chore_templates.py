@@ -0,0 +1,52 @@
+"""Import a chore template catalog (CSV or JSON) in bulk.
+
+Rows are matched on (name, category): new pairs are inserted, pairs whose
+``is_active`` differs are updated, everything else is left alone, so
+re-running an import is a no-op. Run pending migrations first; the upsert
+needs the unique (name, category) index from 011_chore_templates_unique.sql.
+
+Usage::
+
+    python scripts/import_chore_templates.py catalog.csv [--dry-run]
+    python scripts/import_chore_templates.py catalog.json [--format json]
+
+CSV files need a ``name,category[,is_active]`` header; JSON files hold a list
+of ``{"name": ..., "category": ..., "is_active": ...}`` objects or
+``[name, category]`` pairs.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from config import get_settings  # noqa: E402
+from services.templates_service import import_templates, parse_catalog  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="catalog file")
+    parser.add_argument("--format", choices=("csv", "json"), help="default: from the file extension")
+    parser.add_argument("--dry-run", action="store_true", help="report counts without writing")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("json" if args.path.lower().endswith(".json") else "csv")
+    with open(args.path, encoding="utf-8-sig", newline="") as fh:
+        data = fh.read()
+    try:
+        rows = parse_catalog(data, fmt)
+        engine = create_engine(get_settings().database_url, future=True)
+        with engine.begin() as conn:
+            result = import_templates(conn, rows, dry_run=args.dry_run)
+    except ValueError as exc:
+        print(f'{args.path}: {exc}', file=sys.stderr)
+        sys.exit(1)
+    prefix = 'Would import' if args.dry_run else 'Imported'
+    print(f'{prefix}: {result.inserted} inserted, {result.updated} updated, {result.unchanged} unchanged.')
+
+
+if __name__ == '__main__':
+    main()
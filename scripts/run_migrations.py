@@ -1,17 +1,60 @@
-"""Simple migration runner executing SQL files in migrations/ directory."""
-from pathlib import Path
-from sqlalchemy import create_engine, text
-from config import get_settings
+"""Incremental migration runner for SQL files in migrations/ directory.
 
+Only files not yet recorded in ``schema_migrations`` are executed; see
+``bootstrap.migrations`` for details.
+
+Usage::
+
+    python scripts/run_migrations.py             # apply pending files
+    python scripts/run_migrations.py --status    # list pending files
+    python scripts/run_migrations.py --baseline 008
+        # mark files up to 008 as applied (databases migrated by hand before
+        # schema_migrations existed)
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from bootstrap.migrations import (  # noqa: E402
+    MigrationError,
+    apply_pending,
+    baseline,
+    pending_migrations,
+)
+from config import get_settings  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply pending SQL migrations.")
+    parser.add_argument("--status", action="store_true", help="list pending migrations and exit")
+    parser.add_argument("--baseline", metavar="VERSION", help="record migrations up to VERSION as applied")
+    args = parser.parse_args(argv)
 
-def main():
     settings = get_settings()
     engine = create_engine(settings.database_url, future=True)
-    mig_dir = Path(__file__).resolve().parent.parent / 'migrations'
-    for path in sorted(mig_dir.glob('*.sql')):
-        with engine.begin() as conn, open(path, 'r', encoding='utf-8') as f:
-            conn.connection.executescript(f.read())
-            print(f'Applied {path.name}')
+    if args.status:
+        pending = pending_migrations(engine)
+        for m in pending:
+            print(f'Pending {m.name}')
+        print(f'{len(pending)} pending migration(s).')
+        return
+    if args.baseline:
+        for m in baseline(engine, args.baseline):
+            print(f'Baselined {m.name}')
+        return
+    try:
+        applied = apply_pending(engine)
+    except MigrationError as exc:
+        print(exc, file=sys.stderr)
+        sys.exit(1)
+    for m in applied:
+        print(f'Applied {m.name}')
+    if not applied:
+        print('Schema up to date.')
 
 
 if __name__ == '__main__':
@@ -1,13 +1,15 @@
 """Seeds the database with a default set of chore templates.
 
 This script is idempotent, meaning it can be run multiple times without creating
-duplicate entries. It checks for existing chore templates by name and category
-before inserting new ones.
+duplicate entries. The SEED list goes through the bulk template import
+(``services.templates_service``), which upserts on the unique
+(name, category) index and leaves existing templates untouched.
 """
 
 from app import app  # provides app context
 from db import db  # << use the shared SQLAlchemy instance
-from models import ChoreTemplate
+import models  # noqa: F401  # registers ChoreTemplate for create_all
+from services.templates_service import import_templates
 
 # A list of (chore_name, category) tuples to be seeded into the database.
 SEED = [
@@ -70,24 +72,14 @@ def run():
         # Ensure that the database tables are created before seeding.
         db.create_all()
 
-        # Fetch existing chore templates to avoid creating duplicates.
-        existing = {(t.name, t.category) for t in ChoreTemplate.query.all()}
-        # Determine which templates from the SEED list are new.
-        to_add = [
-            ChoreTemplate(name=n, category=c)
-            for (n, c) in SEED
-            if (n, c) not in existing
-        ]
+        with db.engine.begin() as conn:
+            result = import_templates(conn, [{"name": n, "category": c} for (n, c) in SEED])
 
-        if to_add:
-            # If there are new templates, add them to the database in a single bulk operation.
-            db.session.bulk_save_objects(to_add)
-            db.session.commit()
-            print(f"Seeded {len(to_add)} chore templates (added only missing).")
+        if result.inserted:
+            print(f"Seeded {result.inserted} chore templates (added only missing).")
         else:
             # If no new templates are found, report that the database is up to date.
-            count = ChoreTemplate.query.count()
-            print(f"Chore templates already up to date ({count} rows).")
+            print(f"Chore templates already up to date ({result.unchanged} rows).")
 
 
 if __name__ == "__main__":
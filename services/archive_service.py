@@ -0,0 +1,202 @@
+"""Hot/cold archival of settled chore occurrences.
+
+The ``chores`` table only grows: every completed or ignored occurrence stays
+in it forever, which makes unbounded service queries and database integrity
+checks slower over time. This module moves settled occurrences older than a
+configurable age into ``chores_archive`` (optionally living in a separate,
+ATTACHed SQLite file) in bounded batches, each in its own short transaction so
+the kiosk never waits behind a long write lock.
+
+Readers use :func:`needs_archive` to decide whether a requested date range
+reaches past the archive cutoff and :func:`fetch_archived_rows` to pull the
+cold rows in that case. The read path runs no DDL: the table is created by
+migration 009 in the main database, or by :func:`ensure_archive` at startup
+(``app.init_database``) in a separate archive file.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+import logging
+
+from sqlalchemy import bindparam, text
+
+from config import get_settings
+
+logger = logging.getLogger("archive_service")
+
+ARCHIVE_SCHEMA = "archive"
+ARCHIVE_TABLE = "chores_archive"
+# Key in the pooled DBAPI connection's ``info`` recording the attached file
+_ATTACHED = "familyhub_archive_path"
+
+# Only settled occurrences are archived; pending ones stay hot.
+SETTLED_STATUSES = ("completed", "ignored")
+
+_ARCHIVE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    due_date DATE NOT NULL,
+    status TEXT,
+    completed_at TIMESTAMP,
+    ignored_at TIMESTAMP,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def archive_cutoff(today: Optional[date] = None, after_days: Optional[int] = None) -> date:
+    """Return the first due date that is still kept in the hot table."""
+    if after_days is None:
+        after_days = get_settings().archive_after_days
+    return (today or date.today()) - timedelta(days=after_days)
+
+
+def needs_archive(
+    start: Optional[date], *, include_completed: bool = True, today: Optional[date] = None
+) -> bool:
+    """Return True when a range starting at ``start`` reaches archived rows.
+
+    Open-ended ranges (``start is None``) are treated as "current" views and
+    only read the hot table; callers wanting full history pass an explicit
+    start date.
+    """
+    if not include_completed or start is None:
+        return False
+    return start < archive_cutoff(today)
+
+
+def attach_archive(conn, archive_path: Optional[str] = None) -> str:
+    """Return the archive table's qualified name, ATTACHing its file if needed.
+
+    When ``archive_path`` (or ``Settings.archive_database_path``) is set the
+    file is ATTACHed to ``conn`` as ``archive``. ATTACH is per-connection, so
+    this must run before any other statement in the connection's
+    transaction; the pooled connection remembers the attached file, so later
+    checkouts skip it.
+    """
+    if archive_path is None:
+        archive_path = get_settings().archive_database_path
+    if not archive_path:
+        return ARCHIVE_TABLE
+    info = conn.connection.info
+    if info.get(_ATTACHED) != archive_path:
+        if info.pop(_ATTACHED, None):
+            conn.exec_driver_sql(f"DETACH DATABASE {ARCHIVE_SCHEMA}")
+        conn.execute(text(f"ATTACH DATABASE :path AS {ARCHIVE_SCHEMA}"), {"path": archive_path})
+        info[_ATTACHED] = archive_path
+    return f"{ARCHIVE_SCHEMA}.{ARCHIVE_TABLE}"
+
+
+def ensure_archive(conn, archive_path: Optional[str] = None) -> str:
+    """Make sure the archive table exists and return its qualified name.
+
+    Write-side counterpart of :func:`attach_archive`, also run once at
+    startup so readers never need the DDL.
+    """
+    table = attach_archive(conn, archive_path)
+    conn.exec_driver_sql(_ARCHIVE_DDL.format(table=table))
+    return table
+
+
+def archive_old_chores(
+    engine,
+    *,
+    older_than_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    archive_path: Optional[str] = None,
+    today: Optional[date] = None,
+    max_batches: Optional[int] = None,
+) -> int:
+    """Move settled occurrences due before the cutoff into the archive.
+
+    Each batch of at most ``batch_size`` rows is copied and deleted inside its
+    own transaction. Returns the total number of rows moved.
+    """
+    settings = get_settings()
+    batch_size = batch_size or settings.archive_batch_size
+    cutoff = archive_cutoff(today, older_than_days).isoformat()
+
+    select_ids = text(
+        """
+        SELECT id FROM chores
+        WHERE status IN :statuses AND due_date < :cutoff
+        ORDER BY id
+        LIMIT :n
+        """
+    ).bindparams(bindparam("statuses", expanding=True))
+
+    moved = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        with engine.begin() as conn:
+            table = ensure_archive(conn, archive_path)
+            ids = [
+                row[0]
+                for row in conn.execute(
+                    select_ids,
+                    {"statuses": list(SETTLED_STATUSES), "cutoff": cutoff, "n": batch_size},
+                )
+            ]
+            if not ids:
+                break
+            params = {"ids": ids, "now": datetime.utcnow().isoformat(sep=" ")}
+            conn.execute(
+                text(
+                    f"""
+                    INSERT INTO {table}(id, task_id, due_date, status, completed_at, ignored_at, archived_at)
+                    SELECT id, task_id, due_date, status, completed_at, ignored_at, :now
+                    FROM chores WHERE id IN :ids
+                    """
+                ).bindparams(bindparam("ids", expanding=True)),
+                params,
+            )
+            conn.execute(
+                text("DELETE FROM chores WHERE id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                params,
+            )
+        moved += len(ids)
+        batches += 1
+        if len(ids) < batch_size:
+            break
+    logger.info("archive_old_chores: moved=%d batches=%d cutoff=%s", moved, batches, cutoff)
+    return moved
+
+
+def fetch_archived_rows(
+    conn,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    *,
+    archive_path: Optional[str] = None,
+) -> List[tuple]:
+    """Return archived occurrences joined with their chore definition.
+
+    Rows are ``(id, title, assigned_to, due_date, status, points)`` tuples with
+    ``due_date`` as a :class:`date`, ordered by due date. Orphaned rows (no
+    matching ``chore_metadata``) are skipped like in the hot path.
+    """
+    table = attach_archive(conn, archive_path)
+    sql = (
+        f"SELECT a.id, m.title, m.assigned_to, a.due_date, a.status, m.points "
+        f"FROM {table} a JOIN chore_metadata m ON m.task_id = a.task_id WHERE 1=1"
+    )
+    params: dict = {}
+    if start:
+        sql += " AND a.due_date >= :start"
+        params["start"] = start.isoformat()
+    if end:
+        sql += " AND a.due_date <= :end"
+        params["end"] = end.isoformat()
+    sql += " ORDER BY a.due_date ASC, a.id ASC"
+    rows = []
+    for r in conn.execute(text(sql), params):
+        due = r[3]
+        if isinstance(due, str):
+            due = date.fromisoformat(due[:10])
+        rows.append((r[0], r[1], r[2], due, r[4], r[5]))
+    return rows
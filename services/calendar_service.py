@@ -14,17 +14,31 @@ from __future__ import annotations
 import os
 import datetime as dt
 import logging
-from typing import Dict, List
+import threading
+import time
+import zoneinfo
+from typing import Dict, List, Tuple
 
-import pytz
-from dateutil.relativedelta import relativedelta
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from runtime.metrics import cache_lookup
+from runtime.tracing import span
+from services.google_api import api_endpoint, build_service, execute_pages
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
 logger = logging.getLogger("calendar_service")
 
+# Successful get_meals() results keyed by (calendar id, window, local day);
+# errors are never cached. See MEALS_CACHE_TTL / clear_cache().
+MEALS_CACHE_TTL = float(os.getenv("FAMILYHUB_MEALS_CACHE_TTL", "300"))
+_cache: Dict[Tuple[str, int, str], Tuple[float, Dict[str, List[str]]]] = {}
+_cache_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Drop all cached meal mappings."""
+    with _cache_lock:
+        _cache.clear()
+
 
 def _window_dates(center: dt.datetime, days: int = 7) -> List[str]:
     """Generates a list of ISO date strings for a window around a center date.
@@ -37,11 +51,12 @@ def _window_dates(center: dt.datetime, days: int = 7) -> List[str]:
         A list of date strings in 'YYYY-MM-DD' format.
     """
     return [
-        (center + relativedelta(days=offset)).date().isoformat()
+        (center + dt.timedelta(days=offset)).date().isoformat()
         for offset in range(-days, days + 1)
     ]
 
 
+@span("calendar.get_meals")
 def get_meals(calendar_id: str | None = None, *, days: int = 7) -> Dict[str, List[str]]:
     """Fetch dinner (meal) events from the configured Google Calendar.
 
@@ -61,7 +76,7 @@ def get_meals(calendar_id: str | None = None, *, days: int = 7) -> Dict[str, Lis
     logger.info("get_meals called (days=%s)", days)
     # Check for Google credentials
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    if not creds_path or not os.path.exists(creds_path):
+    if not api_endpoint() and (not creds_path or not os.path.exists(creds_path)):
         logger.error("Credentials path missing or file not found: %s", creds_path)
         return {"error": "Missing GOOGLE_APPLICATION_CREDENTIALS or file not found"}
 
@@ -74,43 +89,46 @@ def get_meals(calendar_id: str | None = None, *, days: int = 7) -> Dict[str, Lis
     # Determine the timezone for date calculations
     tz_name = os.getenv("FAMILYHUB_TZ", "America/Chicago")
     try:
-        tz = pytz.timezone(tz_name)
+        tz = zoneinfo.ZoneInfo(tz_name)
     except Exception:  # pragma: no cover
         logger.warning("Invalid timezone %s, defaulting to America/Chicago", tz_name)
-        tz = pytz.timezone("America/Chicago")
+        tz = zoneinfo.ZoneInfo("America/Chicago")
 
     # Define the time window for fetching calendar events
     now = dt.datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
-    start_dt = now - relativedelta(days=days)
-    end_dt = now + relativedelta(days=days, hours=23, minutes=59)
+    cache_key = (cal_id, days, now.date().isoformat())
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+    hit = bool(cached and cached[0] > time.monotonic())
+    cache_lookup("meals", hit)
+    if hit:
+        logger.info("get_meals: cache hit for %s", cache_key[2])
+        return {d: list(titles) for d, titles in cached[1].items()}
+    start_dt = now - dt.timedelta(days=days)
+    end_dt = now + dt.timedelta(days=days, hours=23, minutes=59)
     logger.info(
         "Fetching events window %s -> %s", start_dt.isoformat(), end_dt.isoformat()
     )
 
     try:
-        # Authenticate and build the Google Calendar service
-        creds = service_account.Credentials.from_service_account_file(
-            creds_path, scopes=SCOPES
-        )
-        svc = build("calendar", "v3", credentials=creds, cache_discovery=False)
-        # Fetch events from the calendar
-        res = (
-            svc.events()
-            .list(
-                calendarId=cal_id,
-                timeMin=start_dt.isoformat(),
-                timeMax=end_dt.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
+        # Authenticate and build the Google Calendar service (the client
+        # libraries are imported there, on first use)
+        svc = build_service("calendar", "v3", SCOPES, creds_path)
+        # Fetch events from the calendar, following every page
+        items = execute_pages(
+            svc.events(),
+            "calendar.events.list",
+            calendarId=cal_id,
+            timeMin=start_dt.isoformat(),
+            timeMax=end_dt.isoformat(),
+            singleEvents=True,
+            orderBy="startTime",
         )
     except Exception as exc:  # pragma: no cover
         logger.exception("Failed fetching calendar events: %s", exc)
         return {"error": f"Exception fetching events: {exc}"}
 
     # Process the fetched events
-    items = res.get("items", [])
     logger.info("Fetched %d calendar events", len(items))
     # Initialize the output dictionary with all dates in the window
     out: Dict[str, List[str]] = {d: [] for d in _window_dates(now, days=days)}
@@ -123,4 +141,8 @@ def get_meals(calendar_id: str | None = None, *, days: int = 7) -> Dict[str, Lis
         # Add the event summary to the corresponding date in the output
         if start in out:
             out[start].append(e.get("summary", "Dinner"))
+    if MEALS_CACHE_TTL > 0:
+        with _cache_lock:
+            _cache[cache_key] = (time.monotonic() + MEALS_CACHE_TTL, out)
+        return {d: list(titles) for d, titles in out.items()}
     return out
@@ -15,6 +15,7 @@ from typing import List, Optional
 import logging
 
 from flask import has_app_context
+from sqlalchemy.orm import joinedload
 
 from db import db
 from models import ChoreMetadata, ChoreOccurrence
@@ -27,6 +28,9 @@ from tasks_api import (
     TASK_LIST_ID,
 )
 from .schedule_utils import to_utc_midnight_rfc3339
+from .archive_service import fetch_archived_rows, needs_archive
+from .google_api import execute
+from runtime.tracing import span
 
 logger = logging.getLogger("chores_service")
 
@@ -92,8 +96,14 @@ class ChoreDTO:
         self.completed = status == 'completed'
         self.points = points
 
-def fetch_chores(start: Optional[date] = None, end: Optional[date] = None, *, include_completed=True, limit=None) -> List[ChoreDTO]:
-    """Fetch all chore occurrences, optionally filtered by date/status."""
+@span("fetch_chores")
+def fetch_chores(start: Optional[date] = None, end: Optional[date] = None, *, include_completed=True, limit=None, include_archived: Optional[bool] = None) -> List[ChoreDTO]:
+    """Fetch all chore occurrences, optionally filtered by date/status.
+
+    Archived occurrences (see ``services.archive_service``) are unioned in only
+    when the requested range starts before the archive cutoff, or when
+    ``include_archived=True`` is passed explicitly.
+    """
     if not has_app_context():
         # Fallback: pull tasks from Google when no DB context is available (e.g., tests)
         service = build_google_service()
@@ -119,7 +129,9 @@ def fetch_chores(start: Optional[date] = None, end: Optional[date] = None, *, in
             )
         return dtos
 
-    q = ChoreOccurrence.query
+    # Load each occurrence's definition in the same statement (one lazy
+    # SELECT per chore otherwise)
+    q = ChoreOccurrence.query.options(joinedload(ChoreOccurrence.chore_def))
     if not include_completed:
         q = q.filter(ChoreOccurrence.status == 'pending')
     if start:
@@ -131,6 +143,12 @@ def fetch_chores(start: Optional[date] = None, end: Optional[date] = None, *, in
         q = q.limit(limit)
     results = q.all()
     dtos = []
+    if include_archived is None:
+        include_archived = needs_archive(start, include_completed=include_completed)
+    if include_archived and include_completed:
+        with db.engine.connect() as conn:
+            for row in fetch_archived_rows(conn, start, end):
+                dtos.append(ChoreDTO(*row))
     for occ in results:
         meta = occ.chore_def
         if meta is None:
@@ -146,6 +164,10 @@ def fetch_chores(start: Optional[date] = None, end: Optional[date] = None, *, in
                 points=meta.points,
             )
         )
+    if include_archived and include_completed:
+        dtos.sort(key=lambda c: c.due_date)
+        if limit:
+            dtos = dtos[:limit]
     return dtos
 
 def create_chore(title: str, assigned_to: Optional[str], due_date: date, points: int = 1, recurrence: Optional[str] = None) -> ChoreDTO:
@@ -162,7 +184,7 @@ def create_chore(title: str, assigned_to: Optional[str], due_date: date, points:
         task_body["notes"] = notes
     if recurrence:
         task_body["recurrence"] = [recurrence] if not recurrence.startswith("RRULE:") else [recurrence]
-    google_task = service.tasks().insert(tasklist=TASK_LIST_ID, body=task_body).execute()
+    google_task = execute(service.tasks().insert(tasklist=TASK_LIST_ID, body=task_body), "tasks.insert")
     task_id = google_task["id"]
     logger.info(f"create: title={title} due={due_rfc3339} recurrence={recurrence} returned_id={task_id}")
     meta = ChoreMetadata()
@@ -185,9 +207,9 @@ def complete_chore(occurrence_id: int) -> None:
     if not has_app_context():
         service = build_google_service()
         list_id = get_or_create_task_list(service, "Family chores")
-        task = service.tasks().get(tasklist=list_id, task=occurrence_id).execute()
+        task = execute(service.tasks().get(tasklist=list_id, task=occurrence_id), "tasks.get")
         task["status"] = "completed"
-        service.tasks().update(tasklist=list_id, task=occurrence_id, body=task).execute()
+        execute(service.tasks().update(tasklist=list_id, task=occurrence_id, body=task), "tasks.update")
         return
 
     occ = ChoreOccurrence.query.get(occurrence_id)
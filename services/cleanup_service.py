@@ -0,0 +1,132 @@
+"""Set-based removal of orphaned chores and chores with fake (local UUID) ids.
+
+Early versions created chores with locally generated UUIDs instead of Google
+Task ids, and deleting a chore definition used to leave its occurrences
+behind. Three targets are cleaned, in this order so no occurrence ever
+points at a definition that is already gone:
+
+* ``fake_chores`` - occurrences whose ``task_id`` is a UUID
+* ``orphaned_chores`` - occurrences without a ``chore_metadata`` row
+  (``NOT EXISTS``)
+* ``fake_metadata`` - UUID definitions no occurrence refers to any more
+
+Batches work like ``services.archive_service``: the next ``batch_size`` keys
+matching a target are read in key order (a plain read, which does not block
+the kiosk), then deleted with one ``DELETE ... WHERE key IN (...) AND
+<predicate>`` statement in its own short transaction. Re-checking the
+predicate in the DELETE keeps rows that stopped matching in between, e.g.
+an orphan whose definition was just re-created. The key scan continues after
+the last key of the previous batch, so no write transaction ever scans the
+whole table. :func:`count_cleanup` runs the same predicates as ``COUNT(*)``
+for a dry run.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import bindparam, text
+
+from config import get_settings
+
+logger = logging.getLogger("cleanup_service")
+
+_HEX = "[0-9a-fA-F]"
+# 8-4-4-4-12 hex digits, as GLOB (SQLite) and POSIX regex (PostgreSQL/MySQL)
+UUID_GLOB = "-".join(_HEX * n for n in (8, 4, 4, 4, 12))
+UUID_REGEX = "^" + "-".join(f"{_HEX}{{{n}}}" for n in (8, 4, 4, 4, 12)) + "$"
+
+# (table, key column, key below every real key, predicate); {uuid} is the
+# dialect's UUID match on the target's task_id column
+TARGETS = {
+    "fake_chores": ("chores", "id", 0, "{uuid}"),
+    "orphaned_chores": (
+        "chores",
+        "id",
+        0,
+        "NOT EXISTS (SELECT 1 FROM chore_metadata m WHERE m.task_id = chores.task_id)",
+    ),
+    "fake_metadata": (
+        "chore_metadata",
+        "task_id",
+        "",
+        "{uuid} AND NOT EXISTS (SELECT 1 FROM chores c WHERE c.task_id = chore_metadata.task_id)",
+    ),
+}
+
+
+def uuid_match(dialect_name: str, column: str) -> str:
+    """SQL predicate true when ``column`` holds a UUID-shaped id."""
+    if dialect_name == "sqlite":
+        # GLOB is built in; the regexp operator needs a user function
+        return f"{column} GLOB '{UUID_GLOB}'"
+    if dialect_name == "postgresql":
+        return f"{column} ~ '{UUID_REGEX}'"
+    if dialect_name in ("mysql", "mariadb"):
+        return f"{column} REGEXP '{UUID_REGEX}'"
+    raise NotImplementedError(f"cleanup not supported for dialect {dialect_name!r}")
+
+
+def _predicate(dialect_name: str, target: str) -> str:
+    table, _, _, predicate = TARGETS[target]
+    return predicate.format(uuid=uuid_match(dialect_name, f"{table}.task_id"))
+
+
+def count_cleanup(engine, targets: Sequence[str] = tuple(TARGETS)) -> Dict[str, int]:
+    """Rows each target would delete right now (dry run).
+
+    ``fake_metadata`` only counts definitions that are already unreferenced;
+    a real run also frees the ones whose fake occurrences it deletes first.
+    """
+    counts = {}
+    with engine.connect() as conn:
+        for target in targets:
+            table = TARGETS[target][0]
+            sql = f"SELECT COUNT(*) FROM {table} WHERE {_predicate(engine.dialect.name, target)}"
+            counts[target] = int(conn.execute(text(sql)).scalar() or 0)
+    return counts
+
+
+def cleanup_chores(
+    engine,
+    *,
+    targets: Sequence[str] = tuple(TARGETS),
+    batch_size: Optional[int] = None,
+    pause: float = 0.0,
+    max_batches: Optional[int] = None,
+) -> Dict[str, int]:
+    """Delete every target in batches of ``batch_size``; returns rows deleted per target.
+
+    ``pause`` seconds between batches leave room for other writers on a busy
+    database; ``max_batches`` caps the batches per target.
+    """
+    batch_size = batch_size or get_settings().cleanup_batch_size
+    deleted: Dict[str, int] = {}
+    for target in TARGETS:
+        if target not in targets:
+            continue
+        table, key, after, _ = TARGETS[target]
+        predicate = _predicate(engine.dialect.name, target)
+        select_keys = text(f"SELECT {key} FROM {table} WHERE {key} > :after AND {predicate} ORDER BY {key} LIMIT :n")
+        delete = text(f"DELETE FROM {table} WHERE {key} IN :keys AND {predicate}").bindparams(
+            bindparam("keys", expanding=True)
+        )
+        total = batches = 0
+        while max_batches is None or batches < max_batches:
+            with engine.connect() as conn:
+                keys = conn.execute(select_keys, {"after": after, "n": batch_size}).scalars().all()
+            if not keys:
+                break
+            with engine.begin() as conn:
+                total += conn.execute(delete, {"keys": keys}).rowcount
+            batches += 1
+            after = keys[-1]
+            if len(keys) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+        deleted[target] = total
+        logger.info("cleanup_chores: %s deleted=%d batches=%d", target, total, batches)
+    return deleted
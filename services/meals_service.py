@@ -24,6 +24,7 @@ from typing import List, Optional
 import logging
 
 from services import calendar_service
+from runtime.tracing import span
 
 logger = logging.getLogger("meals_service")
 
@@ -52,6 +53,7 @@ def _to_date(val) -> Optional[date]:
     return None
 
 
+@span("fetch_meals")
 def fetch_meals(
     *, start: Optional[date] = None, end: Optional[date] = None
 ) -> List[MealDTO]:
@@ -100,12 +102,12 @@ def fetch_meals(
         start,
         end,
     )
-    # Provide a compact per-day listing for observability (INFO so it surfaces in basic logs)
-    if ordered:
+    # Compact per-day listing for debugging; counts and latency are in /metrics
+    if ordered and logger.isEnabledFor(logging.DEBUG):
         # Group by date while preserving order for logging
         by_date: dict[date, list[str]] = {}
         for m in ordered:
             by_date.setdefault(m.date, []).append(m.title)
         for d, titles in by_date.items():  # pragma: no cover (log only)
-            logger.info("fetch_meals: day %s -> %s", d.isoformat(), ", ".join(titles))
+            logger.debug("fetch_meals: day %s -> %s", d.isoformat(), ", ".join(titles))
     return ordered
@@ -1,6 +1,9 @@
 from datetime import date, datetime, timedelta
 from sqlalchemy import text
 
+from runtime.tracing import span
+from sql_compat import insert_ignore, upsert
+
 
 def _to_date(x):
     if isinstance(x, date) and not isinstance(x, datetime):
@@ -49,21 +52,15 @@ def get_chore_points(conn, task_id: str, fallback: int = 1) -> int:
 
 
 def set_chore_points(conn, task_id: str, points: int):
-    conn.execute(text(
-        """
-        INSERT INTO chore_metadata(task_id, points) VALUES(:id,:p)
-        ON CONFLICT(task_id) DO UPDATE SET points=excluded.points
-        """
-    ), {"id": task_id, "p": points})
+    upsert(conn, "chore_metadata", {"task_id": task_id, "points": points}, index_elements=["task_id"])
 
 
 def grant_points_for_completion(conn, *, user: str, task_id: str, points: int):
-    conn.execute(text(
-        """
-        INSERT OR IGNORE INTO points_ledger(user_name, task_id, points, kind)
-        VALUES(:u, :t, :p, 'earn')
-        """
-    ), {"u": user, "t": task_id, "p": points})
+    insert_ignore(
+        conn,
+        "points_ledger",
+        {"user_name": user, "task_id": task_id, "points": points, "kind": "earn"},
+    )
 
 
 def balance(conn, user: str) -> int:
@@ -75,6 +72,7 @@ def balance(conn, user: str) -> int:
     return int(row[0] or 0)
 
 
+@span("leaderboard_week")
 def leaderboard_week(conn, start: date, end: date):
     return conn.execute(text(
         """
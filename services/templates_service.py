@@ -0,0 +1,152 @@
+"""Bulk, idempotent import of chore template catalogs.
+
+Households import catalogs of hundreds or thousands of templates; checking
+each ``(name, category)`` pair with its own query does not scale. This
+module parses a catalog (CSV or JSON), reads the existing rows for the
+catalog's categories in a few set-based queries, and writes only new and
+changed rows with batched upserts keyed by the unique ``(name, category)``
+index (``migrations/011_chore_templates_unique.sql``).
+
+Catalog rows carry ``name``, ``category`` and optionally ``is_active``.
+Rows without ``is_active`` (or with an empty CSV cell) are inserted active
+and leave existing rows as they are. Within one catalog the last row for a
+pair wins.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+
+from sql_compat import upsert
+
+TABLE = "chore_templates"
+# Rows per INSERT statement; keeps SQLite well under its bound-variable limit
+BATCH_SIZE = 500
+NAME_MAX = 120
+CATEGORY_MAX = 50
+
+_TRUE = {"1", "true", "yes", "y", "t", "on"}
+_FALSE = {"0", "false", "no", "n", "f", "off"}
+
+
+@dataclass
+class ImportResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def parse_flag(value, name: str = "is_active") -> Optional[bool]:
+    """``True``/``False`` for the usual spellings, ``None`` when blank."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    lowered = str(value).strip().lower()
+    if not lowered:
+        return None
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"invalid {name} value {value!r}")
+
+
+def normalize(rows: Iterable[Dict]) -> List[Dict]:
+    """Validate and de-duplicate catalog rows (last one per pair wins).
+
+    Raises ``ValueError`` naming the 1-based row number of the first bad row.
+    """
+    out: Dict[Tuple[str, str], Dict] = {}
+    for number, row in enumerate(rows, start=1):
+        name = str(row.get("name") or "").strip()
+        category = str(row.get("category") or "").strip()
+        if not name or not category:
+            raise ValueError(f"row {number}: name and category are required")
+        if len(name) > NAME_MAX or len(category) > CATEGORY_MAX:
+            raise ValueError(f"row {number}: name or category too long")
+        try:
+            active = parse_flag(row.get("is_active"))
+        except ValueError as exc:
+            raise ValueError(f"row {number}: {exc}") from None
+        out.pop((name, category), None)
+        out[(name, category)] = {"name": name, "category": category, "is_active": active}
+    return list(out.values())
+
+
+def parse_catalog(data: str, fmt: str) -> List[Dict]:
+    """Parse a catalog into raw row dicts.
+
+    ``csv`` needs a header with ``name`` and ``category`` columns; ``json`` is
+    a list of objects or of ``[name, category]`` pairs.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(data))
+        if not reader.fieldnames or not {"name", "category"} <= {f.strip() for f in reader.fieldnames}:
+            raise ValueError("CSV header must include name and category")
+        return [{(k or "").strip(): v for k, v in row.items()} for row in reader]
+    if fmt == "json":
+        items = json.loads(data)
+        if not isinstance(items, list):
+            raise ValueError("JSON catalog must be a list")
+        rows = []
+        for item in items:
+            if isinstance(item, dict):
+                rows.append(item)
+            elif isinstance(item, (list, tuple)) and len(item) == 2:
+                rows.append({"name": item[0], "category": item[1]})
+            else:
+                raise ValueError(f"unsupported JSON catalog entry {item!r}")
+        return rows
+    raise ValueError(f"unknown catalog format {fmt!r}")
+
+
+def _existing(conn, categories: List[str]) -> Dict[Tuple[str, str], bool]:
+    query = text(f"SELECT name, category, is_active FROM {TABLE} WHERE category IN :cats").bindparams(
+        bindparam("cats", expanding=True)
+    )
+    found: Dict[Tuple[str, str], bool] = {}
+    for start in range(0, len(categories), BATCH_SIZE):
+        for name, category, active in conn.execute(query, {"cats": categories[start:start + BATCH_SIZE]}):
+            found[(name, category)] = bool(active) if active is not None else True
+    return found
+
+
+def import_templates(conn, rows: Iterable[Dict], *, dry_run: bool = False) -> ImportResult:
+    """Upsert catalog ``rows`` on ``conn``; returns inserted/updated/unchanged counts.
+
+    Runs in the caller's transaction. With ``dry_run`` nothing is written.
+    """
+    catalog = normalize(rows)
+    existing = _existing(conn, sorted({r["category"] for r in catalog}))
+    result = ImportResult()
+    writes = []
+    for row in catalog:
+        key = (row["name"], row["category"])
+        if key not in existing:
+            result.inserted += 1
+            writes.append(dict(row, is_active=True if row["is_active"] is None else row["is_active"]))
+        elif row["is_active"] is not None and row["is_active"] != existing[key]:
+            result.updated += 1
+            writes.append(row)
+        else:
+            result.unchanged += 1
+    if not dry_run:
+        for start in range(0, len(writes), BATCH_SIZE):
+            upsert(
+                conn,
+                TABLE,
+                writes[start:start + BATCH_SIZE],
+                index_elements=["name", "category"],
+                update=["is_active"],
+            )
+    return result
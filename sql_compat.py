@@ -0,0 +1,91 @@
+"""Dialect-aware INSERT helpers built on SQLAlchemy Core.
+
+Service code used to hard-code SQLite-only ``INSERT OR IGNORE``. These helpers
+compile to the right statement for the connection's dialect instead:
+
+* SQLite / PostgreSQL: ``INSERT ... ON CONFLICT DO NOTHING`` /
+  ``ON CONFLICT (...) DO UPDATE SET ...``
+* MySQL / MariaDB: ``INSERT IGNORE`` / ``ON DUPLICATE KEY UPDATE``
+
+Tables are addressed by name with lightweight :func:`sqlalchemy.table`
+clauses, so callers do not need ORM models for raw-SQL tables such as
+``points_ledger``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import column, table
+from sqlalchemy.sql import Insert
+
+
+def _table(name: str, columns: Iterable[str]):
+    return table(name, *(column(c) for c in columns))
+
+
+def _dialect_insert(dialect_name: str, tbl) -> Insert:
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert
+    else:
+        raise NotImplementedError(f"upsert not supported for dialect {dialect_name!r}")
+    return insert(tbl)
+
+
+def insert_ignore_stmt(
+    dialect_name: str, table_name: str, values: Mapping[str, Any] | Sequence[Mapping[str, Any]]
+) -> Insert:
+    """Return an INSERT that silently skips rows violating a unique constraint."""
+    rows = [values] if isinstance(values, Mapping) else list(values)
+    stmt = _dialect_insert(dialect_name, _table(table_name, rows[0])).values(rows)
+    if dialect_name in ("mysql", "mariadb"):
+        return stmt.prefix_with("IGNORE")
+    return stmt.on_conflict_do_nothing()
+
+
+def upsert_stmt(
+    dialect_name: str,
+    table_name: str,
+    values: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+    *,
+    index_elements: Sequence[str],
+    update: Optional[Sequence[str]] = None,
+) -> Insert:
+    """Return an INSERT that updates ``update`` columns on key conflict.
+
+    ``index_elements`` names the unique key columns; ``update`` defaults to
+    every non-key column in ``values``.
+    """
+    rows = [values] if isinstance(values, Mapping) else list(values)
+    stmt = _dialect_insert(dialect_name, _table(table_name, rows[0])).values(rows)
+    if update is None:
+        update = [c for c in rows[0] if c not in index_elements]
+    if dialect_name in ("mysql", "mariadb"):
+        return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update})
+    if not update:
+        return stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={c: stmt.excluded[c] for c in update},
+    )
+
+
+def insert_ignore(conn, table_name: str, values) -> int:
+    """Insert ``values`` into ``table_name`` unless a unique key already exists.
+
+    Returns the number of rows actually inserted.
+    """
+    result = conn.execute(insert_ignore_stmt(conn.dialect.name, table_name, values))
+    return result.rowcount
+
+
+def upsert(conn, table_name: str, values, *, index_elements: Sequence[str], update=None) -> int:
+    """Insert ``values`` or update the conflicting row; see :func:`upsert_stmt`."""
+    stmt = upsert_stmt(
+        conn.dialect.name, table_name, values, index_elements=index_elements, update=update
+    )
+    return conn.execute(stmt).rowcount
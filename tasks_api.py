@@ -12,8 +12,8 @@ import re
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from runtime.metrics import cache_lookup
+from services.google_api import api_endpoint, build_service, execute, execute_pages
 
 logger = logging.getLogger("tasks_api")
 
@@ -23,17 +23,16 @@ SCOPES = ["https://www.googleapis.com/auth/tasks"]
 def build_google_service():
     """Return a Google Tasks service instance.
 
-    Recreates on each call to avoid stale credentials and ease testing.
+    Recreates on each call to avoid stale credentials and ease testing. The
+    Google client libraries are imported here, on first use, so importing this
+    module (and the app) stays cheap. No credentials are needed when
+    ``FAMILYHUB_GOOGLE_API_ENDPOINT`` points at a local fake.
     """
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    if not creds_path or not os.path.exists(creds_path):  # pragma: no cover
+    if not api_endpoint() and (not creds_path or not os.path.exists(creds_path)):  # pragma: no cover
         raise RuntimeError("Google credentials path not set or file missing")
-    logger.info("build_google_service: using credentials at %s", creds_path)
-    creds = service_account.Credentials.from_service_account_file(
-        creds_path, scopes=SCOPES
-    )
-    service = build("tasks", "v1", credentials=creds, cache_discovery=False)
-    logger.info("build_google_service: service created")
+    service = build_service("tasks", "v1", SCOPES, creds_path)
+    logger.debug("build_google_service: service created")
     return service
 
 
@@ -42,14 +41,13 @@ def create_task(
 ) -> Dict[str, Any]:
     """Creates a new task in a specified Google Tasks list."""
     task = {"title": title, "due": due_date, "notes": notes}
-    return service.tasks().insert(tasklist=task_list_id, body=task).execute()
+    return execute(service.tasks().insert(tasklist=task_list_id, body=task), "tasks.insert")
 
 
 def list_tasks(service, task_list_id: str) -> List[Dict[str, Any]]:
-    """Lists all tasks in a specified Google Tasks list."""
+    """Lists all tasks in a specified Google Tasks list (every page)."""
     logger.info("list_tasks: fetching tasks for task_list_id=%s", task_list_id)
-    result = service.tasks().list(tasklist=task_list_id).execute()
-    items = result.get("items", [])
+    items = execute_pages(service.tasks(), "tasks.list", tasklist=task_list_id, maxResults=100)
     logger.info("list_tasks: retrieved %d tasks", len(items))
     return items
 
@@ -95,9 +93,16 @@ def parse_iso_date(iso: str | None):
     return datetime.fromisoformat(iso.replace("Z", "+00:00")) if iso else None
 
 
+# Resolved task list ids keyed by normalized title; list ids never change, so
+# one lookup per process is enough.
+_task_list_ids: Dict[str, str] = {}
+
+
 def get_or_create_task_list(service, list_title: str = "Family chores") -> str:
     """Finds a task list by its title, creating it if it doesn't exist.
 
+    Resolved ids are cached per process (see :func:`clear_task_list_cache`).
+
     Args:
         service: The Google Tasks service instance.
         list_title: The title of the task list to find or create.
@@ -105,29 +110,40 @@ def get_or_create_task_list(service, list_title: str = "Family chores") -> str:
     Returns:
         The ID of the found or newly created task list.
     """
-    response = service.tasklists().list().execute()
+    key = list_title.strip().lower()
+    cached = _task_list_ids.get(key)
+    cache_lookup("task_list_id", bool(cached))
+    if cached:
+        return cached
     # Iterate through existing task lists to find a match (case-insensitive).
-    for tasklist in response.get("items", []):
-        if tasklist["title"].strip().lower() == list_title.strip().lower():
+    for tasklist in execute_pages(service.tasklists(), "tasklists.list", maxResults=100):
+        if tasklist["title"].strip().lower() == key:
+            _task_list_ids[key] = tasklist["id"]
             return tasklist["id"]
     # If no match is found, create a new task list.
-    created = service.tasklists().insert(body={"title": list_title}).execute()
+    created = execute(service.tasklists().insert(body={"title": list_title}), "tasklists.insert")
     logger.info("Created task list '%s' (%s)", created["title"], created["id"])
+    _task_list_ids[key] = created["id"]
     return created["id"]
 
 
+def clear_task_list_cache() -> None:
+    """Forget resolved task list ids."""
+    _task_list_ids.clear()
+
+
 def patch_task_status(service, task_list_id: str, task_id: str, status: str = "completed", completed_iso: str = None):
     """Patch a Google Task's status (occurrence only)."""
     from datetime import datetime, timezone
     now_iso = datetime.now(timezone.utc).isoformat()
     patch_body = {"status": status, "completed": completed_iso or now_iso}
-    logger.info(f"patch_task_status: id={task_id} patch_body={patch_body}")
-    result = service.tasks().patch(tasklist=task_list_id, task=task_id, body=patch_body).execute()
-    logger.info(f"patch_task_status: id={task_id} patch_result={result}")
+    logger.info("patch_task_status: id=%s status=%s", task_id, status)
+    result = execute(service.tasks().patch(tasklist=task_list_id, task=task_id, body=patch_body), "tasks.patch")
+    logger.debug("patch_task_status: id=%s patch_result=%s", task_id, result)
     return result
 
 
 def get_task(service, task_list_id: str, task_id: str):
     """Fetch a single Google Task by id."""
     logger.info(f"get_task: id={task_id}")
-    return service.tasks().get(tasklist=task_list_id, task=task_id).execute()
+    return execute(service.tasks().get(tasklist=task_list_id, task=task_id), "tasks.get")
@@ -6,12 +6,39 @@ application modules (e.g., from `services`, `models`) correctly.
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 import os
 
+import pytest
+
 os.environ.setdefault("SKIP_ROUTES", "1")
 
 # Add the project root directory to the Python path to resolve imports
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def query_budget():
+    """Fail when a block runs more SQL statements than a route is allowed.
+
+    ``max_repeats`` additionally caps how often a single statement shape may
+    repeat, which catches N+1 lazy loading even under a generous budget::
+
+        with query_budget(4, max_repeats=1):
+            client.get("/")
+    """
+    from runtime import sql_audit
+
+    @contextmanager
+    def budget(max_queries, *, max_repeats=None):
+        with sql_audit.capture() as stats:
+            yield stats
+        assert stats.count <= max_queries, f"query budget {max_queries} exceeded: {stats.describe()}"
+        if max_repeats is not None:
+            worst = max(stats.shapes.values(), default=0)
+            assert worst <= max_repeats, f"statement repeated {worst} times: {stats.describe()}"
+
+    return budget
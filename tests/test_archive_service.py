@@ -0,0 +1,73 @@
+"""Unit tests for chore occurrence archival."""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, text
+
+from services import archive_service as arch
+
+TODAY = date(2025, 6, 1)
+
+
+def setup_engine(path="sqlite:///:memory:"):
+    engine = create_engine(path, future=True)
+    with engine.begin() as conn:
+        for name in ("006_local_chore_occurrences.sql", "009_chores_archive.sql"):
+            conn.connection.executescript(Path("migrations", name).read_text())
+        conn.execute(text("INSERT INTO chore_metadata(task_id, title, points) VALUES('t1','Dishes',2)"))
+        for offset, status in [(400, "completed"), (200, "ignored"), (150, "pending"), (10, "completed")]:
+            conn.execute(
+                text("INSERT INTO chores(task_id, due_date, status) VALUES('t1', :d, :s)"),
+                {"d": (TODAY - timedelta(days=offset)).isoformat(), "s": status},
+            )
+    return engine
+
+
+def test_archive_moves_only_old_settled_rows_in_batches():
+    engine = setup_engine()
+    moved = arch.archive_old_chores(engine, older_than_days=90, batch_size=1, today=TODAY, archive_path="")
+    assert moved == 2
+    with engine.begin() as conn:
+        hot = conn.execute(text("SELECT status FROM chores ORDER BY due_date")).scalars().all()
+        cold = conn.execute(text("SELECT status FROM chores_archive ORDER BY due_date")).scalars().all()
+    assert hot == ["pending", "completed"]
+    assert cold == ["completed", "ignored"]
+
+
+def test_fetch_archived_rows_filters_range():
+    engine = setup_engine()
+    arch.archive_old_chores(engine, older_than_days=90, today=TODAY, archive_path="")
+    with engine.connect() as conn:
+        rows = arch.fetch_archived_rows(conn, start=TODAY - timedelta(days=300), archive_path="")
+    assert [(r[1], r[3], r[4]) for r in rows] == [("Dishes", TODAY - timedelta(days=200), "ignored")]
+
+
+def test_archive_into_attached_file(tmp_path):
+    engine = setup_engine(f"sqlite:///{tmp_path / 'hot.db'}")
+    archive_db = str(tmp_path / "cold.db")
+    assert arch.archive_old_chores(engine, older_than_days=90, today=TODAY, archive_path=archive_db) == 2
+    with engine.connect() as conn:
+        assert len(arch.fetch_archived_rows(conn, archive_path=archive_db)) == 2
+
+
+def test_reads_attach_once_and_run_no_ddl(tmp_path):
+    engine = setup_engine(f"sqlite:///{tmp_path / 'hot.db'}")
+    archive_db = str(tmp_path / "cold.db")
+    with engine.begin() as conn:
+        arch.ensure_archive(conn, archive_db)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cur, sql, *a: statements.append(sql.split()[0]))
+    with engine.connect() as conn:
+        arch.fetch_archived_rows(conn, archive_path=archive_db)
+    with engine.connect() as conn:
+        arch.fetch_archived_rows(conn, archive_path=archive_db)
+    assert statements == ["SELECT", "SELECT"]
+
+
+def test_needs_archive_only_for_ranges_before_cutoff():
+    cutoff = arch.archive_cutoff(TODAY, 90)
+    assert arch.needs_archive(cutoff - timedelta(days=1), today=TODAY)
+    assert not arch.needs_archive(cutoff, today=TODAY)
+    assert not arch.needs_archive(None, today=TODAY)
+    assert not arch.needs_archive(cutoff - timedelta(days=1), include_completed=False, today=TODAY)
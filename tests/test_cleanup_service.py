@@ -0,0 +1,63 @@
+"""Unit tests for the orphan and fake-id chore cleanup."""
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from services import cleanup_service as cleanup
+
+FAKE = "0f8e4c2a-1b3d-4e5f-9a7b-6c5d4e3f2a1b"
+
+
+def setup_engine():
+    engine = create_engine("sqlite://", future=True, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.connection.executescript(Path("migrations", "006_local_chore_occurrences.sql").read_text())
+        for task_id in ("real1", FAKE, FAKE.upper().replace("-", "x")):
+            conn.execute(text("INSERT INTO chore_metadata(task_id, title) VALUES(:t, 'x')"), {"t": task_id})
+        rows = [("real1", 3), (FAKE, 2), ("deleted-def", 5)]
+        for task_id, n in rows:
+            conn.execute(
+                text("INSERT INTO chores(task_id, due_date) VALUES(:t, :d)"),
+                [{"t": task_id, "d": f"2025-01-{day + 1:02d}"} for day in range(n)],
+            )
+    return engine
+
+
+def test_uuid_match_is_dialect_specific():
+    assert cleanup.uuid_match("sqlite", "task_id").startswith("task_id GLOB '[0-9a-fA-F][0-9a-fA-F]")
+    assert cleanup.uuid_match("postgresql", "task_id") == (
+        "task_id ~ '^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'"
+    )
+
+
+def test_dry_run_counts_without_deleting():
+    engine = setup_engine()
+    # The fake definition still has occurrences, so it is not counted yet
+    assert cleanup.count_cleanup(engine) == {"fake_chores": 2, "orphaned_chores": 5, "fake_metadata": 0}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM chores")).scalar() == 10
+
+
+def test_cleanup_deletes_in_batches_chores_before_metadata():
+    engine = setup_engine()
+    deleted = cleanup.cleanup_chores(engine, batch_size=2)
+    assert deleted == {"fake_chores": 2, "orphaned_chores": 5, "fake_metadata": 1}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT DISTINCT task_id FROM chores")).scalars().all() == ["real1"]
+        # Only UUID-shaped ids count as fake
+        metadata = conn.execute(text("SELECT task_id FROM chore_metadata ORDER BY task_id")).scalars().all()
+    assert metadata == sorted(["real1", FAKE.upper().replace("-", "x")])
+    assert cleanup.count_cleanup(engine) == dict.fromkeys(cleanup.TARGETS, 0)
+
+
+def test_max_batches_and_target_selection():
+    engine = setup_engine()
+    assert cleanup.cleanup_chores(engine, targets=["orphaned_chores"], batch_size=2, max_batches=2) == {
+        "orphaned_chores": 4
+    }
+    assert cleanup.count_cleanup(engine, ["orphaned_chores", "fake_chores"]) == {
+        "orphaned_chores": 1,
+        "fake_chores": 2,
+    }
@@ -0,0 +1,27 @@
+"""Unit tests for the SQLite engine profile."""
+
+from dataclasses import replace
+
+from sqlalchemy import create_engine
+
+from config import get_settings
+from db import engine_options, install_sqlite_profile
+
+
+def test_engine_options_drop_pre_ping_for_file_sqlite():
+    settings = get_settings()
+    assert "pool_pre_ping" not in engine_options("sqlite:///familyhub.db", settings)
+    assert engine_options("sqlite:///:memory:", settings)["pool_pre_ping"] is True
+    assert engine_options("postgresql://u@localhost/fh", settings)["pool_pre_ping"] is True
+
+
+def test_profile_applied_on_every_connection(tmp_path):
+    settings = replace(get_settings(), sqlite_busy_timeout_ms=1234, sqlite_synchronous="OFF")
+    url = f"sqlite:///{tmp_path / 'fh.db'}"
+    engine = create_engine(url, **engine_options(url, settings))
+    install_sqlite_profile(engine, settings)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
@@ -0,0 +1,82 @@
+"""Tests for the Tasks/Calendar clients against benchmarks/fake_google.py."""
+
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+import tasks_api
+from benchmarks.fake_google import FakeGoogleServer, seed
+from config import get_settings
+from services import calendar_service, google_api
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    server = FakeGoogleServer(seed=1).start()
+    settings = replace(get_settings(), google_api_endpoint=server.url)
+    monkeypatch.setattr(google_api, "get_settings", lambda: settings)
+    monkeypatch.setattr(google_api.time, "sleep", lambda s: None)
+    tasks_api.clear_task_list_cache()
+    calendar_service.clear_cache()
+    yield server
+    server.stop()
+
+
+def test_tasks_are_paged(fake):
+    seed(fake.state, tasks=250)
+    service = tasks_api.build_google_service()
+    list_id = tasks_api.get_or_create_task_list(service, "Family chores")
+    chores = tasks_api.get_google_tasks(service, list_id)
+    assert len(chores) == 250
+    assert chores[0]["assigned_to"] == "Alex"
+    assert fake.stats["tasks.list"] == 3
+
+
+def test_pages_are_retried_when_asked(fake):
+    seed(fake.state, tasks=150)
+    service = tasks_api.build_google_service()
+    list_id = tasks_api.get_or_create_task_list(service, "Family chores")
+    fake.fail_next(429)
+    fake.fail_next(503)
+    items = google_api.execute_pages(service.tasks(), "tasks.list", retries=2, tasklist=list_id, maxResults=100)
+    assert len(items) == 150
+    # 2 pages of 100, plus the two injected failures
+    assert fake.stats["tasks.list"] == 4
+
+
+def test_patch_and_batch_requests(fake):
+    service = tasks_api.build_google_service()
+    list_id = tasks_api.get_or_create_task_list(service, "Family chores")
+    created = [tasks_api.create_task(service, list_id, f"T{n}", "2025-01-01T00:00:00.000Z") for n in range(3)]
+    tasks_api.patch_task_status(service, list_id, created[0]["id"])
+    assert tasks_api.get_task(service, list_id, created[0]["id"])["status"] == "completed"
+
+    results = {}
+    batch = google_api.new_batch(service, callback=lambda rid, resp, exc: results.setdefault(rid, (resp, exc)))
+    for task in created[1:]:
+        batch.add(service.tasks().patch(tasklist=list_id, task=task["id"], body={"status": "completed"}))
+    batch.add(service.tasks().get(tasklist=list_id, task="missing"))
+    batch.execute()
+    statuses = [resp["status"] if resp else exc.resp.status for resp, exc in results.values()]
+    assert statuses == ["completed", "completed", 404]
+    assert fake.stats["batch"] == 1
+
+
+def test_meals_and_sync_tokens(fake, monkeypatch):
+    monkeypatch.setenv("FAMILYHUB_TZ", "UTC")
+    seed(fake.state, events=30, calendar_id="meals")
+    meals = calendar_service.get_meals("meals", days=7)
+    assert sum(len(titles) for titles in meals.values()) == 30
+    assert meals[date.today().isoformat()]
+
+    full = fake.state.list_events("meals", {"maxResults": "10"})
+    assert "nextPageToken" in full and "nextSyncToken" not in full
+    token = fake.state.list_events("meals", {})["nextSyncToken"]
+    event = fake.state.add_event("meals", {"summary": "Tacos", "start": {"date": "2025-01-01"}})
+    fake.state.delete_event("meals", event["id"])
+    changed = fake.state.list_events("meals", {"syncToken": token})
+    assert [(e["summary"], e["status"]) for e in changed["items"]] == [("Tacos", "cancelled")]
+    fake.state.expire_sync_tokens()
+    status, body = fake.dispatch("GET", f"/calendar/v3/calendars/meals/events?syncToken={token}", b"")
+    assert status == 410 and body["error"]["errors"][0]["reason"] == "fullSyncRequired"
@@ -0,0 +1,70 @@
+"""Tests for the synthetic data generator."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from bootstrap.migrations import apply_pending
+from scripts.generate_data import generate, meal_events, user_names
+
+
+@pytest.fixture
+def engine(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'gen.db'}", future=True)
+    apply_pending(eng)
+    with eng.begin() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    yield eng
+    eng.dispose()
+
+
+def test_generate_counts_statuses_and_ledger(engine):
+    today = date.today()
+    counts = generate(
+        engine,
+        users=user_names(3),
+        chores=6,
+        days=70,
+        until=today + timedelta(days=6),
+        rules=("RRULE:FREQ=DAILY", "RRULE:FREQ=WEEKLY;BYDAY=SA"),
+        completion_rate=0.75,
+        overdue_days=2,
+    )
+    assert counts["chore_metadata"] == 6
+    # 3 daily chores every day + 3 Saturday chores on the 10 Saturdays
+    assert counts["chores"] == 3 * 70 + 3 * 10
+    with engine.connect() as conn:
+        rows = dict(conn.execute(text("SELECT status, COUNT(*) FROM chores GROUP BY status")).fetchall())
+        assert sum(rows.values()) == counts["chores"]
+        pending_min = conn.execute(text("SELECT MIN(due_date) FROM chores WHERE status='pending'")).scalar()
+        assert pending_min == (today - timedelta(days=2)).isoformat()
+        earned = conn.execute(text("SELECT COUNT(*) FROM points_ledger WHERE kind='earn'")).scalar()
+        assert earned == rows["completed"]
+        orphans = conn.execute(
+            text(
+                "SELECT COUNT(*) FROM points_ledger l LEFT JOIN chores c ON CAST(c.id AS TEXT) = l.task_id "
+                "WHERE l.kind='earn' AND (c.id IS NULL OR c.status != 'completed')"
+            )
+        ).scalar()
+        assert orphans == 0
+        balances = conn.execute(text("SELECT MIN(s) FROM (SELECT SUM(points) s FROM points_ledger GROUP BY user_name)"))
+        assert balances.scalar() >= 0
+        assert conn.execute(text("SELECT COUNT(*) FROM redemptions")).scalar() == counts["redemptions"]
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        indexes = {r[0] for r in conn.execute(text("SELECT name FROM sqlite_master WHERE type='index'"))}
+        assert {"ix_chores_status_due_date", "ux_ledger_once"} <= indexes
+
+
+def test_generate_refuses_existing_prefix(engine):
+    generate(engine, users=["Briggs"], chores=1, days=2)
+    with pytest.raises(ValueError, match="--prefix"):
+        generate(engine, users=["Briggs"], chores=1, days=2)
+    assert generate(engine, users=["Briggs"], chores=1, days=2, prefix="more")["chores"] == 2
+
+
+def test_meal_events_one_dinner_a_day_plus_weekend_lunch():
+    first = date(2025, 1, 6)  # Monday
+    events = meal_events(first, first + timedelta(days=6))
+    assert len(events) == 7 + 2
+    assert events[0]["start"] == {"date": "2025-01-06"} and events[0]["end"] == {"date": "2025-01-07"}
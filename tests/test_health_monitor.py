@@ -0,0 +1,126 @@
+"""Tests for the cached background health monitor."""
+
+import contextlib
+import json
+import os
+import time
+from dataclasses import replace
+
+import pytest
+
+import app_health
+from config import get_settings
+from health.monitor import HealthMonitor, published_probe
+
+
+def test_result_is_cached_between_intervals():
+    calls = []
+
+    def probe():
+        calls.append(1)
+        return True, {"n": len(calls)}
+
+    monitor = HealthMonitor()
+    monitor.add("p", probe, interval=60)
+    first = monitor.result("p")
+    second = monitor.result("p")
+    assert first is second
+    assert len(calls) == 1
+    assert monitor.snapshot()["p"]["details"] == {"n": 1}
+
+
+def test_background_thread_refreshes_and_errors_are_failures():
+    monitor = HealthMonitor()
+    ticks = []
+    monitor.add("tick", lambda: (ticks.append(1) or True, len(ticks)), interval=0.1)
+    monitor.add("boom", lambda: 1 / 0, interval=0.1)
+    monitor.start()
+    try:
+        time.sleep(0.5)
+    finally:
+        monitor.stop()
+    assert len(ticks) >= 3
+    boom = monitor.result("boom")
+    assert not boom.ok and "division" in boom.details["error"]
+
+
+def test_stale_results_are_reported_failing():
+    monitor = HealthMonitor(stale_factor=2)
+    monitor.add("p", lambda: (True, "ok"), interval=10)
+    monitor.run_probe("p")
+    monitor._probes["p"].result.checked_at -= 30
+    assert not monitor.result("p").ok
+
+
+def test_endpoints_serialize_snapshot_without_probing(monkeypatch):
+    monkeypatch.setattr(app_health, "ensure_chromium_kiosk", lambda: True)
+    monkeypatch.setattr(app_health.liveness_check, "_startup_time", 0, raising=False)
+    monitor = app_health.build_monitor("127.0.0.1", 1)
+    try:
+        for name in ("liveness", "browser", "socket", "dns"):
+            monitor._probes[name].fn = lambda: (True, "ok")
+            monitor.run_probe(name)
+        for name in ("liveness", "browser", "socket", "dns"):
+            monitor._probes[name].fn = lambda: (_ for _ in ()).throw(AssertionError("probed"))
+
+        body, code = app_health._liveness_response("127.0.0.1", 1)
+        assert code == 200
+        assert json.loads(body)["checks"]["liveness"]["ok"] is True
+
+        body, code = app_health._readiness_response("127.0.0.1", 1)
+        assert code == 200
+        assert set(json.loads(body)["checks"]) == {"socket", "dns"}
+    finally:
+        monkeypatch.setattr(app_health, "_monitor", None)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork()")
+def test_prefork_worker_restarts_cheap_probes_and_reads_the_rest(monkeypatch):
+    settings = replace(
+        get_settings(), server_mode="prefork", health_probe_interval=0.1, health_slow_probe_interval=0.1
+    )
+    browser_pids = []
+    monkeypatch.setattr(app_health, "get_settings", lambda: settings)
+    monkeypatch.setattr(
+        app_health, "readiness_probes", lambda h, p: {"socket": lambda: (True, "ok"), "dns": lambda: (True, "ok")}
+    )
+    monkeypatch.setattr(app_health, "_browser_probe", lambda: (browser_pids.append(os.getpid()) or True, "ok"))
+    monkeypatch.setattr(app_health, "liveness_check", lambda: (True, "ok"))
+    app_health.liveness_check._startup_time = 0
+    for name in ("_monitor", "_monitor_pid", "_monitor_address", "_readiness_names"):
+        monkeypatch.setattr(app_health, name, getattr(app_health, name))
+    master = app_health.build_monitor("127.0.0.1", 8030).start()
+    try:
+        time.sleep(0.2)
+        pid = os.fork()
+        if pid == 0:  # gunicorn worker
+            code = 1
+            try:
+                app_health.restart_monitor_after_fork()
+                if app_health._monitor is not master:
+                    # Well past stale_factor probe intervals
+                    time.sleep(0.6)
+                    statuses = {app_health._respond(p, "127.0.0.1", 8030)[1] for p in ("/healthz", "/readyz")}
+                    code = 0 if statuses == {200} else 2
+                    if os.getpid() in browser_pids:
+                        code = 3
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert len(set(browser_pids)) == 1
+    finally:
+        master.stop()
+        with contextlib.suppress(OSError):
+            os.remove(app_health.published_path(os.getpid()))
+
+
+def test_published_probe_reports_missing_and_stale(tmp_path):
+    path = str(tmp_path / "health.json")
+    monitor = HealthMonitor(publish_path=path)
+    monitor.add("dns", lambda: (True, "resolved"), interval=10)
+    probe = published_probe(path, "dns", max_age=30)
+    assert probe() == (False, {"error": "no published result"})
+    monitor.run_probe("dns")
+    assert probe() == (True, "resolved")
+    assert not published_probe(path, "dns", max_age=-1)()[0]
@@ -0,0 +1,62 @@
+"""Tests for the concurrent standalone health server."""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import replace
+
+import app_health
+from config import get_settings
+
+
+def _get(port, path, timeout=2):
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_liveness_not_blocked_by_slow_readiness(monkeypatch):
+    release = threading.Event()
+
+    def slow_ready(host, port):
+        release.wait(5)
+        return json.dumps({"status": "ok"}), 200
+
+    monkeypatch.setattr(app_health, "build_monitor", lambda *a, **k: app_health.HealthMonitor())
+    monkeypatch.setattr(app_health, "_readiness_response", slow_ready)
+    monkeypatch.setattr(app_health, "_liveness_response", lambda h, p: (json.dumps({"status": "ok"}), 200))
+    settings = replace(get_settings(), health_server_threads=3, health_liveness_reserved=1)
+    monkeypatch.setattr(app_health, "get_settings", lambda: settings)
+
+    server = app_health.setup_health(None, "127.0.0.1", 0)
+    port = server.server_address[1]
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+        slow = [threading.Thread(target=_get, args=(port, "/readyz", 10)) for _ in range(2)]
+        for t in slow:
+            t.start()
+        time.sleep(0.3)
+
+        # Both shared workers are stuck in readiness: another readiness probe
+        # is rejected immediately and liveness still answers.
+        t0 = time.perf_counter()
+        assert _get(port, "/readyz")[0] == 503
+        assert _get(port, "/healthz") == (200, {"status": "ok"})
+        assert time.perf_counter() - t0 < 1.0
+
+        release.set()
+        for t in slow:
+            t.join(5)
+        code, stats = _get(port, "/healthz/stats")
+        assert code == 200
+        assert stats["endpoints"]["/healthz"]["count"] == 1
+        assert stats["endpoints"]["/readyz"]["count"] == 3
+        assert stats["endpoints"]["/readyz"]["errors"] == 1
+        assert stats["endpoints"]["/readyz"]["max_ms"] >= 250
+    finally:
+        server.shutdown()
+        server.server_close()
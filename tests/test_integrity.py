@@ -0,0 +1,83 @@
+"""Tests for incremental SQLite integrity checking."""
+
+import sqlite3
+from datetime import datetime
+
+from health import integrity
+
+
+def _make_db(path, tables=3, rows=200):
+    con = sqlite3.connect(path)
+    for i in range(tables):
+        con.execute(f"CREATE TABLE t{i} (id INTEGER PRIMARY KEY, body TEXT)")
+        con.execute(f"CREATE INDEX ix_t{i} ON t{i}(body)")
+        con.executemany(f"INSERT INTO t{i}(body) VALUES (?)", [("x" * 200,)] * rows)
+    con.commit()
+    con.close()
+
+
+def test_header_check(tmp_path):
+    db = tmp_path / "ok.db"
+    _make_db(db, tables=1, rows=1)
+    assert integrity.check_header(str(db)) == (True, "ok")
+
+    bad = tmp_path / "bad.db"
+    bad.write_bytes(b"not a database".ljust(4096, b"\0"))
+    ok, msg = integrity.check_header(str(bad))
+    assert not ok and "magic" in msg
+
+
+def test_slices_respect_page_budget_and_persist_verdict(tmp_path):
+    db = str(tmp_path / "fh.db")
+    _make_db(db)
+    checker = integrity.IntegrityChecker(db, page_budget=1)
+
+    first = checker.run_slice()
+    assert first["last_slice"]["tables"] == ["t0"]
+    assert first["cursor"] == "t0"
+    assert "last_full_pass" not in first
+    assert integrity.fast_check(db) == (True, "ok (no full pass yet)")
+
+    checker.run_slice()
+    third = checker.run_slice()
+    assert third["last_slice"]["tables"] == ["t2"]
+    assert third["cursor"] == ""
+    assert third["last_full_pass"]
+    assert set(integrity.load_verdict(db)["tables"]) == {"t0", "t1", "t2"}
+
+    # A big budget checks everything in one slice
+    verdict = integrity.IntegrityChecker(db, page_budget=10_000).run_slice()
+    assert verdict["last_slice"]["tables"] == ["t0", "t1", "t2"]
+
+
+def test_page_counts_measured_once_per_full_pass(tmp_path, monkeypatch):
+    db = str(tmp_path / "fh.db")
+    _make_db(db)
+    checker = integrity.IntegrityChecker(db, page_budget=1)
+    calls = []
+    count_pages = integrity.IntegrityChecker._count_pages
+    monkeypatch.setattr(checker, "_count_pages", lambda con, tables: calls.append(1) or count_pages(con, tables))
+
+    first = checker.run_slice()
+    assert set(first["pages"]) == {"t0", "t1", "t2"} and all(first["pages"].values())
+    checker.run_slice()
+    checker.run_slice()
+    assert len(calls) == 1
+    # The cursor wrapped: the next pass measures again
+    checker.run_slice()
+    assert len(calls) == 2
+
+
+def test_fast_check_reports_persisted_errors(tmp_path):
+    db = str(tmp_path / "fh.db")
+    _make_db(db, tables=1, rows=1)
+    integrity.save_verdict(db, {"tables": {"t0": {"result": "row 3 missing from index ix_t0"}}})
+    ok, msg = integrity.fast_check(db)
+    assert not ok and "t0" in msg
+
+
+def test_idle_window():
+    assert integrity.in_idle_window("2-5", datetime(2025, 1, 1, 3))
+    assert not integrity.in_idle_window("2-5", datetime(2025, 1, 1, 5))
+    assert integrity.in_idle_window("23-4", datetime(2025, 1, 1, 1))
+    assert not integrity.in_idle_window("23-4", datetime(2025, 1, 1, 12))
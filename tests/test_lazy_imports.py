@@ -0,0 +1,26 @@
+"""Importing the app must stay cheap: no heavy clients, no startup side effects."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY = ("googleapiclient", "google.oauth2", "pytz", "dateutil", "flask_dance", "flask_login")
+
+
+def test_import_main_is_lazy(tmp_path):
+    db_file = tmp_path / "lazy.db"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_file}")
+    env.pop("SKIP_ROUTES", None)
+    code = (
+        "import sys, main; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
+    # No create_all() at import time
+    assert not db_file.exists() or db_file.stat().st_size == 0
@@ -0,0 +1,62 @@
+"""Tests for tracemalloc snapshots, growth reports and RSS history."""
+
+import tracemalloc
+
+from runtime import memtrace, metrics
+from runtime.memtrace import MemoryTracer, RssHistory
+from runtime.profiler import ProfileStore
+
+_leak = []
+
+
+def _allocate():
+    _leak.extend(bytearray(1024) for _ in range(500))
+
+
+def test_tracer_reports_growth_by_line(tmp_path):
+    store = ProfileStore(str(tmp_path), keep=5)
+    tracer = MemoryTracer(interval=3600, frames=5, store=store).start()
+    try:
+        tracer.snapshot()
+        _allocate()
+        tracer.snapshot()
+        report = tracer.report(limit=10)
+    finally:
+        tracer.stop()
+        _leak.clear()
+    assert not tracemalloc.is_tracing()
+    assert report["traced_bytes"] > 0
+    grown = report["growth_since_previous"][0]
+    assert "test_memtrace.py" in grown["site"] and "_leak.extend" in grown["site"]
+    assert grown["size_diff"] >= 500 * 1024
+    assert report["growth_since_start"]
+    names = store.list()
+    assert names and all(n.endswith("-heap.tracemalloc") for n in names)
+    tracemalloc.Snapshot.load(str(tmp_path / names[0]))
+
+
+def test_rss_history_feeds_growth_gauge(monkeypatch):
+    history = RssHistory(interval=3600, keep=2)
+    for _ in range(3):
+        history.sample()
+    assert len(history.as_dict()["samples"]) == 2
+    monkeypatch.setattr(memtrace, "_history", history)
+    monkeypatch.setattr(memtrace, "_pid", memtrace.os.getpid())
+    assert 'familyhub_process_memory_growth_bytes{kind="rss"}' in metrics.registry.render()
+
+
+def test_snapshots_have_their_own_store(tmp_path):
+    from dataclasses import replace
+
+    from config import get_settings
+    from runtime.profiler import store_for
+
+    settings = replace(
+        get_settings(), profile_dir=str(tmp_path / "profiles"), memtrace_dir=str(tmp_path / "heap"), memtrace_keep=3
+    )
+    store_for(settings).save("sample", b"stacks", ".collapsed")
+    heap = memtrace.snapshot_store(settings)
+    for _ in range(5):
+        heap.save("heap", b"snap", ".tracemalloc")
+    assert len(heap.list()) == 3
+    assert len(store_for(settings).list()) == 1
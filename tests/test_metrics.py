@@ -0,0 +1,95 @@
+"""Tests for the metrics registry and its instrumentation hooks."""
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from runtime import metrics
+from services import google_api
+
+
+def test_histogram_and_counter_exposition():
+    reg = metrics.Registry()
+    hist = reg.histogram("t_seconds", "test latency", ("endpoint",), buckets=(0.1, 1.0))
+    hist.observe(0.05, endpoint="/")
+    hist.observe(0.5, endpoint="/")
+    reg.counter("t_total", "test count", ("kind",)).inc(kind='a"b')
+    out = reg.render()
+    assert "# TYPE t_seconds histogram" in out
+    assert 't_seconds_bucket{endpoint="/",le="0.1"} 1' in out
+    assert 't_seconds_bucket{endpoint="/",le="+Inf"} 2' in out
+    assert 't_seconds_count{endpoint="/"} 2' in out
+    assert 't_total{kind="a\\"b"} 1' in out
+
+
+class _Resp:
+    def __init__(self, status):
+        self.status = status
+
+
+class _HttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = _Resp(status)
+
+
+class _Request:
+    def __init__(self, failures):
+        self.failures = list(failures)
+
+    def execute(self):
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"ok": True}
+
+
+def test_google_execute_retries_transient_errors():
+    before = metrics.GOOGLE_API_RETRIES.value(method="test.retry")
+    result = google_api.execute(_Request([_HttpError(503), _HttpError(429)]), "test.retry", retries=2, backoff=0)
+    assert result == {"ok": True}
+    assert metrics.GOOGLE_API_RETRIES.value(method="test.retry") == before + 2
+    assert metrics.GOOGLE_API_SECONDS.count(method="test.retry") >= 1
+
+
+def test_google_execute_does_not_retry_by_default():
+    before = metrics.GOOGLE_API_ERRORS.value(method="test.noretry")
+    request = _Request([_HttpError(503)])
+    try:
+        google_api.execute(request, "test.noretry")
+    except _HttpError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected HttpError")
+    assert metrics.GOOGLE_API_ERRORS.value(method="test.noretry") == before + 1
+    assert metrics.GOOGLE_API_RETRIES.value(method="test.noretry") == 0
+
+
+def test_google_execute_does_not_retry_client_errors():
+    before = metrics.GOOGLE_API_ERRORS.value(method="test.fail")
+    try:
+        google_api.execute(_Request([_HttpError(404)]), "test.fail", retries=2, backoff=0)
+    except _HttpError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected HttpError")
+    assert metrics.GOOGLE_API_ERRORS.value(method="test.fail") == before + 1
+    assert metrics.GOOGLE_API_RETRIES.value(method="test.fail") == 0
+
+
+def test_flask_and_engine_instrumentation():
+    app = Flask(__name__)
+
+    @app.route("/chores/<int:chore_id>")
+    def chore(chore_id):
+        return str(chore_id)
+
+    metrics.install_flask(app)
+    app.test_client().get("/chores/7")
+    assert metrics.HTTP_REQUEST_SECONDS.count(endpoint="/chores/<int:chore_id>", method="GET", status="200") == 1
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    metrics.install_engine(engine)
+    before = metrics.DB_QUERIES.value(operation="SELECT")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert metrics.DB_QUERIES.value(operation="SELECT") == before + 1
+    assert "familyhub_process_memory_bytes{kind=\"rss\"}" in metrics.registry.render()
@@ -0,0 +1,23 @@
+"""Tests for the micro-benchmark size parsing and baseline comparison."""
+
+from benchmarks.microbench import compare, parse_size, size_label
+
+
+def test_parse_and_label_sizes():
+    assert parse_size("1k") == 1000
+    assert parse_size("100K") == 100_000
+    assert parse_size("1m") == 1_000_000
+    assert parse_size("250") == 250
+    assert [size_label(n) for n in (250, 1000, 100_000, 1_000_000)] == ["250", "1k", "100k", "1m"]
+
+
+def test_compare_flags_only_slowdowns_past_tolerance():
+    baseline = {"fetch_chores_week@1k": 0.010, "redeem@1k": 0.002, "parse_rrule": 0.05}
+    results = {
+        "fetch_chores_week@1k": {"median_s": 0.0124},  # +24%
+        "redeem@1k": {"median_s": 0.0026},  # +30%
+        "parse_rrule": {"median_s": 0.01},  # faster
+        "render_index@1k": {"median_s": 1.0},  # no baseline yet
+    }
+    assert compare(results, baseline, 0.25) == ["redeem@1k"]
+    assert compare(results, baseline, 0.5) == []
@@ -0,0 +1,80 @@
+"""Unit tests for the incremental migration runner."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from bootstrap import migrations as mig
+
+
+def make_dir(tmp_path, files):
+    for name, sql in files.items():
+        (tmp_path / name).write_text(sql)
+    return tmp_path
+
+
+def test_repo_migrations_apply_once_and_rerun_is_noop(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fh.db'}", future=True)
+    first = mig.apply_pending(engine)
+    assert [m.version for m in first] == [m.version for m in mig.discover()]
+    # Non-idempotent ALTER TABLE files are not re-executed
+    assert mig.apply_pending(engine) == []
+    assert mig.schema_is_current(engine)
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT checksum, duration_ms FROM schema_migrations WHERE version='007'")).one()
+    assert row.checksum == next(m for m in mig.discover() if m.version == "007").checksum
+    assert row.duration_ms >= 0
+
+
+def test_repo_migrations_create_columns_the_code_reads(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fh.db'}", future=True)
+    mig.apply_pending(engine)
+    columns = {t: {c["name"] for c in inspect(engine).get_columns(t)} for t in ("chore_metadata", "rewards")}
+    assert "title" in columns["chore_metadata"]
+    assert "emoji" in columns["rewards"]
+
+
+def test_add_column_skipped_when_column_exists(tmp_path):
+    mdir = make_dir(tmp_path, {"001_a.sql": "ALTER TABLE a ADD COLUMN y TEXT;\nALTER TABLE a ADD COLUMN z TEXT;"})
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE a (x INTEGER, y TEXT)")
+    assert [m.version for m in mig.apply_pending(engine, mdir)] == ["001"]
+    assert {c["name"] for c in inspect(engine).get_columns("a")} == {"x", "y", "z"}
+
+
+def test_failed_file_is_rolled_back_and_not_recorded(tmp_path):
+    mdir = make_dir(tmp_path, {
+        "001_ok.sql": "CREATE TABLE a (x INTEGER);",
+        "002_bad.sql": "CREATE TABLE b (x INTEGER);\nINSERT INTO missing VALUES (1);",
+    })
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with pytest.raises(mig.MigrationError):
+        mig.apply_pending(engine, mdir)
+    assert "b" not in inspect(engine).get_table_names()
+    assert [m.version for m in mig.pending_migrations(engine, mdir)] == ["002"]
+    assert not mig.schema_is_current(engine, mdir)
+
+
+def test_baseline_marks_without_running(tmp_path):
+    mdir = make_dir(tmp_path, {
+        "001_a.sql": "CREATE TABLE a (x INTEGER);",
+        "002_b.sql": "ALTER TABLE a ADD COLUMN y TEXT;",
+    })
+    engine = create_engine("sqlite:///:memory:", future=True)
+    assert [m.version for m in mig.baseline(engine, "001", mdir)] == ["001"]
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE a (x INTEGER)")
+    assert [m.version for m in mig.apply_pending(engine, mdir)] == ["002"]
+
+
+def test_split_statements_handles_triggers_and_comments():
+    sql = """
+    -- leading comment
+    CREATE TABLE t (x TEXT DEFAULT 'a;b');
+    CREATE TRIGGER tr AFTER INSERT ON t BEGIN
+        UPDATE t SET x = 'c;d';
+    END;
+    """
+    stmts = mig.split_statements(sql)
+    assert len(stmts) == 2
+    assert stmts[1].rstrip().endswith("END;")
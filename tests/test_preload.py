@@ -0,0 +1,29 @@
+"""Tests for prefork preloading and per-worker memory reporting."""
+
+import gc
+import os
+
+from flask import Flask
+
+from runtime import preload
+from runtime.process_memory import worker_memory
+
+
+def test_prepare_for_fork_freezes_heap(monkeypatch):
+    monkeypatch.setattr(preload, "WARM_MODULES", ("json",))
+    try:
+        preload.prepare_for_fork(Flask(__name__))
+        assert gc.get_freeze_count() > 0
+        assert preload.master_pid() == os.getpid()
+    finally:
+        gc.unfreeze()
+        monkeypatch.setattr(preload, "_master_pid", None)
+
+
+def test_worker_memory_reports_uss():
+    single = worker_memory()
+    assert single["master"] is None
+    assert single["workers"][0]["pid"] == os.getpid()
+    assert single["workers"][0]["uss"] > 0
+    # Reporting from a "master" lists its children (none here besides tooling)
+    assert worker_memory(os.getpid())["master"]["pid"] == os.getpid()
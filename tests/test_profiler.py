@@ -0,0 +1,110 @@
+"""Tests for the stack sampler, capture store and per-request cProfile."""
+
+import threading
+import time
+from dataclasses import replace
+
+from flask import Flask
+
+import admin.auth
+from config import get_settings
+from runtime import profiler
+from runtime.profiler import ProfileStore, sample_stacks
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampler_finds_busy_thread():
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner", daemon=True)
+    worker.start()
+    try:
+        collapsed = sample_stacks(0.2, 0.005)
+    finally:
+        stop.set()
+        worker.join()
+    lines = [line for line in collapsed.splitlines() if line.startswith("spinner;")]
+    assert lines and all("test_profiler:_spin" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_store_keeps_newest(tmp_path):
+    store = ProfileStore(str(tmp_path), keep=2)
+    names = []
+    for i in range(3):
+        names.append(store.save("sample", str(i).encode(), ".collapsed"))
+        time.sleep(0.002)
+    assert store.list() == [names[2], names[1]]
+    assert store.read(names[2]) == b"2"
+
+
+def _profiled_app(tmp_path, monkeypatch):
+    settings = replace(get_settings(), admin_token="secret", profile_dir=str(tmp_path))
+    monkeypatch.setattr(admin.auth, "get_settings", lambda: settings)
+    app = Flask(__name__)
+
+    @app.route("/")
+    def index():
+        return "ok"
+
+    profiler.install_flask(app, settings)
+    return app.test_client(), settings
+
+
+def test_profile_header_requires_token(tmp_path, monkeypatch):
+    client, _ = _profiled_app(tmp_path, monkeypatch)
+    resp = client.get("/", headers={"X-FamilyHub-Profile": "1", "X-FamilyHub-Admin-Token": "wrong"})
+    assert "X-FamilyHub-Profile" not in resp.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_header_stores_pstats(tmp_path, monkeypatch):
+    client, settings = _profiled_app(tmp_path, monkeypatch)
+    resp = client.get("/", headers={"X-FamilyHub-Profile": "1", "X-FamilyHub-Admin-Token": "secret"})
+    name = resp.headers["X-FamilyHub-Profile"]
+    assert name.endswith("-request.pstats")
+    text = profiler.summary(profiler.store_for(settings).read(name))
+    assert "function calls" in text
+
+
+def test_admin_profile_samples_in_background(tmp_path, monkeypatch):
+    import admin
+
+    settings = replace(get_settings(), admin_token="secret", profile_dir=str(tmp_path))
+    monkeypatch.setattr(admin.auth, "get_settings", lambda: settings)
+    monkeypatch.setattr(admin, "get_settings", lambda: settings)
+    app = Flask(__name__)
+    app.register_blueprint(admin.bp, url_prefix="/admin")
+    client = app.test_client()
+    token = {"X-FamilyHub-Admin-Token": "secret"}
+
+    t0 = time.perf_counter()
+    resp = client.get("/admin/profile?seconds=0.3", headers=token)
+    assert time.perf_counter() - t0 < 0.2
+    assert resp.status_code == 202
+    name = resp.get_json()["name"]
+    assert resp.get_json()["url"] == f"/admin/profiles/{name}"
+    assert client.get(f"/admin/profiles/{name}", headers=token).status_code == 404
+    # One capture at a time
+    assert client.get("/admin/profile?seconds=0.3", headers=token).status_code == 409
+
+    deadline = time.monotonic() + 5
+    while name not in profiler.store_for(settings).list() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert client.get(f"/admin/profiles/{name}", headers=token).status_code == 200
+
+
+def test_admin_profile_rejects_bad_intervals(tmp_path, monkeypatch):
+    import admin
+
+    settings = replace(get_settings(), admin_token="secret", profile_dir=str(tmp_path))
+    monkeypatch.setattr(admin.auth, "get_settings", lambda: settings)
+    app = Flask(__name__)
+    app.register_blueprint(admin.bp, url_prefix="/admin")
+    client = app.test_client()
+    for query in ("interval=0", "interval=-1", "interval=nan", "seconds=-5"):
+        resp = client.get(f"/admin/profile?{query}", headers={"X-FamilyHub-Admin-Token": "secret"})
+        assert resp.status_code == 400, query
@@ -0,0 +1,85 @@
+"""Tests for the bounded thread-pool WSGI server."""
+
+import os
+import threading
+import time
+import urllib.request
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from runtime.serving import PooledWSGIServer, reset_engine_pools
+
+
+def slow_app(environ, start_response):
+    time.sleep(float(environ.get("QUERY_STRING") or 0))
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"ok"]
+
+
+def start(threads):
+    server = PooledWSGIServer("127.0.0.1", 0, slow_app, threads=threads)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def fetch(server, delay):
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/?{delay}", timeout=5) as resp:
+        return resp.read()
+
+
+def test_slow_request_does_not_block_others():
+    server, _ = start(threads=4)
+    try:
+        slow = threading.Thread(target=fetch, args=(server, 0.5))
+        slow.start()
+        time.sleep(0.05)
+        t0 = time.perf_counter()
+        assert fetch(server, 0) == b"ok"
+        assert time.perf_counter() - t0 < 0.4
+        slow.join()
+    finally:
+        server.shutdown()
+
+
+def test_drain_waits_for_in_flight_requests():
+    server, thread = start(threads=2)
+    results = []
+    client = threading.Thread(target=lambda: results.append(fetch(server, 0.3)))
+    client.start()
+    time.sleep(0.1)
+    server.shutdown()
+    thread.join()
+    assert server.drain(timeout=2)
+    client.join()
+    assert results == [b"ok"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork()")
+def test_worker_does_not_reuse_master_connections(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'fh.db'}"
+    db = SQLAlchemy()
+    db.init_app(app)
+    with app.app_context():
+        # The master used the pool before forking (startup tasks, warm-up)
+        with db.engine.connect() as conn:
+            conn.connection.info["opened_by"] = os.getpid()
+        pid = os.fork()
+        if pid == 0:  # gunicorn worker
+            code = 1
+            try:
+                reset_engine_pools(app)
+                with db.engine.connect() as conn:
+                    conn.exec_driver_sql("SELECT 1")
+                    code = 0 if "opened_by" not in conn.connection.info else 2
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        # The master's own connection is still open and usable
+        with db.engine.connect() as conn:
+            assert conn.connection.info["opened_by"] == os.getpid()
+            assert conn.exec_driver_sql("SELECT 1").scalar() == 1
@@ -0,0 +1,135 @@
+"""Tests for per-request SQL statement accounting and query budgets."""
+
+import logging
+from dataclasses import replace
+from datetime import date, timedelta
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from config import get_settings
+from db import db
+from models import ChoreMetadata, ChoreOccurrence
+from runtime import metrics, sql_audit
+
+
+def test_shape_folds_literals_and_parameter_lists():
+    assert sql_audit.shape("SELECT * FROM t WHERE id = 42 AND name = 'it''s'") == (
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    )
+    assert sql_audit.shape("SELECT *\n  FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+def _engine(**overrides):
+    settings = replace(get_settings(), **overrides)
+    engine = create_engine("sqlite:///:memory:", future=True)
+    sql_audit.install_engine(engine, settings)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+    return engine, settings
+
+
+def test_capture_counts_repeated_shapes():
+    engine, _ = _engine(slow_query_ms=0)
+    with sql_audit.capture() as stats:
+        with engine.connect() as conn:
+            for i in range(6):
+                conn.execute(text(f"SELECT name FROM t WHERE id = {i}"))
+            conn.execute(text("SELECT COUNT(*) FROM t"))
+    assert stats.count == 7
+    assert stats.connections == 1
+    assert stats.repeated(5) == [("SELECT name FROM t WHERE id = ?", 6)]
+
+
+def test_slow_query_logs_plan(caplog):
+    engine, _ = _engine(slow_query_ms=1e-6)
+    with caplog.at_level(logging.WARNING, logger="familyhub.sql"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT name FROM t WHERE name = :n"), {"n": "x"})
+    [record] = [r for r in caplog.records if "FROM t WHERE name" in r.getMessage()]
+    assert "plan: SCAN t" in record.getMessage()
+
+
+def test_flask_reports_repeated_statements(caplog):
+    engine, settings = _engine(slow_query_ms=0, sql_repeat_threshold=3)
+    app = Flask(__name__)
+
+    @app.route("/loop")
+    def loop():
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT name FROM t WHERE id = :i"), {"i": i})
+        return "ok"
+
+    sql_audit.install_flask(app, settings)
+    before = metrics.DB_REPEATED_QUERIES.value(endpoint="/loop")
+    with caplog.at_level(logging.WARNING, logger="familyhub.sql"):
+        app.test_client().get("/loop")
+    assert metrics.DB_REPEATED_QUERIES.value(endpoint="/loop") == before + 1
+    assert metrics.HTTP_REQUEST_DB_QUERIES.count(endpoint="/loop") >= 1
+    assert any("possible N+1 on GET /loop" in r.getMessage() for r in caplog.records)
+
+
+def test_fetch_chores_query_budget(query_budget):
+    from services.chores_service import fetch_chores
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    db.init_app(app)
+    with app.app_context():
+        sql_audit.install_engine(db.engine, replace(get_settings(), slow_query_ms=0))
+        db.create_all()
+        today = date.today()
+        for n in range(3):
+            db.session.add(ChoreMetadata(task_id=f"t{n}", title=f"Chore {n}", points=1))
+            for d in range(2):
+                db.session.add(ChoreOccurrence(task_id=f"t{n}", due_date=today + timedelta(days=d)))
+        db.session.commit()
+        db.session.expunge_all()
+
+        with query_budget(1, max_repeats=1):
+            chores = fetch_chores(include_archived=False)
+    assert len(chores) == 6
+
+
+def _seeded_kiosk_app(tmp_path, monkeypatch):
+    import app as app_module
+    import routes
+    from bootstrap.migrations import apply_pending
+    from kiosk import bp as kiosk_bp
+
+    monkeypatch.setattr(routes, "fetch_meals", lambda start=None, end=None: [])
+    app = Flask("app", root_path=app_module.app.root_path)
+    app.secret_key = "test"
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'kiosk.db'}"
+    app.jinja_env.globals["safe_url_for"] = app_module.safe_url_for
+    db.init_app(app)
+    app.register_blueprint(kiosk_bp, name="")
+    with app.app_context():
+        sql_audit.install_engine(db.engine, replace(get_settings(), slow_query_ms=0))
+        apply_pending(db.engine)
+        today = date.today()
+        for n in range(5):
+            db.session.add(ChoreMetadata(task_id=f"t{n}", title=f"Chore {n}", points=1))
+            for d in range(3):
+                db.session.add(ChoreOccurrence(task_id=f"t{n}", due_date=today + timedelta(days=d)))
+        db.session.commit()
+    return app.test_client()
+
+
+def test_index_route_query_budget(tmp_path, monkeypatch, query_budget):
+    client = _seeded_kiosk_app(tmp_path, monkeypatch)
+    # Chores plus the points leaderboard
+    with query_budget(2, max_repeats=1):
+        resp = client.get("/")
+    assert resp.status_code == 200
+    assert "Chore 0" in resp.get_data(as_text=True)
+
+
+def test_chores_route_query_budget(tmp_path, monkeypatch, query_budget):
+    client = _seeded_kiosk_app(tmp_path, monkeypatch)
+    with query_budget(1):
+        resp = client.get("/chores")
+    assert resp.status_code == 200
+    html = resp.get_data(as_text=True)
+    assert all(f"Chore {n}" in html for n in range(5))
@@ -0,0 +1,76 @@
+"""Tests for the dialect-aware insert helpers.
+
+Runs against SQLite always; set FAMILYHUB_TEST_POSTGRES_URL (e.g.
+``postgresql://postgres@localhost/familyhub_test``) to also run the points
+service against a real PostgreSQL.
+"""
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from bootstrap.migrations import apply_pending
+from services import points_service as ps
+from sql_compat import insert_ignore, insert_ignore_stmt, upsert_stmt
+
+PG_URL = os.getenv("FAMILYHUB_TEST_POSTGRES_URL")
+
+
+def test_statements_compile_per_dialect():
+    values = {"user_name": "a", "task_id": "t", "points": 1, "kind": "earn"}
+    pg = str(insert_ignore_stmt("postgresql", "points_ledger", values).compile(dialect=postgresql.dialect()))
+    lite = str(insert_ignore_stmt("sqlite", "points_ledger", values).compile(dialect=sqlite.dialect()))
+    assert "ON CONFLICT DO NOTHING" in pg and "ON CONFLICT DO NOTHING" in lite
+    up = str(
+        upsert_stmt("postgresql", "chore_metadata", {"task_id": "t", "points": 3}, index_elements=["task_id"])
+        .compile(dialect=postgresql.dialect())
+    )
+    assert "ON CONFLICT (task_id) DO UPDATE SET points = excluded.points" in up
+
+
+def test_insert_ignore_reports_inserted_rows():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (k TEXT PRIMARY KEY, v INTEGER)")
+        assert insert_ignore(conn, "t", {"k": "a", "v": 1}) == 1
+        assert insert_ignore(conn, "t", [{"k": "a", "v": 2}, {"k": "b", "v": 3}]) == 1
+        assert conn.execute(text("SELECT v FROM t WHERE k='a'")).scalar() == 1
+
+
+def test_occurrence_earn_is_ignored_on_migrated_schema(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fh.db'}", future=True)
+    apply_pending(engine)
+    row = {"task_id": "t1", "points": 1, "kind": "earn", "occurrence_key": "t1:2024-01-01"}
+    with engine.begin() as conn:
+        assert insert_ignore(conn, "points_ledger", dict(row, user_name="alice")) == 1
+        assert insert_ignore(conn, "points_ledger", dict(row, user_name="bob")) == 0
+
+
+@pytest.mark.skipif(not PG_URL, reason="FAMILYHUB_TEST_POSTGRES_URL not set")
+def test_points_service_on_postgres():
+    # A throwaway schema keeps the test away from whatever lives in public
+    schema = f"test_{uuid.uuid4().hex}"
+    admin = create_engine(PG_URL, future=True)
+    with admin.begin() as conn:
+        conn.exec_driver_sql(f'CREATE SCHEMA "{schema}"')
+    engine = create_engine(PG_URL, future=True, connect_args={"options": f"-csearch_path={schema}"})
+    try:
+        apply_pending(engine)
+        with engine.begin() as conn:
+            ps.grant_points_for_completion(conn, user="alice", task_id="t1", points=5)
+            ps.grant_points_for_completion(conn, user="alice", task_id="t1", points=5)
+            assert ps.user_balance(conn, "alice") == 5
+            ps.set_chore_points(conn, "t1", 3)
+            ps.set_chore_points(conn, "t1", 7)
+            assert ps.get_chore_points(conn, "t1") == 7
+            reward_id = conn.execute(text("SELECT id FROM rewards WHERE cost_points=5")).scalar()
+            ps.redeem(conn, user="alice", reward_id=reward_id)
+            assert ps.user_balance(conn, "alice") == 0
+    finally:
+        engine.dispose()
+        with admin.begin() as conn:
+            conn.exec_driver_sql(f'DROP SCHEMA "{schema}" CASCADE')
+        admin.dispose()
@@ -0,0 +1,58 @@
+"""Tests for the stack-dumping stall detector."""
+
+import threading
+import time
+
+from runtime.inflight import InflightTracker
+from runtime.stall_detector import StallDetector
+
+
+def _wedged_handler(release):
+    release.wait(5)
+
+
+def test_dumps_stack_of_stalled_request(tmp_path):
+    tracker = InflightTracker()
+    release = threading.Event()
+    log_path = tmp_path / "stalls.log"
+
+    def handle():
+        req = tracker.begin("GET", "/chores")
+        try:
+            _wedged_handler(release)
+        finally:
+            tracker.end(req)
+
+    worker = threading.Thread(target=handle, name="http-worker")
+    bystander = threading.Thread(target=release.wait, args=(5,), name="bystander")
+    worker.start()
+    bystander.start()
+    detector = StallDetector(tracker, str(log_path), threshold=0.1, samples_per_request=2, max_dumps_per_minute=10)
+    try:
+        assert detector.check_once() == 0
+        time.sleep(0.2)
+        assert detector.check_once() == 1
+        assert detector.check_once() == 1
+        assert detector.check_once() == 0  # per-request sample cap
+    finally:
+        release.set()
+        worker.join(5)
+        bystander.join(5)
+
+    text = log_path.read_text()
+    assert "stall: GET /chores" in text
+    assert "thread http-worker" in text
+    assert "_wedged_handler" in text
+    assert "sample 2/2" in text
+    assert text.count("-- thread bystander") == 1  # only the first sample dumps every thread
+
+
+def test_dumps_are_rate_limited(tmp_path):
+    tracker = InflightTracker()
+    for _ in range(5):
+        req = tracker.begin("GET", "/")
+        object.__setattr__(req, "started", req.started - 10)
+        tracker._inflight[req.id] = req
+    detector = StallDetector(tracker, str(tmp_path / "s.log"), threshold=1, max_dumps_per_minute=3)
+    assert detector.check_once() == 3
+    assert detector.check_once() == 0
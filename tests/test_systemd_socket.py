@@ -0,0 +1,44 @@
+"""Tests for systemd socket activation support."""
+
+import os
+import socket
+import threading
+import urllib.request
+
+from runtime import systemd_socket
+from runtime.serving import PooledWSGIServer
+
+
+def test_listen_fds_requires_matching_pid(monkeypatch):
+    monkeypatch.setenv("LISTEN_PID", str(os.getpid() + 1))
+    monkeypatch.setenv("LISTEN_FDS", "1")
+    assert systemd_socket.listen_fds() == []
+    assert "LISTEN_FDS" not in os.environ
+
+
+def test_listen_fds_returns_descriptors_and_unsets_env(monkeypatch):
+    monkeypatch.setattr(systemd_socket.os, "set_inheritable", lambda fd, flag: None)
+    monkeypatch.setenv("LISTEN_PID", str(os.getpid()))
+    monkeypatch.setenv("LISTEN_FDS", "2")
+    assert systemd_socket.listen_fds() == [3, 4]
+    assert "LISTEN_PID" not in os.environ
+
+
+def test_server_accepts_on_inherited_socket():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(8)
+    port = listener.getsockname()[1]
+
+    def app(environ, start_response):
+        start_response("200 OK", [])
+        return [b"inherited"]
+
+    server = PooledWSGIServer("127.0.0.1", port, app, threads=2, fd=listener.fileno())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as resp:
+            assert resp.read() == b"inherited"
+    finally:
+        server.shutdown()
+        listener.close()
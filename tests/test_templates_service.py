@@ -0,0 +1,122 @@
+"""Tests for the bulk chore template import."""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from bootstrap.migrations import apply_pending
+from services.templates_service import BATCH_SIZE, import_templates, normalize, parse_catalog
+
+
+@pytest.fixture
+def engine(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'tmpl.db'}", future=True)
+    apply_pending(eng)
+    yield eng
+    eng.dispose()
+
+
+def _rows(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT name, category, is_active FROM chore_templates ORDER BY name")).fetchall()
+
+
+def test_import_reports_inserted_updated_unchanged(engine):
+    csv_data = "name,category,is_active\nFeed the dog,Pet Care,1\nWater plants,Outdoor,\n"
+    with engine.begin() as conn:
+        first = import_templates(conn, parse_catalog(csv_data, "csv"))
+    assert first.as_dict() == {"inserted": 2, "updated": 0, "unchanged": 0}
+
+    json_data = (
+        '[{"name": "Feed the dog", "category": "Pet Care", "is_active": false},'
+        ' ["Water plants", "Outdoor"], ["Walk the dog", "Pet Care"]]'
+    )
+    with engine.begin() as conn:
+        preview = import_templates(conn, parse_catalog(json_data, "json"), dry_run=True)
+    assert preview.as_dict() == {"inserted": 1, "updated": 1, "unchanged": 1}
+    assert len(_rows(engine)) == 2
+
+    with engine.begin() as conn:
+        second = import_templates(conn, parse_catalog(json_data, "json"))
+    assert second.as_dict() == preview.as_dict()
+    assert [tuple(r) for r in _rows(engine)] == [
+        ("Feed the dog", "Pet Care", 0),
+        ("Walk the dog", "Pet Care", 1),
+        ("Water plants", "Outdoor", 1),
+    ]
+    with engine.begin() as conn:
+        again = import_templates(conn, parse_catalog(json_data, "json"))
+    assert again.as_dict() == {"inserted": 0, "updated": 0, "unchanged": 3}
+
+
+def test_import_batches_large_catalogs(engine):
+    rows = [{"name": f"Chore {n}", "category": f"Room {n % 7}"} for n in range(BATCH_SIZE * 2 + 3)]
+    with engine.begin() as conn:
+        assert import_templates(conn, rows).inserted == len(rows)
+    with engine.begin() as conn:
+        assert import_templates(conn, rows).unchanged == len(rows)
+    assert len(_rows(engine)) == len(rows)
+
+
+def test_normalize_validates_and_keeps_last_duplicate():
+    rows = normalize(
+        [
+            {"name": " Sweep ", "category": "Kitchen", "is_active": "yes"},
+            {"name": "Sweep", "category": "Kitchen", "is_active": "no"},
+        ]
+    )
+    assert rows == [{"name": "Sweep", "category": "Kitchen", "is_active": False}]
+    with pytest.raises(ValueError, match="row 2"):
+        normalize([{"name": "a", "category": "b"}, {"name": "", "category": "b"}])
+    with pytest.raises(ValueError, match="is_active"):
+        normalize([{"name": "a", "category": "b", "is_active": "maybe"}])
+    with pytest.raises(ValueError, match="header"):
+        parse_catalog("title,room\nx,y\n", "csv")
+
+
+def test_unique_migration_removes_duplicates(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'dup.db'}", future=True)
+    with eng.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE chore_templates (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(120) NOT NULL,"
+            " category VARCHAR(50) NOT NULL, is_active BOOLEAN DEFAULT 1)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO chore_templates(name, category) VALUES ('Sweep','Kitchen'), ('Sweep','Kitchen'), ('Mop','Kitchen')"
+        )
+    apply_pending(eng)
+    assert [tuple(r) for r in _rows(eng)] == [("Mop", "Kitchen", 1), ("Sweep", "Kitchen", 1)]
+    eng.dispose()
+
+
+def test_admin_import_parses_dry_run_and_caps_body(tmp_path, monkeypatch):
+    from dataclasses import replace
+
+    from flask import Flask
+
+    import admin
+    import admin.auth
+    from config import get_settings
+    from db import db
+
+    settings = replace(get_settings(), admin_token="secret")
+    monkeypatch.setattr(admin.auth, "get_settings", lambda: settings)
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'admin.db'}"
+    db.init_app(app)
+    app.register_blueprint(admin.bp, url_prefix="/admin")
+    with app.app_context():
+        apply_pending(db.engine)
+    client = app.test_client()
+    headers = {"X-FamilyHub-Admin-Token": "secret", "Content-Type": "text/csv"}
+    body = "name,category\nDishes,Kitchen\n"
+
+    resp = client.post("/admin/templates/import?dry_run=false", data=body, headers=headers)
+    assert resp.status_code == 200 and resp.get_json()["inserted"] == 1
+    resp = client.post("/admin/templates/import?dry_run=1", data="name,category\nMop,Kitchen\n", headers=headers)
+    assert resp.get_json()["inserted"] == 1
+    with app.app_context():
+        assert [r.name for r in _rows(db.engine)] == ["Dishes"]
+    assert client.post("/admin/templates/import?dry_run=maybe", data=body, headers=headers).status_code == 400
+
+    monkeypatch.setattr(admin, "MAX_IMPORT_BYTES", 16)
+    assert client.post("/admin/templates/import", data=body, headers=headers).status_code == 413
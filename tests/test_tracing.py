@@ -0,0 +1,65 @@
+"""Tests for request tracing spans."""
+
+import json
+from dataclasses import replace
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from config import get_settings
+from runtime import tracing
+from runtime.tracing import span
+
+
+@span("inner")
+def _inner():
+    return 42
+
+
+def test_spans_are_noops_outside_a_trace():
+    with span("alone") as current:
+        assert current is None
+    assert _inner() == 42
+
+
+def test_nested_spans_build_a_tree():
+    token = tracing.start_trace("GET /")
+    with span("fetch", n=1):
+        _inner()
+        _inner()
+    with span("render"):
+        pass
+    root = tracing.finish_trace(token)
+    tree = root.to_dict()
+    assert [c["name"] for c in tree["children"]] == ["fetch", "render"]
+    assert tree["children"][0]["attrs"] == {"n": 1}
+    assert [c["name"] for c in tree["children"][0]["children"]] == ["inner", "inner"]
+    header = tracing.server_timing(root)
+    assert header.startswith("fetch;dur=") and "render;dur=" in header and "total;dur=" in header
+
+
+def test_flask_writes_jsonl_and_server_timing(tmp_path):
+    settings = replace(
+        get_settings(), tracing=True, server_timing=True, trace_log_path=str(tmp_path / "traces.jsonl")
+    )
+    engine = create_engine("sqlite:///:memory:", future=True)
+    tracing.install_engine(engine)
+    app = Flask(__name__)
+
+    @app.route("/")
+    def index():
+        with span("query"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        return "ok"
+
+    tracing.install_flask(app, settings)
+    resp = app.test_client().get("/")
+    assert "query;dur=" in resp.headers["Server-Timing"]
+
+    [line] = (tmp_path / "traces.jsonl").read_text().splitlines()
+    trace = json.loads(line)
+    assert trace["name"] == "GET /" and trace["endpoint"] == "/"
+    [query] = trace["children"]
+    assert query["children"][0]["name"] == "db"
+    assert query["children"][0]["attrs"]["sql"] == "SELECT 1"
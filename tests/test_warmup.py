@@ -0,0 +1,61 @@
+"""Tests for the warm-up stage and its effect on /readyz."""
+
+import json
+import threading
+
+import app_health
+import services.calendar_service as cal
+from runtime import warmup
+
+
+def test_stage_runs_tasks_in_parallel_and_records_failures():
+    barrier = threading.Barrier(2, timeout=2)
+
+    def boom():
+        raise ValueError("no network")
+
+    stage = warmup.WarmupStage({"a": barrier.wait, "b": barrier.wait, "c": boom}, threads=3)
+    assert stage.state == warmup.PENDING
+    stage.run()
+
+    snap = stage.snapshot()
+    assert stage.ready and snap["state"] == "ready"
+    assert snap["tasks"]["a"]["ok"] and snap["tasks"]["b"]["ok"]
+    assert snap["tasks"]["c"] == {"ok": False, "error": "no network", "ms": snap["tasks"]["c"]["ms"]}
+
+
+def test_readyz_reports_warming_until_stage_finishes(monkeypatch):
+    release = threading.Event()
+    stage = warmup.WarmupStage({"slow": lambda: release.wait(2)})
+    monkeypatch.setattr(warmup, "_stage", stage)
+    monkeypatch.setattr(app_health, "current_stage", warmup.current_stage)
+    monkeypatch.setattr(app_health, "_json_response", lambda *args: ('{"status": "ok"}', 200))
+    monkeypatch.setattr(app_health, "_get_monitor", lambda host, port: None)
+
+    stage.start()
+    body, code = app_health._readiness_response("127.0.0.1", 8000)
+    assert code == 503
+    assert json.loads(body)["status"] == "warming"
+
+    release.set()
+    assert stage.wait(2)
+    body, code = app_health._readiness_response("127.0.0.1", 8000)
+    assert code == 200
+
+
+def test_get_meals_caches_successful_results(monkeypatch, tmp_path):
+    creds = tmp_path / "creds.json"
+    creds.write_text("{}")
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds))
+    monkeypatch.setenv("FAMILYHUB_CALENDAR_ID", "cal")
+    cal.clear_cache()
+    day = cal.dt.datetime.now(cal.zoneinfo.ZoneInfo("America/Chicago")).date().isoformat()
+    cal._cache[("cal", 7, day)] = (cal.time.monotonic() + 60, {day: ["Tacos"]})
+    try:
+        monkeypatch.setenv("FAMILYHUB_TZ", "America/Chicago")
+        meals = cal.get_meals()
+        assert meals == {day: ["Tacos"]}
+        meals[day].append("mutated")
+        assert cal.get_meals() == {day: ["Tacos"]}
+    finally:
+        cal.clear_cache()
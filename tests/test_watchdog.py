@@ -0,0 +1,88 @@
+"""Tests for in-flight tracking and the request-aware systemd watchdog."""
+
+import threading
+import time
+
+from flask import Flask
+
+from runtime import sdnotify_heartbeat
+from runtime.inflight import InflightTracker
+from runtime.watchdog import WatchdogGuard
+
+
+def _app(tracker, release=None):
+    app = Flask(__name__)
+
+    @app.route("/healthz")
+    def healthz():
+        return "ok"
+
+    @app.route("/slow")
+    def slow():
+        release.wait(5)
+        return "done"
+
+    app.wsgi_app = tracker.middleware(app.wsgi_app)
+    return app
+
+
+def test_tracker_records_inflight_and_latency():
+    tracker = InflightTracker()
+    release = threading.Event()
+    app = _app(tracker, release)
+    worker = threading.Thread(target=lambda: app.test_client().get("/slow", buffered=True))
+    worker.start()
+    time.sleep(0.2)
+    [req] = tracker.inflight()
+    assert req.path == "/slow" and req.thread_id == worker.ident
+    assert tracker.oldest_age() >= 0.15
+
+    release.set()
+    worker.join(5)
+    assert tracker.inflight() == []
+    assert tracker.p99() >= 0.15
+
+
+def test_guard_fails_on_stuck_request_and_recovers():
+    tracker = InflightTracker()
+    release = threading.Event()
+    app = _app(tracker, release)
+    guard = WatchdogGuard(app, tracker, stall_seconds=0.2, probe_interval=0.1, p99_window=0.3)
+    guard.probe()
+    assert guard.check() == (True, "ok")
+    assert guard.last_probe_status == 200
+
+    worker = threading.Thread(target=lambda: app.test_client().get("/slow", buffered=True))
+    worker.start()
+    time.sleep(0.35)
+    ok, reason = guard.check()
+    assert not ok and "in-flight" in reason
+
+    release.set()
+    worker.join(5)
+    ok, reason = guard.check()
+    assert not ok and "p99" in reason
+    time.sleep(0.35)
+    guard.probe()
+    assert guard.check() == (True, "ok")
+
+
+class _FakeNotifier:
+    def __init__(self):
+        self.sent = []
+
+    def notify(self, msg):
+        self.sent.append(msg)
+
+
+def test_heartbeat_stops_petting_and_triggers_once():
+    state = {"ok": True}
+    hb = sdnotify_heartbeat.SdNotifyHeartbeat(lambda: (state["ok"], "stuck"), action="trigger")
+    hb._notifier = _FakeNotifier()
+    assert hb.beat()
+    state["ok"] = False
+    assert not hb.beat()
+    assert not hb.beat()
+    state["ok"] = True
+    assert hb.beat()
+    assert hb._notifier.sent == ["WATCHDOG=1", "WATCHDOG=trigger", "WATCHDOG=1"]